@@ -73,7 +73,7 @@ class CDPSession:
             message["params"] = params
 
         # Create a future for the response
-        future: asyncio.Future[Any] = asyncio.get_event_loop().create_future()
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
         self._pending[msg_id] = future
 
         try:
@@ -125,7 +125,7 @@ class CDPSession:
                         try:
                             await handler(params)
                         except Exception as e:
-                            logger.warning(f"Event handler error for {event}: {e}")
+                            logger.warning("Event handler error for %s: %s", event, e)
 
         except websockets.exceptions.ConnectionClosed:
             logger.debug("WebSocket connection closed")
@@ -340,7 +340,7 @@ async def navigate(session: CDPSession, url: str, wait_until: str = "load") -> d
     await session.send("Page.enable")
 
     # Create a future to wait for the load event
-    load_future: asyncio.Future[None] = asyncio.get_event_loop().create_future()
+    load_future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
 
     event_name = "Page.loadEventFired" if wait_until == "load" else "Page.domContentEventFired"
 
@@ -357,7 +357,7 @@ async def navigate(session: CDPSession, url: str, wait_until: str = "load") -> d
     try:
         await asyncio.wait_for(load_future, timeout=30.0)
     except asyncio.TimeoutError:
-        logger.warning(f"Timeout waiting for {wait_until} event")
+        logger.warning("Timeout waiting for %s event", wait_until)
 
     return result
 
@@ -410,7 +410,7 @@ async def get_document_html(session: CDPSession) -> str:
     Returns:
         HTML content as string.
     """
-    result = await session.send("DOM.getDocument", {"depth": -1, "pierce": True})
+    result = await session.send("DOM.getDocument", {"depth": 0})
     root_node_id = result["root"]["nodeId"]
     html_result = await session.send("DOM.getOuterHTML", {"nodeId": root_node_id})
     return html_result["outerHTML"]
@@ -6,15 +6,23 @@ all HTTP and WebSocket CDP requests through PowerShell on Windows.
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import binascii
 import json
 import logging
+import subprocess
+import time
 from typing import Any
 
+from .persistent_cdp import CDPError
+from .ps_relay import PowerShellCDPRelay
 from .wsl import is_wsl, run_windows_command
 
 logger = logging.getLogger(__name__)
 
+# Seconds to stay on one-shot commands after a relay fails to connect
+_RELAY_RETRY_BACKOFF = 60.0
+
 
 class CDPProxyClient:
     """CDP client that proxies requests through PowerShell for WSL compatibility."""
@@ -27,12 +35,67 @@ class CDPProxyClient:
         """
         self.port = port
         self._ws_messages: dict[str, list[str]] = {}
+        # One long-lived relay WebSocket per target URL
+        self._relays: dict[str, PowerShellCDPRelay] = {}
+        self._relay_lock = asyncio.Lock()
+        # Monotonic time before which a failed relay connect is not retried
+        self._relay_retry_at = 0.0
+        # (monotonic time fetched, targets) from the last /json/list
+        self._targets_cache: tuple[float, list[dict[str, Any]]] | None = None
+
+    async def _get_relay(self, ws_url: str) -> PowerShellCDPRelay | None:
+        """Return a connected relay for ws_url, opening it on first use.
+
+        Returns None when relays can't be started here, in which case callers
+        fall back to a one-shot PowerShell WebSocket per command. After a
+        failed connect, relays are retried once _RELAY_RETRY_BACKOFF has passed.
+        """
+        relay = self._relays.get(ws_url)
+        if relay is not None and relay.is_connected:
+            return relay
+        if time.monotonic() < self._relay_retry_at:
+            return None
+
+        async with self._relay_lock:
+            relay = self._relays.get(ws_url)
+            if relay is not None and relay.is_connected:
+                return relay
+            if time.monotonic() < self._relay_retry_at:
+                return None
+
+            relay = PowerShellCDPRelay(ws_url)
+            try:
+                await relay.connect()
+            except Exception as e:
+                logger.warning("Persistent proxy relay unavailable, using one-shot commands: %s", e)
+                self._relay_retry_at = time.monotonic() + _RELAY_RETRY_BACKOFF
+                return None
+            self._relays[ws_url] = relay
+            return relay
+
+    async def _drop_relay(self, ws_url: str) -> None:
+        """Forget and disconnect the relay for ws_url."""
+        relay = self._relays.pop(ws_url, None)
+        if relay is not None:
+            await relay.disconnect()
+
+    async def close(self) -> None:
+        """Disconnect every relay WebSocket held by this client."""
+        relays, self._relays = self._relays, {}
+        self._relay_retry_at = 0.0
+        for relay in relays.values():
+            try:
+                await relay.disconnect()
+            except Exception as e:
+                logger.debug("Error closing proxy relay %s: %s", relay.ws_url, e)
 
     def _make_http_request(
         self, path: str, method: str = "GET"
     ) -> dict[str, Any] | list[Any] | None:
         """Make an HTTP request to Chrome via PowerShell.
 
+        Blocking: spawns powershell.exe, so async callers run it in a thread.
+
         Args:
             path: URL path (e.g., "/json/version")
             method: HTTP method
@@ -56,13 +119,13 @@ class CDPProxyClient:
             if result.returncode == 0 and result.stdout.strip():
                 return json.loads(result.stdout.strip(), strict=False)
         except Exception as e:
-            logger.error(f"HTTP request failed: {e}")
+            logger.error("HTTP request failed: %s", e)
 
         return None
 
     async def get_version(self) -> dict[str, Any] | None:
         """Get Chrome version info."""
-        result = self._make_http_request("/json/version")
+        result = await asyncio.to_thread(self._make_http_request, "/json/version")
         return result if isinstance(result, dict) else None
 
     async def get_browser_ws_url(self) -> str | None:
@@ -76,19 +139,35 @@ class CDPProxyClient:
             return version.get("webSocketDebuggerUrl")
         return None
 
-    async def list_targets(self) -> list[dict[str, Any]]:
-        """List available debugging targets."""
-        result = self._make_http_request("/json/list")
-        return result if isinstance(result, list) else []
+    async def list_targets(self, max_age: float = 0.0) -> list[dict[str, Any]]:
+        """List available debugging targets.
+
+        Args:
+            max_age: Reuse the previous listing if it was fetched at most this
+                many seconds ago. Each fetch spawns a PowerShell process, so
+                callers that just listed targets can skip a second one.
+        """
+        cached = self._targets_cache
+        started = time.monotonic()
+        if cached is not None and started - cached[0] <= max_age:
+            return cached[1]
+
+        result = await asyncio.to_thread(self._make_http_request, "/json/list")
+        if not isinstance(result, list):
+            return []
+        self._targets_cache = (started, result)
+        return result
 
     async def new_page(self, url: str = "about:blank") -> dict[str, Any] | None:
         """Create a new page."""
-        result = self._make_http_request(f"/json/new?{url}", method="PUT")
+        self._targets_cache = None
+        result = await asyncio.to_thread(self._make_http_request, f"/json/new?{url}", "PUT")
         return result if isinstance(result, dict) else None
 
     async def close_page(self, target_id: str) -> bool:
         """Close a page."""
-        result = self._make_http_request(f"/json/close/{target_id}")
+        self._targets_cache = None
+        result = await asyncio.to_thread(self._make_http_request, f"/json/close/{target_id}")
         return result is not None
 
     async def send_cdp_command(
@@ -100,6 +179,9 @@ class CDPProxyClient:
     ) -> dict[str, Any]:
         """Send a CDP command via WebSocket through PowerShell.
 
+        Commands to the same ws_url share one long-lived relay WebSocket;
+        without a relay each command runs its own PowerShell WebSocket.
+
         Args:
             ws_url: WebSocket URL for the target
             method: CDP method name
@@ -109,6 +191,16 @@ class CDPProxyClient:
         Returns:
             CDP response result
         """
+        relay = await self._get_relay(ws_url)
+        if relay is not None:
+            try:
+                return await relay.send(method, params, timeout=timeout)
+            except CDPError as e:
+                raise RuntimeError(f"CDP error: {e}") from e
+            except ConnectionError:
+                await self._drop_relay(ws_url)
+                raise
+
         # Build the CDP message
         message = {"id": 1, "method": method}
         if params:
@@ -160,14 +252,125 @@ class CDPProxyClient:
                     raise RuntimeError(f"CDP error: {response['error']}")
                 return response.get("result", {})
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse CDP response: {e}")
+            logger.error("Failed to parse CDP response: %s", e)
             stdout_preview = result.stdout[:200] if result and result.stdout else "empty"
             raise RuntimeError(f"Invalid CDP response: {stdout_preview}") from e
         except Exception as e:
-            logger.error(f"CDP command failed: {e}")
+            logger.error("CDP command failed: %s", e)
             raise
 
-        raise RuntimeError("CDP command failed with no response")
+        raise ConnectionError("CDP command failed with no response")
+
+    async def send_cdp_batch(
+        self,
+        ws_url: str,
+        commands: list[tuple[str, dict[str, Any] | None]],
+        timeout: float = 30.0,
+    ) -> list[dict[str, Any]]:
+        """Send several CDP commands over one WebSocket through PowerShell.
+
+        All commands are written back-to-back with sequential ids before any
+        response is read, so the batch costs a single PowerShell launch and
+        WebSocket handshake instead of one per command.
+
+        Args:
+            ws_url: WebSocket URL for the target
+            commands: (method, params) pairs, executed in order
+            timeout: Timeout for the whole batch
+
+        Returns:
+            CDP response results, in the same order as ``commands``.
+        """
+        if not commands:
+            return []
+
+        relay = await self._get_relay(ws_url)
+        if relay is not None:
+            try:
+                return list(
+                    await asyncio.gather(
+                        *(
+                            relay.send(method, params, timeout=timeout)
+                            for method, params in commands
+                        )
+                    )
+                )
+            except CDPError as e:
+                raise RuntimeError(f"CDP error: {e}") from e
+            except ConnectionError:
+                await self._drop_relay(ws_url)
+                raise
+
+        frames = []
+        for msg_id, (method, params) in enumerate(commands, start=1):
+            message: dict[str, Any] = {"id": msg_id, "method": method}
+            if params:
+                message["params"] = params
+            frames.append('"' + json.dumps(message).replace('"', '`"') + '"')
+
+        # Responses are printed one per line; CDP puts "id" first in replies,
+        # which tells them apart from interleaved event notifications.
+        ps_script = f"""
+        $ws = New-Object System.Net.WebSockets.ClientWebSocket
+        $uri = [System.Uri]::new("{ws_url}")
+        $ct = [System.Threading.CancellationToken]::None
+
+        try {{
+            $null = $ws.ConnectAsync($uri, $ct).GetAwaiter().GetResult()
+
+            $messages = @({", ".join(frames)})
+            $msgType = [System.Net.WebSockets.WebSocketMessageType]::Text
+            foreach ($message in $messages) {{
+                $bytes = [System.Text.Encoding]::UTF8.GetBytes($message)
+                $segment = [System.ArraySegment[byte]]::new($bytes)
+                $null = $ws.SendAsync($segment, $msgType, $true, $ct).GetAwaiter().GetResult()
+            }}
+
+            $buffer = New-Object byte[] 65536
+            $remaining = $messages.Count
+            while ($remaining -gt 0) {{
+                $result = ""
+                do {{
+                    $segment = [System.ArraySegment[byte]]::new($buffer)
+                    $received = $ws.ReceiveAsync($segment, $ct).GetAwaiter().GetResult()
+                    $result += [System.Text.Encoding]::UTF8.GetString($buffer, 0, $received.Count)
+                }} while (-not $received.EndOfMessage)
+
+                if ($result.StartsWith('{{"id":')) {{
+                    Write-Output $result
+                    $remaining--
+                }}
+            }}
+        }} finally {{
+            if ($ws.State -eq [System.Net.WebSockets.WebSocketState]::Open) {{
+                $closeStatus = [System.Net.WebSockets.WebSocketCloseStatus]::NormalClosure
+                $null = $ws.CloseAsync($closeStatus, "", $ct).GetAwaiter().GetResult()
+            }}
+            $ws.Dispose()
+        }}
+        """
+
+        result = run_windows_command(ps_script, timeout=timeout + 5)
+        responses: dict[int, dict[str, Any]] = {}
+        for line in result.stdout.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise RuntimeError(f"Invalid CDP response: {line[:200]}") from e
+            responses[response.get("id", 0)] = response
+
+        results: list[dict[str, Any]] = []
+        for msg_id in range(1, len(commands) + 1):
+            response = responses.get(msg_id)
+            if response is None:
+                raise ConnectionError(f"CDP batch got no response for command {msg_id}")
+            if "error" in response:
+                raise RuntimeError(f"CDP error: {response['error']}")
+            results.append(response.get("result", {}))
+        return results
 
     async def navigate(self, ws_url: str, url: str) -> dict[str, Any]:
         """Navigate to a URL."""
@@ -176,6 +379,17 @@ class CDPProxyClient:
 
     async def screenshot(self, ws_url: str, format: str = "png", full_page: bool = False) -> bytes:
         """Take a screenshot."""
+        data = await self.screenshot_base64(ws_url, format, full_page)
+        return binascii.a2b_base64(data)
+
+    async def screenshot_base64(
+        self, ws_url: str, format: str = "png", full_page: bool = False
+    ) -> str:
+        """Take a screenshot and return CDP's base64 payload without decoding it.
+
+        MCP image content is base64 too, so callers that only forward the
+        image avoid a decode/encode round-trip over a multi-MB buffer.
+        """
         params: dict[str, Any] = {"format": format}
 
         if full_page:
@@ -191,7 +405,8 @@ class CDPProxyClient:
             params["captureBeyondViewport"] = True
 
         result = await self.send_cdp_command(ws_url, "Page.captureScreenshot", params)
-        return base64.b64decode(result["data"])
+        data: str = result["data"]
+        return data
 
     async def evaluate(self, ws_url: str, expression: str) -> Any:
         """Evaluate JavaScript."""
@@ -207,7 +422,7 @@ class CDPProxyClient:
     async def get_html(self, ws_url: str) -> str:
         """Get page HTML."""
         await self.send_cdp_command(ws_url, "DOM.enable")
-        doc = await self.send_cdp_command(ws_url, "DOM.getDocument", {"depth": -1})
+        doc = await self.send_cdp_command(ws_url, "DOM.getDocument", {"depth": 0})
         root_id = doc["root"]["nodeId"]
         result = await self.send_cdp_command(ws_url, "DOM.getOuterHTML", {"nodeId": root_id})
         return result["outerHTML"]
@@ -219,8 +434,6 @@ def should_use_proxy() -> bool:
         return False
 
     # Test if we can reach localhost:9222 directly
-    import subprocess
-
     try:
         result = subprocess.run(
             ["curl", "-s", "--connect-timeout", "1", "http://localhost:9222/json/version"],
@@ -60,7 +60,7 @@ class ChromeInstance:
         if not self._managed or not self._process_id:
             return
 
-        logger.info(f"Closing managed Chrome instance (PID: {self._process_id})")
+        logger.info("Closing managed Chrome instance (PID: %s)", self._process_id)
 
         if is_wsl():
             try:
@@ -69,7 +69,7 @@ class ChromeInstance:
                     timeout=5.0,
                 )
             except Exception as e:
-                logger.warning(f"Failed to close Chrome: {e}")
+                logger.warning("Failed to close Chrome: %s", e)
         else:
             with contextlib.suppress(ProcessLookupError, PermissionError):
                 os.kill(self._process_id, 15)  # SIGTERM
@@ -128,7 +128,7 @@ class ChromeLauncher:
         for host in candidate_hosts:
             instance = await self._try_connect_existing(host)
             if instance:
-                logger.info(f"Connected to existing Chrome at {instance.debugger_url}")
+                logger.info("Connected to existing Chrome at %s", instance.debugger_url)
                 self._instance = instance
                 return instance
 
@@ -225,7 +225,7 @@ class ChromeLauncher:
         Write-Output $chrome.Id
         '''
 
-        logger.debug(f"Launching Chrome with: {ps_command}")
+        logger.debug("Launching Chrome with: %s", ps_command)
 
         try:
             result = run_windows_command(ps_command, timeout=10.0)
@@ -233,7 +233,7 @@ class ChromeLauncher:
                 raise RuntimeError(f"Failed to launch Chrome: {result.stderr}")
 
             pid = int(result.stdout.strip())
-            logger.info(f"Chrome launched with PID: {pid}")
+            logger.info("Chrome launched with PID: %s", pid)
 
         except (ValueError, subprocess.TimeoutExpired) as e:
             raise RuntimeError(f"Failed to launch Chrome: {e}") from e
@@ -287,7 +287,7 @@ class ChromeLauncher:
             stderr=subprocess.DEVNULL,
         )
 
-        logger.info(f"Chrome launched with PID: {process.pid}")
+        logger.info("Chrome launched with PID: %s", process.pid)
 
         instance = await self._wait_for_chrome(candidate_hosts, process.pid)
         return instance
@@ -332,9 +332,10 @@ class ChromeLauncher:
         Raises:
             RuntimeError: If Chrome doesn't start within timeout.
         """
-        deadline = asyncio.get_event_loop().time() + CHROME_STARTUP_TIMEOUT
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + CHROME_STARTUP_TIMEOUT
 
-        while asyncio.get_event_loop().time() < deadline:
+        while loop.time() < deadline:
             # Try all candidate hosts on each iteration
             for host in candidate_hosts:
                 instance = await self._try_connect_existing(host)
@@ -366,14 +367,14 @@ class ChromeLauncher:
                 )
                 run_windows_command(cleanup_cmd, timeout=10.0)
             except Exception as e:
-                logger.warning(f"Failed to cleanup temp directory: {e}")
+                logger.warning("Failed to cleanup temp directory: %s", e)
             self._windows_temp_dir = None
 
         if self._native_temp_dir:
             try:
                 self._native_temp_dir.cleanup()
             except Exception as e:
-                logger.warning(f"Failed to cleanup temp directory: {e}")
+                logger.warning("Failed to cleanup temp directory: %s", e)
             self._native_temp_dir = None
 
     @property
@@ -12,23 +12,64 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import json
 import logging
 import re
+import shutil
 import socket
+from collections import deque
+from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
+from urllib.parse import urlsplit
 
 from .cdp_proxy import CDPProxyClient
-from .persistent_cdp import PersistentCDPClient, enable_domains
-from .ps_relay import PowerShellCDPRelay
+from .persistent_cdp import CDP_COMMAND_TIMEOUT, PersistentCDPClient, enable_domains
+from .ps_relay import PowerShellCDPRelay, shutdown_mux_relay
 from .session_store import SessionRecord, SessionStore
 from .wsl import get_windows_host_ip, is_mirrored_networking, is_wsl, run_windows_command
 
 logger = logging.getLogger(__name__)
 
+# Start URLs that can go on Chrome's command line unquoted: a scheme (so it
+# cannot be read as a switch) and no whitespace or quote characters
+_LAUNCH_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:[^\s\"']*$")
 
-@dataclass
+# Where chrome.exe is looked for, as a PowerShell array body
+_CHROME_SEARCH_PATHS_PS = """
+    "$env:PROGRAMFILES\\Google\\Chrome\\Application\\chrome.exe",
+    "${env:PROGRAMFILES(x86)}\\Google\\Chrome\\Application\\chrome.exe",
+    "$env:LOCALAPPDATA\\Google\\Chrome\\Application\\chrome.exe"
+"""
+
+# PowerShell statements that set $ud to the --user-data-dir for a launch
+_TEMP_USER_DATA_PS = """
+$ud = Join-Path $env:TEMP ("chrome-mcp-" + [System.IO.Path]::GetRandomFileName())
+New-Item -ItemType Directory -Path $ud -Force | Out-Null
+"""
+_PROFILE_USER_DATA_PS = '$ud = "$env:LOCALAPPDATA\\Google\\Chrome\\User Data"'
+
+# Chrome startup polling: give up after the timeout, backing off between probes
+CHROME_READY_TIMEOUT = 30.0
+_READY_POLL_INITIAL = 0.05
+_READY_POLL_MAX = 0.5
+
+# Pauses before the 2nd and 3rd CDP WebSocket connect attempts. Chrome already
+# answers /json/version by then, so a short first pause usually suffices.
+_CONNECT_RETRY_DELAYS = (0.25, 0.75)
+_CONNECT_ATTEMPTS = len(_CONNECT_RETRY_DELAYS) + 1
+
+# How old a /json/list result may be for _connect_cdp to reuse it; a
+# reconnect usually lists targets just before connecting
+_TARGETS_REUSE_AGE = 0.5
+
+# Per-instance caps on event-collected data; the oldest entries drop first
+_MAX_CONSOLE_MESSAGES = 10_000
+_MAX_NETWORK_REQUESTS = 10_000
+
+
+@dataclass(slots=True)
 class ConsoleMessage:
     """A console message captured from the browser."""
 
@@ -39,7 +80,7 @@ class ConsoleMessage:
     args: list[Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NetworkRequest:
     """A network request captured from the browser."""
 
@@ -54,7 +95,7 @@ class NetworkRequest:
     response_body: bytes | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogInfo:
     """Information about a pending browser dialog."""
 
@@ -64,7 +105,19 @@ class DialogInfo:
     url: str | None = None
 
 
-@dataclass
+def new_console_buffer() -> deque[ConsoleMessage]:
+    """Return an empty console buffer that drops its oldest entry when full."""
+    return deque(maxlen=_MAX_CONSOLE_MESSAGES)
+
+
+def _remove_capture_dir(instance: ChromeInstance) -> None:
+    """Delete the session's local capture directory, if one was created."""
+    if instance.capture_dir:
+        shutil.rmtree(instance.capture_dir, ignore_errors=True)
+        instance.capture_dir = None
+
+
+@dataclass(slots=True)
 class ChromeInstance:
     """Session state backed by a Chrome process.
 
@@ -83,6 +136,7 @@ class ChromeInstance:
     cdp: PersistentCDPClient | PowerShellCDPRelay | None = None  # For current page
     proxy: CDPProxyClient | None = None  # Fallback for one-shot commands
     browser_context_id: str | None = None
+    ws_url_cache: dict[str, str] = field(default_factory=dict)  # target_id -> proxy WS URL
 
     # Tab tracking within this Chrome instance
     current_target_id: str | None = None
@@ -90,7 +144,7 @@ class ChromeInstance:
     window_id: int | None = None
 
     # Event-collected data
-    console_messages: list[ConsoleMessage] = field(default_factory=list)
+    console_messages: deque[ConsoleMessage] = field(default_factory=new_console_buffer)
     network_requests: dict[str, NetworkRequest] = field(default_factory=dict)
     pending_dialog: DialogInfo | None = None
 
@@ -98,6 +152,15 @@ class ChromeInstance:
     snapshot_cache: dict[str, dict[str, Any]] = field(default_factory=dict)
     snapshot_node_ids: dict[str, int] = field(default_factory=dict)  # uid -> backendNodeId
 
+    # Remote handle to the page's globalThis, target of Runtime.callFunctionOn
+    global_object_id: str | None = None
+
+    # URL the first tab was opened with at creation, until chrome_session_start reads it
+    initial_url: str | None = None
+
+    # Local directory for captures too large to return inline; removed with the session
+    capture_dir: str | None = None
+
     # Performance trace state
     trace_active: bool = False
     trace_events: list[dict[str, Any]] = field(default_factory=list)
@@ -114,12 +177,18 @@ class ChromeInstance:
         """Check if CDP client is connected."""
         return self.cdp is not None and self.cdp.is_connected
 
+    def take_console_messages(self) -> deque[ConsoleMessage]:
+        """Return the collected console buffer and start a fresh one."""
+        messages, self.console_messages = self.console_messages, new_console_buffer()
+        return messages
+
     def clear_page_state(self) -> None:
         """Clear state that should be reset on navigation."""
         self.console_messages.clear()
         self.network_requests.clear()
         self.snapshot_cache.clear()
         self.snapshot_node_ids.clear()
+        self.global_object_id = None
 
     def add_console_message(
         self,
@@ -141,14 +210,41 @@ class ChromeInstance:
         )
 
     def add_network_request(self, request_id: str, request: NetworkRequest) -> None:
-        """Add or update a network request."""
-        self.network_requests[request_id] = request
+        """Add or update a network request, evicting the oldest when full."""
+        requests = self.network_requests
+        if request_id not in requests and len(requests) >= _MAX_NETWORK_REQUESTS:
+            del requests[next(iter(requests))]
+        requests[request_id] = request
 
     def set_dialog(self, dialog: DialogInfo | None) -> None:
         """Set or clear the pending dialog."""
         self.pending_dialog = dialog
 
 
+async def _wait_for_chrome_version(
+    proxy: CDPProxyClient, timeout: float = CHROME_READY_TIMEOUT
+) -> dict[str, Any] | None:
+    """Poll a freshly launched Chrome until its /json/version answers.
+
+    Probes start after 50ms and back off to 500ms, so a Chrome that comes
+    up quickly is picked up without waiting out a fixed one-second step.
+
+    Returns:
+        The version info, or None if Chrome did not answer within timeout.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = _READY_POLL_INITIAL
+    while True:
+        await asyncio.sleep(delay)
+        version = await proxy.get_version()
+        if version:
+            return version
+        if loop.time() >= deadline:
+            return None
+        delay = min(delay * 2, _READY_POLL_MAX)
+
+
 class ChromePoolManager:
     """Manages Chrome instances for MCP sessions.
 
@@ -165,6 +261,9 @@ class ChromePoolManager:
         profile_name: str = "",
     ) -> None:
         self._instances: dict[str, ChromeInstance] = {}
+        # Serializes get_or_create per session so one session's launch or
+        # reconnect never blocks another's, and a session is created once.
+        self._session_locks: dict[str, asyncio.Lock] = {}
         self._port = port_min
         self._port_max = port_max
         self._headless = headless
@@ -172,6 +271,8 @@ class ChromePoolManager:
         self._profile_name = profile_name
         self._chrome_path: str | None = None
         self._direct_tcp_works: bool = True
+        # Host of the last WebSocket URL that connected, tried first next time
+        self._ws_host: str | None = None
 
         # Per-session port tracking (isolated mode)
         self._used_ports: set[int] = set()
@@ -181,6 +282,9 @@ class ChromePoolManager:
         self._shared_user_data_dir: str | None = None
         self._shared_proxy: CDPProxyClient | None = None
         self._browser_cdp: PersistentCDPClient | None = None
+        # create_tab calls waiting on Target.targetCreated; discovery stays on
+        # while any of them is pending
+        self._target_waiters = 0
         self._default_tabs_closed: bool = False
         self._profile_context_id: str | None = None
 
@@ -324,13 +428,9 @@ class ChromePoolManager:
         if self._chrome_path:
             return self._chrome_path
 
-        find_chrome_ps = """
-        $paths = @(
-            "$env:PROGRAMFILES\\Google\\Chrome\\Application\\chrome.exe",
-            "${env:PROGRAMFILES(x86)}\\Google\\Chrome\\Application\\chrome.exe",
-            "$env:LOCALAPPDATA\\Google\\Chrome\\Application\\chrome.exe"
-        )
-        foreach ($p in $paths) { if (Test-Path $p) { Write-Output $p; break } }
+        find_chrome_ps = f"""
+        $paths = @({_CHROME_SEARCH_PATHS_PS})
+        foreach ($p in $paths) {{ if (Test-Path $p) {{ Write-Output $p; break }} }}
         """
         result = run_windows_command(find_chrome_ps, timeout=10.0)
         chrome_path = result.stdout.strip() if result.returncode == 0 else None
@@ -342,6 +442,59 @@ class ChromePoolManager:
         logger.info("Found Chrome at: %s", chrome_path)
         return chrome_path
 
+    def _launch_chrome(self, args: list[str], user_data_ps: str) -> tuple[str, int | None]:
+        """Locate chrome.exe, prepare its user data dir and start it in one PowerShell call.
+
+        Args:
+            args: Chrome arguments, without --user-data-dir.
+            user_data_ps: PowerShell statements that set ``$ud`` to the user data dir.
+
+        Returns:
+            Tuple of (user_data_dir, pid); pid is None if it could not be read.
+
+        Raises:
+            RuntimeError: With PowerShell's error output if any step failed.
+        """
+        if self._chrome_path:
+            paths_ps = "'" + self._chrome_path.replace("'", "''") + "'"
+        else:
+            paths_ps = _CHROME_SEARCH_PATHS_PS
+
+        arg_parts = []
+        for arg in args:
+            if " " in arg:
+                arg_parts.append(f'"{arg}"')
+            else:
+                arg_parts.append(arg)
+        args_line = " ".join(arg_parts)
+
+        launch_ps = f"""
+        $ErrorActionPreference = 'Stop'
+        $chrome = $null
+        foreach ($p in @({paths_ps})) {{ if (Test-Path $p) {{ $chrome = $p; break }} }}
+        if (-not $chrome) {{ throw 'Chrome not found on Windows' }}
+        {user_data_ps}
+        $argLine = '"--user-data-dir=' + $ud + '" {args_line}'
+        $proc = Start-Process -FilePath $chrome -ArgumentList $argLine -PassThru
+        @{{chrome = $chrome; userDataDir = $ud; pid = $proc.Id}} | ConvertTo-Json -Compress
+        """
+        logger.debug("Chrome launch command: %s", launch_ps)
+        result = run_windows_command(launch_ps, timeout=15.0)
+
+        launched: dict[str, Any] = {}
+        if result.returncode == 0:
+            with contextlib.suppress(ValueError):
+                launched = json.loads(result.stdout)
+        if not launched.get("userDataDir"):
+            detail = (result.stderr or result.stdout or "").strip()
+            raise RuntimeError(f"Failed to launch Chrome on Windows: {detail}")
+
+        if launched.get("chrome") != self._chrome_path:
+            self._chrome_path = launched.get("chrome")
+            logger.info("Found Chrome at: %s", self._chrome_path)
+        pid = launched.get("pid")
+        return launched["userDataDir"], pid if isinstance(pid, int) else None
+
     def _setup_event_handlers(self, instance: ChromeInstance) -> None:
         """Set up CDP event handlers for an instance."""
         if not instance.cdp:
@@ -463,8 +616,12 @@ class ChromePoolManager:
         if not instance.proxy:
             raise RuntimeError("No proxy available to discover targets")
 
-        targets = await instance.proxy.list_targets()
+        targets = await instance.proxy.list_targets(max_age=_TARGETS_REUSE_AGE)
         target = next((t for t in targets if t.get("id") == target_id), None)
+        if not target:
+            # The reused listing may predate a tab opened over the browser socket
+            targets = await instance.proxy.list_targets()
+            target = next((t for t in targets if t.get("id") == target_id), None)
         if not target:
             raise RuntimeError(f"Target {target_id} not found")
 
@@ -477,28 +634,30 @@ class ChromePoolManager:
 
         last_error: Exception | None = None
         if self._direct_tcp_works:
-            candidate_urls = self._build_ws_candidates(original_ws_url)
-            for attempt in range(3):
+            candidate_urls = self._ws_candidates(original_ws_url)
+            for attempt in range(_CONNECT_ATTEMPTS):
                 if attempt > 0:
                     logger.debug(
-                        "Session %s: page CDP retry %d/3",
+                        "Session %s: page CDP retry %d/%d",
                         instance.session_id,
                         attempt + 1,
+                        _CONNECT_ATTEMPTS,
                     )
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(_CONNECT_RETRY_DELAYS[attempt - 1])
                     # Re-discover target in case URL changed
                     targets = await instance.proxy.list_targets()
                     target = next((t for t in targets if t.get("id") == target_id), None)
                     if target:
                         new_ws = target.get("webSocketDebuggerUrl", "")
                         if new_ws:
-                            candidate_urls = self._build_ws_candidates(new_ws)
+                            candidate_urls = self._ws_candidates(new_ws)
 
                 for ws_url in candidate_urls:
                     try:
                         logger.debug("Trying direct CDP connection: %s", ws_url)
-                        client = PersistentCDPClient(ws_url, timeout=5.0)
+                        client = PersistentCDPClient(ws_url, timeout=CDP_COMMAND_TIMEOUT)
                         await client.connect()
+                        self._ws_host = urlsplit(ws_url).hostname
                         instance.cdp = client
                         await enable_domains(instance.cdp, ["Page", "Runtime", "Network", "DOM"])
                         self._setup_event_handlers(instance)
@@ -565,6 +724,17 @@ class ChromePoolManager:
 
         return candidates
 
+    def _ws_candidates(self, original_ws_url: str) -> list[str]:
+        """Candidate WebSocket URLs, starting with the host that last connected.
+
+        Under WSL NAT only one of localhost / the Windows host IP answers, so
+        remembering it saves every later connect a failed attempt.
+        """
+        candidates = self._build_ws_candidates(original_ws_url)
+        if self._ws_host is not None:
+            candidates.sort(key=lambda url: urlsplit(url).hostname != self._ws_host)
+        return candidates
+
     async def _try_adopt_existing_chrome(self) -> bool:
         """Try to adopt an existing Chrome already running on the debugging port.
 
@@ -618,42 +788,12 @@ class ChromePoolManager:
         if await self._try_adopt_existing_chrome():
             return
 
-        chrome_path = await self._find_chrome_path()
-
-        user_data_dir: str | None = None
-        owns_user_data = False
-
-        if self._profile_mode == "profile":
-            get_ud_ps = 'Write-Output "$env:LOCALAPPDATA\\Google\\Chrome\\User Data"'
-            result = run_windows_command(get_ud_ps, timeout=10.0)
-            user_data_dir = result.stdout.strip() if result.returncode == 0 else None
-            if not user_data_dir:
-                raise RuntimeError("Failed to resolve Chrome User Data directory")
-        else:
-            create_temp_ps = (
-                '$temp = Join-Path $env:TEMP ("chrome-mcp-" + '
-                "[System.IO.Path]::GetRandomFileName()); "
-                "New-Item -ItemType Directory -Path $temp -Force | Out-Null; "
-                "Write-Output $temp"
-            )
-            result = run_windows_command(create_temp_ps, timeout=10.0)
-            user_data_dir = result.stdout.strip() if result.returncode == 0 else None
-            if not user_data_dir:
-                raise RuntimeError("Failed to create temp directory on Windows")
-            owns_user_data = True
-
-        logger.info(
-            "Launching shared Chrome on port %d (profile_mode=%s, user_data_dir=%s)",
-            self._port,
-            self._profile_mode,
-            user_data_dir,
-        )
+        owns_user_data = self._profile_mode != "profile"
 
         args = [
             f"--remote-debugging-port={self._port}",
             "--remote-debugging-address=0.0.0.0",
             "--remote-allow-origins=*",
-            f"--user-data-dir={user_data_dir}",
             "--no-first-run",
             "--no-default-browser-check",
             "--disable-popup-blocking",
@@ -663,43 +803,27 @@ class ChromePoolManager:
         if self._headless:
             args.append("--headless=new")
 
-        arg_parts = []
-        for arg in args:
-            if " " in arg:
-                arg_parts.append(f'"{arg}"')
-            else:
-                arg_parts.append(arg)
-        args_line = " ".join(arg_parts)
-        launch_ps = (
-            f'$proc = Start-Process -FilePath "{chrome_path}" '
-            f"-ArgumentList '{args_line}' -PassThru; "
-            "Write-Output $proc.Id"
+        user_data_dir, shared_pid = self._launch_chrome(
+            args, _TEMP_USER_DATA_PS if owns_user_data else _PROFILE_USER_DATA_PS
+        )
+        logger.info(
+            "Shared Chrome launched on port %d with PID %s (profile_mode=%s, user_data_dir=%s)",
+            self._port,
+            shared_pid,
+            self._profile_mode,
+            user_data_dir,
         )
-        logger.debug("Chrome launch command: %s", launch_ps)
-        result = run_windows_command(launch_ps, timeout=10.0)
-
-        shared_pid: int | None = None
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                shared_pid = int(result.stdout.strip())
-                logger.info("Shared Chrome launched with PID %d", shared_pid)
-            except ValueError:
-                logger.warning("Could not parse shared Chrome PID: %s", result.stdout)
 
         shared_proxy = CDPProxyClient(self._port)
 
-        for _attempt in range(30):
-            await asyncio.sleep(1)
-            version = await shared_proxy.get_version()
-            if version:
-                logger.info(
-                    "Shared Chrome ready on port %d: %s",
-                    self._port,
-                    version.get("Browser", "unknown"),
-                )
-                break
-        else:
+        version = await _wait_for_chrome_version(shared_proxy)
+        if version is None:
             raise RuntimeError(f"Chrome did not start within 30 seconds on port {self._port}")
+        logger.info(
+            "Shared Chrome ready on port %d: %s",
+            self._port,
+            version.get("Browser", "unknown"),
+        )
 
         self._shared_pid = shared_pid
         self._shared_user_data_dir = user_data_dir if owns_user_data else None
@@ -727,20 +851,21 @@ class ChromePoolManager:
 
         last_error: Exception | None = None
 
-        for attempt in range(3):
+        for attempt in range(_CONNECT_ATTEMPTS):
             if attempt > 0:
-                logger.debug("Browser CDP connection retry %d/3", attempt + 1)
-                await asyncio.sleep(1)
+                logger.debug("Browser CDP connection retry %d/%d", attempt + 1, _CONNECT_ATTEMPTS)
+                await asyncio.sleep(_CONNECT_RETRY_DELAYS[attempt - 1])
 
             browser_ws_url = await self._shared_proxy.get_browser_ws_url()
             if not browser_ws_url:
                 last_error = RuntimeError("Failed to get browser WebSocket URL")
                 continue
 
-            for ws_url in self._build_ws_candidates(browser_ws_url):
+            for ws_url in self._ws_candidates(browser_ws_url):
                 try:
-                    client = PersistentCDPClient(ws_url, timeout=5.0)
+                    client = PersistentCDPClient(ws_url, timeout=CDP_COMMAND_TIMEOUT)
                     await client.connect()
+                    self._ws_host = urlsplit(ws_url).hostname
                     self._browser_cdp = client
                     logger.info("Connected browser CDP via %s", ws_url)
                     return
@@ -765,24 +890,26 @@ class ChromePoolManager:
 
         last_error: Exception | None = None
 
-        for attempt in range(3):
+        for attempt in range(_CONNECT_ATTEMPTS):
             if attempt > 0:
                 logger.debug(
-                    "Instance %s browser CDP retry %d/3",
+                    "Instance %s browser CDP retry %d/%d",
                     instance.session_id,
                     attempt + 1,
+                    _CONNECT_ATTEMPTS,
                 )
-                await asyncio.sleep(1)
+                await asyncio.sleep(_CONNECT_RETRY_DELAYS[attempt - 1])
 
             browser_ws_url = await instance.proxy.get_browser_ws_url()
             if not browser_ws_url:
                 last_error = RuntimeError("Failed to get browser WebSocket URL")
                 continue
 
-            for ws_url in self._build_ws_candidates(browser_ws_url):
+            for ws_url in self._ws_candidates(browser_ws_url):
                 try:
-                    client = PersistentCDPClient(ws_url, timeout=5.0)
+                    client = PersistentCDPClient(ws_url, timeout=CDP_COMMAND_TIMEOUT)
                     await client.connect()
+                    self._ws_host = urlsplit(ws_url).hostname
                     instance.instance_browser_cdp = client
                     logger.info(
                         "Session %s: connected instance browser CDP via %s",
@@ -821,9 +948,11 @@ class ChromePoolManager:
 
     async def _invalidate_all_sessions(self) -> None:
         """Invalidate all sessions after shared Chrome failure."""
+        await asyncio.gather(*(self._disconnect_cdp(i) for i in self._instances.values()))
         for instance in self._instances.values():
-            await self._disconnect_cdp(instance)
+            _remove_capture_dir(instance)
         self._instances.clear()
+        self._session_locks.clear()
 
         if self._browser_cdp:
             with contextlib.suppress(Exception):
@@ -912,15 +1041,38 @@ class ChromePoolManager:
                 await instance.cdp.disconnect()
             instance.cdp = None
 
-    async def get_or_create(self, session_id: str) -> ChromeInstance:
+    async def _close_proxy(self, instance: ChromeInstance) -> None:
+        """Close an instance's proxy relays unless the proxy is shared."""
+        if instance.proxy and instance.proxy is not self._shared_proxy:
+            with contextlib.suppress(Exception):
+                await instance.proxy.close()
+
+    async def get_or_create(
+        self, session_id: str, initial_url: str | None = None
+    ) -> ChromeInstance:
         """Get existing Chrome instance or create new one for this session.
 
         Args:
             session_id: The opencode session identifier.
+            initial_url: URL to open in the first tab if a new session is
+                created. When it could be opened directly, the instance's
+                ``initial_url`` is set so the caller can skip navigating.
 
         Returns:
             ChromeInstance for the requested session.
         """
+        instance = self._instances.get(session_id)
+        if instance is not None and (instance.is_connected or not instance.current_target_id):
+            return instance
+
+        lock = self._session_locks.setdefault(session_id, asyncio.Lock())
+        async with lock:
+            return await self._get_or_create_locked(session_id, initial_url)
+
+    async def _get_or_create_locked(
+        self, session_id: str, initial_url: str | None
+    ) -> ChromeInstance:
+        """Body of get_or_create, run while holding the session's lock."""
         if session_id in self._instances:
             instance = self._instances[session_id]
 
@@ -1021,12 +1173,11 @@ class ChromePoolManager:
         logger.info(
             "Creating new Chrome session %s (profile_mode=%s)", session_id, self._profile_mode
         )
-
         if self._profile_mode != "profile":
             # Isolated mode: per-session Chrome, retry with new port on failure
             for attempt in range(3):
                 try:
-                    return await self._create_isolated_session(session_id)
+                    return await self._create_isolated_session(session_id, initial_url=initial_url)
                 except Exception as e:
                     logger.warning(
                         "Isolated session creation attempt %d failed: %s",
@@ -1040,7 +1191,7 @@ class ChromePoolManager:
             # Profile mode: shared Chrome, retry with Chrome restart
             for attempt in range(2):
                 try:
-                    return await self._create_shared_session(session_id)
+                    return await self._create_shared_session(session_id, initial_url=initial_url)
                 except Exception as e:
                     if attempt == 0:
                         logger.warning(
@@ -1121,12 +1272,15 @@ class ChromePoolManager:
 
         return target_id, window_id
 
-    async def _create_isolated_session(self, session_id: str) -> ChromeInstance:
+    async def _create_isolated_session(
+        self, session_id: str, initial_url: str | None = None
+    ) -> ChromeInstance:
         """Create a new session with its own dedicated Chrome process.
 
         This is the original architecture: each session gets its own Chrome
         on a unique port with a temp user-data-dir. Chrome's natural first
-        tab is used (no forced about:blank, no BrowserContext).
+        tab is used (no forced about:blank, no BrowserContext), opened at
+        ``initial_url`` when it can be passed on the command line.
         """
         port = self._allocate_port()
 
@@ -1143,79 +1297,39 @@ class ChromePoolManager:
             )
         )
 
-        chrome_path = await self._find_chrome_path()
-
-        # Create temp directory on Windows
-        create_temp_ps = (
-            '$temp = Join-Path $env:TEMP ("chrome-mcp-" + '
-            "[System.IO.Path]::GetRandomFileName()); "
-            "New-Item -ItemType Directory -Path $temp -Force | Out-Null; "
-            "Write-Output $temp"
-        )
-        result = run_windows_command(create_temp_ps, timeout=10.0)
-        user_data_dir = result.stdout.strip() if result.returncode == 0 else None
-
-        if not user_data_dir:
-            self._release_port(port)
-            raise RuntimeError("Failed to create temp directory on Windows")
-
-        logger.info(
-            "Launching Chrome for session %s on port %d (user_data_dir=%s)",
-            session_id,
-            port,
-            user_data_dir,
-        )
-
         # Build Chrome arguments
         args = [
             f"--remote-debugging-port={port}",
             "--remote-debugging-address=0.0.0.0",
             "--remote-allow-origins=*",
-            f"--user-data-dir={user_data_dir}",
             "--no-first-run",
             "--no-default-browser-check",
             "--disable-popup-blocking",
         ]
         if self._headless:
             args.append("--headless=new")
+        if initial_url and not _LAUNCH_URL_RE.match(initial_url):
+            initial_url = None  # needs quoting; the caller navigates instead
+        if initial_url:
+            args.append(initial_url)
 
-        arg_parts = []
-        for arg in args:
-            if " " in arg:
-                arg_parts.append(f'"{arg}"')
-            else:
-                arg_parts.append(arg)
-        args_line = " ".join(arg_parts)
-        launch_ps = (
-            f'$proc = Start-Process -FilePath "{chrome_path}" '
-            f"-ArgumentList '{args_line}' -PassThru; "
-            "Write-Output $proc.Id"
+        try:
+            user_data_dir, pid = self._launch_chrome(args, _TEMP_USER_DATA_PS)
+        except Exception:
+            self._release_port(port)
+            raise
+        logger.info(
+            "Chrome launched with PID %s for session %s on port %d (user_data_dir=%s)",
+            pid,
+            session_id,
+            port,
+            user_data_dir,
         )
-        logger.debug("Chrome launch command: %s", launch_ps)
-        result = run_windows_command(launch_ps, timeout=10.0)
-
-        pid: int | None = None
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                pid = int(result.stdout.strip())
-                logger.info("Chrome launched with PID %d for session %s", pid, session_id)
-            except ValueError:
-                logger.warning("Could not parse Chrome PID: %s", result.stdout)
 
         # Wait for Chrome to be ready
         proxy = CDPProxyClient(port)
-        for _attempt in range(30):
-            await asyncio.sleep(1)
-            version = await proxy.get_version()
-            if version:
-                logger.info(
-                    "Chrome ready on port %d for session %s: %s",
-                    port,
-                    session_id,
-                    version.get("Browser", "unknown"),
-                )
-                break
-        else:
+        version = await _wait_for_chrome_version(proxy)
+        if version is None:
             # Chrome didn't start — clean up
             if pid:
                 kill_ps = f"Stop-Process -Id {pid} -Force -ErrorAction SilentlyContinue"
@@ -1228,6 +1342,12 @@ class ChromePoolManager:
                 run_windows_command(cleanup_ps, timeout=10.0)
             self._release_port(port)
             raise RuntimeError(f"Chrome did not start within 30 seconds on port {port}")
+        logger.info(
+            "Chrome ready on port %d for session %s: %s",
+            port,
+            session_id,
+            version.get("Browser", "unknown"),
+        )
 
         # Grab Chrome's natural first tab (whatever Chrome opened — NOT forced about:blank)
         targets = await proxy.list_targets()
@@ -1258,6 +1378,7 @@ class ChromePoolManager:
             current_target_id=initial_target_id,
             targets=[initial_target_id],
             owns_chrome=True,
+            initial_url=initial_url if page_targets else None,
         )
 
         # Connect browser-level CDP for this instance
@@ -1306,8 +1427,14 @@ class ChromePoolManager:
         )
         return instance
 
-    async def _create_shared_session(self, session_id: str) -> ChromeInstance:
-        """Create a new session in the shared Chrome process (profile mode)."""
+    async def _create_shared_session(
+        self, session_id: str, initial_url: str | None = None
+    ) -> ChromeInstance:
+        """Create a new session in the shared Chrome process (profile mode).
+
+        ``initial_url`` is passed to ``Target.createTarget``; tabs opened
+        through the profile CLI always start at about:blank.
+        """
         await self._ensure_shared_chrome()
 
         if not self._browser_cdp or not self._shared_proxy:
@@ -1319,6 +1446,7 @@ class ChromePoolManager:
 
         try:
             if use_profile_cli:
+                initial_url = None
                 initial_target_id, window_id = await self._create_profile_tab()
                 browser_context_id = self._profile_context_id
                 logger.info(
@@ -1331,7 +1459,7 @@ class ChromePoolManager:
             else:
                 target_result = await self._browser_cdp.send(
                     "Target.createTarget",
-                    {"url": "about:blank"},
+                    {"url": initial_url or "about:blank"},
                 )
                 initial_target_id = target_result["targetId"]
                 logger.info(
@@ -1353,6 +1481,7 @@ class ChromePoolManager:
                 targets=[initial_target_id],
                 window_id=window_id,
                 owns_chrome=False,
+                initial_url=initial_url,
             )
 
             try:
@@ -1411,7 +1540,10 @@ class ChromePoolManager:
             KeyError: If session not found.
         """
         instance = self._instances.pop(session_id)
+        self._session_locks.pop(session_id, None)
         await self._disconnect_cdp(instance)
+        await self._close_proxy(instance)
+        _remove_capture_dir(instance)
 
         if instance.owns_chrome:
             logger.info(
@@ -1461,21 +1593,36 @@ class ChromePoolManager:
         Session records are preserved on disk.
         """
         logger.info("Disconnecting %d Chrome session(s) (Chrome stays alive)", len(self._instances))
-        for session_id in list(self._instances.keys()):
-            try:
-                instance = self._instances.pop(session_id)
-                await self._disconnect_cdp(instance)
-                if instance.instance_browser_cdp:
-                    with contextlib.suppress(Exception):
-                        await instance.instance_browser_cdp.disconnect()
-                    instance.instance_browser_cdp = None
-            except Exception as e:
-                logger.warning("Error disconnecting session %s: %s", session_id, e)
+        instances = list(self._instances.items())
+        self._instances.clear()
+        self._session_locks.clear()
+        # Each teardown waits on its own sockets, so run them side by side
+        await asyncio.gather(*(self._detach_instance(sid, inst) for sid, inst in instances))
 
+        shared: list[Awaitable[Any]] = []
         if self._browser_cdp and self._browser_cdp.is_connected:
-            with contextlib.suppress(Exception):
-                await self._browser_cdp.close()
+            shared.append(self._browser_cdp.close())
             self._browser_cdp = None
+        if self._shared_proxy:
+            shared.append(self._shared_proxy.close())
+        await asyncio.gather(*shared, return_exceptions=True)
+
+        # Relays run over the shared PowerShell process, so it goes last
+        with contextlib.suppress(Exception):
+            await shutdown_mux_relay()
+
+    async def _detach_instance(self, session_id: str, instance: ChromeInstance) -> None:
+        """Close one instance's connections, logging rather than raising errors."""
+        try:
+            await self._disconnect_cdp(instance)
+            await self._close_proxy(instance)
+            if instance.instance_browser_cdp:
+                with contextlib.suppress(Exception):
+                    await instance.instance_browser_cdp.disconnect()
+                instance.instance_browser_cdp = None
+        except Exception as e:
+            logger.warning("Error disconnecting session %s: %s", session_id, e)
+        _remove_capture_dir(instance)
 
     def list_sessions(self) -> dict[str, dict[str, Any]]:
         """List all active sessions.
@@ -1502,19 +1649,45 @@ class ChromePoolManager:
 
     # --- Tab operations (within a session's Chrome) ---
 
-    async def _poll_new_target(
-        self, before_ids: set[str], timeout: float = 3.0, interval: float = 0.3
-    ) -> str | None:
-        iterations = int(timeout / interval)
-        for _ in range(max(iterations, 1)):
-            await asyncio.sleep(interval)
-            if not self._browser_cdp:
-                return None
-            result = await self._browser_cdp.send("Target.getTargets", {})
+    async def _wait_for_new_target(self, before_ids: set[str], timeout: float = 5.0) -> str | None:
+        """Wait for a page target not in before_ids to appear.
+
+        Listens for Target.targetCreated instead of polling Target.getTargets.
+        One getTargets scan after subscribing catches a target that appeared
+        before the listener was in place. Target discovery is switched on only
+        while a wait is pending, so the shared browser socket is not sent every
+        target change for the rest of the session; concurrent waits share it and
+        the last one to finish switches it off.
+        """
+        browser_cdp = self._browser_cdp
+        if not browser_cdp:
+            return None
+
+        found: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+
+        def on_target_created(params: dict[str, Any]) -> None:
+            info = params.get("targetInfo", {})
+            target_id = info.get("targetId")
+            if info.get("type") == "page" and target_id not in before_ids and not found.done():
+                found.set_result(target_id)
+
+        browser_cdp.on("Target.targetCreated", on_target_created)
+        self._target_waiters += 1
+        try:
+            await browser_cdp.send("Target.setDiscoverTargets", {"discover": True})
+            result = await browser_cdp.send("Target.getTargets", {})
             for t in result.get("targetInfos", []):
                 if t["targetId"] not in before_ids and t.get("type") == "page":
                     return t["targetId"]
-        return None
+            return await asyncio.wait_for(found, timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            browser_cdp.off("Target.targetCreated", on_target_created)
+            self._target_waiters -= 1
+            if not self._target_waiters and browser_cdp.is_connected:
+                with contextlib.suppress(Exception):
+                    await browser_cdp.send("Target.setDiscoverTargets", {"discover": False})
 
     async def _verify_target_window(self, target_id: str, expected_window: int) -> bool:
         if not self._browser_cdp:
@@ -1527,13 +1700,20 @@ class ChromePoolManager:
         except Exception:
             return False
 
-    async def create_tab(self, session_id: str, url: str = "about:blank") -> str:
+    async def create_tab(
+        self, session_id: str, url: str = "about:blank", background: bool = False
+    ) -> str:
         """Create a new tab in a session's Chrome.
 
         Isolated mode: simple Target.createTarget (own Chrome, no confusion).
-        Profile mode: 3-tier fallback for window placement.
+        Profile mode: 3-tier fallback for window placement; its tabs always
+        open in front, so ``background`` only applies to the other modes.
+        The new tab becomes the session's current page either way.
         """
         instance = self._instances[session_id]
+        create_params: dict[str, Any] = {"url": url}
+        if background:
+            create_params["background"] = True
 
         if instance.owns_chrome:
             # Isolated mode: use instance's own browser CDP
@@ -1547,7 +1727,7 @@ class ChromePoolManager:
 
             result = await browser_cdp.send(
                 "Target.createTarget",
-                {"url": url},
+                create_params,
             )
             new_target_id = result["targetId"]
         elif instance.window_id is not None:
@@ -1564,7 +1744,6 @@ class ChromePoolManager:
             if not self._browser_cdp:
                 raise RuntimeError("Browser CDP is not connected")
 
-            create_params: dict[str, Any] = {"url": url}
             if instance.browser_context_id:
                 create_params["browserContextId"] = instance.browser_context_id
 
@@ -1575,7 +1754,9 @@ class ChromePoolManager:
             new_target_id = result["targetId"]
 
         instance.targets.append(new_target_id)
-        await self.switch_tab(session_id, new_target_id)
+        # Every creation path already put the tab where it belongs: in the
+        # foreground, or left in the background on request
+        await self.switch_tab(session_id, new_target_id, activate=False)
 
         logger.info(
             "Session %s: created tab %s -> %s",
@@ -1586,8 +1767,6 @@ class ChromePoolManager:
         return new_target_id
 
     async def _create_profile_mode_tab(self, instance: ChromeInstance, url: str) -> str:
-        import json as _json
-
         before_result = await self._browser_cdp.send("Target.getTargets", {})  # type: ignore[union-attr]
         before_ids = {t["targetId"] for t in before_result.get("targetInfos", [])}
 
@@ -1595,7 +1774,7 @@ class ChromePoolManager:
         # and guarantees same-window placement
         if instance.cdp and instance.cdp.is_connected:
             try:
-                safe_url_js = _json.dumps(url)
+                safe_url_js = json.dumps(url)
                 await instance.cdp.send(
                     "Runtime.evaluate",
                     {
@@ -1603,7 +1782,7 @@ class ChromePoolManager:
                         "userGesture": True,
                     },
                 )
-                target_id = await self._poll_new_target(before_ids, timeout=5.0, interval=0.5)
+                target_id = await self._wait_for_new_target(before_ids)
                 if target_id:
                     logger.info(
                         "Session %s: tab created via window.open (tier 1)",
@@ -1669,7 +1848,7 @@ class ChromePoolManager:
             launch_ps = f"Start-Process '{chrome_path}' -ArgumentList '{arg_line}'"
             run_windows_command(launch_ps, timeout=10.0)
 
-            target_id = await self._poll_new_target(before_ids, timeout=5.0, interval=0.5)
+            target_id = await self._wait_for_new_target(before_ids)
             if target_id:
                 logger.info(
                     "Session %s: tab created via Chrome CLI (tier 3)",
@@ -1685,12 +1864,14 @@ class ChromePoolManager:
 
         raise RuntimeError(f"All tab creation methods failed for session {instance.session_id}")
 
-    async def switch_tab(self, session_id: str, target_id: str) -> None:
+    async def switch_tab(self, session_id: str, target_id: str, activate: bool = True) -> None:
         """Switch the active tab in a session's Chrome.
 
         Args:
             session_id: The session to switch tabs in.
             target_id: The target_id to switch to.
+            activate: Bring the tab to the front with Target.activateTarget.
+                Skipped for a tab that was just created in the foreground.
 
         Raises:
             KeyError: If session not found.
@@ -1711,7 +1892,7 @@ class ChromePoolManager:
             instance.cdp = None
 
         # Activate target using the correct browser CDP
-        browser_cdp = self._get_browser_cdp(instance)
+        browser_cdp = self._get_browser_cdp(instance) if activate else None
         if browser_cdp and browser_cdp.is_connected:
             try:
                 await browser_cdp.send(
@@ -1800,20 +1981,36 @@ class ChromePoolManager:
             KeyError: If session not found.
         """
         instance = self._instances[session_id]
+        session_targets = set(instance.targets)
 
-        if not instance.proxy:
-            return []
+        # Prefer Target.getTargets over the open browser WebSocket; the HTTP
+        # endpoint costs a PowerShell round-trip per call under the proxy.
+        all_targets: list[dict[str, Any]] | None = None
+        browser_cdp = self._get_browser_cdp(instance)
+        if browser_cdp and browser_cdp.is_connected:
+            try:
+                result = await browser_cdp.send("Target.getTargets", {})
+                all_targets = [
+                    {"id": info.get("targetId"), "title": info.get("title"), "url": info.get("url")}
+                    for info in result.get("targetInfos", [])
+                ]
+            except Exception as e:
+                logger.debug("Target.getTargets failed, falling back to HTTP: %s", e)
 
-        all_targets = await instance.proxy.list_targets()
-        session_targets = [t for t in all_targets if t.get("id") in instance.targets]
+        if all_targets is None:
+            if not instance.proxy:
+                return []
+            all_targets = await instance.proxy.list_targets()
 
         tabs = []
-        for target in session_targets:
+        for target in all_targets:
+            if target.get("id") not in session_targets:
+                continue
             tabs.append(
                 {
                     "id": target.get("id"),
-                    "title": target.get("title", ""),
-                    "url": target.get("url", ""),
+                    "title": target.get("title") or "",
+                    "url": target.get("url") or "",
                     "is_current": target.get("id") == instance.current_target_id,
                 }
             )
@@ -17,15 +17,13 @@ def main() -> None:
     elif len(sys.argv) > 1 and sys.argv[1] == "--version":
         print("wsl-chrome-mcp 0.1.0")
     else:
-        import asyncio
-
         from dotenv import load_dotenv
 
-        from .server import ChromeMCPServer
+        from .server import ChromeMCPServer, run_event_loop
 
         load_dotenv()
         server = ChromeMCPServer()
-        asyncio.run(server.run())
+        run_event_loop(server.run())
 
 
 if __name__ == "__main__":
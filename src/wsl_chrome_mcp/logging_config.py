@@ -1,7 +1,9 @@
 """Logging configuration with date-based directory structure and time rotation.
 
 Log files are written to: {repo_root}/logs/{YYYY}/{MM}/{DD}/wsl-chrome-mcp.log
-Rotation happens at midnight via TimedRotatingFileHandler.
+Rotation happens at midnight via TimedRotatingFileHandler. File writes are
+buffered through a MemoryHandler so chatty DEBUG output (raw CDP responses)
+is written in batches instead of one write + flush per record.
 """
 
 from __future__ import annotations
@@ -10,7 +12,10 @@ import logging
 import os
 import sys
 from datetime import datetime
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import MemoryHandler, TimedRotatingFileHandler
+
+# Records held in memory before the log file is written
+FILE_LOG_BUFFER_RECORDS = 64
 
 
 def setup_logging() -> None:
@@ -20,6 +25,7 @@ def setup_logging() -> None:
     - Path: logs/{year}/{month}/{day}/wsl-chrome-mcp.log
     - Rotation: midnight, keeps 7 rotated files per directory
     - Level: DEBUG (captures everything including raw CDP responses)
+    - Buffered: flushed every 64 records, on ERROR, and at exit
 
     Stderr handler:
     - Level: INFO (keeps stderr clean)
@@ -50,9 +56,15 @@ def setup_logging() -> None:
         interval=1,
         backupCount=7,
         encoding="utf-8",
+        delay=True,
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
+    buffered_file_handler = MemoryHandler(
+        capacity=FILE_LOG_BUFFER_RECORDS,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
 
     # Stderr handler: INFO level
     stderr_handler = logging.StreamHandler(sys.stderr)
@@ -62,5 +74,5 @@ def setup_logging() -> None:
     # Configure root logger
     root = logging.getLogger()
     root.setLevel(logging.DEBUG)
-    root.addHandler(file_handler)
+    root.addHandler(buffered_file_handler)
     root.addHandler(stderr_handler)
@@ -11,7 +11,8 @@ import asyncio
 import contextlib
 import json
 import logging
-from collections.abc import Awaitable, Callable
+import sys
+from collections.abc import Awaitable, Callable, Collection
 from dataclasses import dataclass
 from typing import Any, Protocol, runtime_checkable
 
@@ -19,11 +20,47 @@ import httpx
 import websockets
 from websockets.asyncio.client import ClientConnection
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Per-command timeout of the persistent page and browser CDP clients
+CDP_COMMAND_TIMEOUT = 5.0
+
+# Longest a single in-page wait (a promise awaited by one CDP call) may run.
+# Kept well below the page client's command timeout so Chrome answers before
+# the client gives up and send_cdp retries the call through the proxy.
+PAGE_WAIT_SLICE_S = CDP_COMMAND_TIMEOUT - 1.5
+
+
+def _encode_message(message: dict[str, Any]) -> str:
+    """Serialise a CDP command for a text WebSocket frame.
+
+    Uses orjson when installed, falling back to json for values it rejects
+    (e.g. integers wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(message).decode()
+        except TypeError:
+            pass
+    return json.dumps(message, separators=(",", ":"))
+
+
+# Parses a CDP frame (str or bytes) with orjson when installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+decode_message: Callable[[str | bytes], Any] = orjson.loads if orjson is not None else json.loads
+
 # Type alias for event handlers
 EventHandler = Callable[[dict[str, Any]], Awaitable[None] | None]
 
+# Per-event handlers as an insertion-ordered set: O(1) subscribe/unsubscribe.
+# Keyed by the handler itself (not id()) so equal bound methods match.
+EventHandlerMap = dict[str, dict[EventHandler, None]]
+
 
 @runtime_checkable
 class CDPClientProtocol(Protocol):
@@ -56,6 +93,63 @@ class CDPError(Exception):
         self.code = code
 
 
+if sys.version_info >= (3, 11):
+
+    async def await_response(future: asyncio.Future[Any], timeout: float) -> Any:
+        """Await a command's response future with a deadline.
+
+        ``asyncio.timeout`` avoids the wrapper task ``wait_for`` allocates.
+        """
+        async with asyncio.timeout(timeout):
+            return await future
+
+else:
+
+    async def await_response(future: asyncio.Future[Any], timeout: float) -> Any:
+        """Await a command's response future with a deadline."""
+        return await asyncio.wait_for(future, timeout=timeout)
+
+
+async def _invoke_handler(handler: EventHandler, params: dict[str, Any]) -> None:
+    result = handler(params)
+    if asyncio.iscoroutine(result):
+        await result
+
+
+async def dispatch_event_handlers(
+    event: str,
+    handlers: Collection[EventHandler] | None,
+    params: dict[str, Any],
+) -> None:
+    """Run every handler for an event concurrently.
+
+    A slow async handler no longer delays the others: fan-out latency is the
+    slowest handler rather than the sum.  Handler errors are logged, never
+    raised.
+
+    Args:
+        event: Event name, used for logging.
+        handlers: Handlers registered for the event.
+        params: Event parameters passed to each handler.
+    """
+    if not handlers:
+        return
+    if len(handlers) == 1:
+        try:
+            await _invoke_handler(next(iter(handlers)), params)
+        except Exception as e:
+            logger.warning("Event handler error for %s: %s", event, e)
+        return
+
+    results = await asyncio.gather(
+        *(_invoke_handler(handler, params) for handler in list(handlers)),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.warning("Event handler error for %s: %s", event, result)
+
+
 @dataclass
 class CDPTarget:
     """Represents a CDP target (page, worker, etc.)."""
@@ -104,10 +198,11 @@ class PersistentCDPClient:
         self._ws: ClientConnection | None = None
         self._message_id = 0
         self._pending: dict[int, asyncio.Future[Any]] = {}
-        self._event_handlers: dict[str, list[EventHandler]] = {}
+        self._event_handlers: EventHandlerMap = {}
         self._receive_task: asyncio.Task[None] | None = None
         self._connected = False
         self._reconnecting = False
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def is_connected(self) -> bool:
@@ -126,6 +221,7 @@ class PersistentCDPClient:
             return
 
         logger.debug("Connecting to %s", self.ws_url)
+        self._loop = asyncio.get_running_loop()
 
         try:
             self._ws = await websockets.connect(
@@ -193,7 +289,7 @@ class PersistentCDPClient:
             ConnectionError: If not connected.
             asyncio.TimeoutError: If command times out.
         """
-        if not self._connected or not self._ws:
+        if not self._connected or not self._ws or not self._loop:
             raise ConnectionError("Not connected to CDP endpoint")
 
         self._message_id += 1
@@ -204,13 +300,12 @@ class PersistentCDPClient:
             message["params"] = params
 
         # Create future for response
-        future: asyncio.Future[Any] = asyncio.get_event_loop().create_future()
+        future: asyncio.Future[Any] = self._loop.create_future()
         self._pending[msg_id] = future
 
         try:
-            await self._ws.send(json.dumps(message))
-            result = await asyncio.wait_for(future, timeout=timeout or self.timeout)
-            return result
+            await self._ws.send(_encode_message(message))
+            return await await_response(future, timeout or self.timeout)
 
         except asyncio.TimeoutError as err:
             self._pending.pop(msg_id, None)
@@ -227,9 +322,7 @@ class PersistentCDPClient:
             event: Event name (e.g., "Runtime.consoleAPICalled").
             handler: Async or sync function to call when event occurs.
         """
-        if event not in self._event_handlers:
-            self._event_handlers[event] = []
-        self._event_handlers[event].append(handler)
+        self._event_handlers.setdefault(event, {})[handler] = None
         logger.debug("Registered handler for event: %s", event)
 
     def off(self, event: str, handler: EventHandler | None = None) -> None:
@@ -239,23 +332,27 @@ class PersistentCDPClient:
             event: Event name to unsubscribe from.
             handler: Specific handler to remove, or None to remove all.
         """
-        if event not in self._event_handlers:
-            return
-
         if handler is None:
-            del self._event_handlers[event]
-        else:
-            self._event_handlers[event] = [h for h in self._event_handlers[event] if h != handler]
+            self._event_handlers.pop(event, None)
+        elif event in self._event_handlers:
+            self._event_handlers[event].pop(handler, None)
 
     async def _receive_loop(self) -> None:
         """Process incoming WebSocket messages."""
         if not self._ws:
             return
 
+        ws = self._ws
         try:
-            async for message in self._ws:
+            while True:
+                # Raw frame bytes: the JSON parser validates UTF-8 itself, so
+                # letting websockets decode to str first would scan it twice.
+                try:
+                    message = await ws.recv(decode=False)
+                except websockets.exceptions.ConnectionClosedOK:
+                    return
                 try:
-                    data = json.loads(message)
+                    data = decode_message(message)
                     await self._handle_message(data)
                 except json.JSONDecodeError as e:
                     logger.warning("Invalid JSON from CDP: %s", e)
@@ -294,15 +391,7 @@ class PersistentCDPClient:
 
     async def _dispatch_event(self, event: str, params: dict[str, Any]) -> None:
         """Dispatch an event to registered handlers."""
-        handlers = self._event_handlers.get(event, [])
-
-        for handler in handlers:
-            try:
-                result = handler(params)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                logger.warning("Event handler error for %s: %s", event, e)
+        await dispatch_event_handlers(event, self._event_handlers.get(event), params)
 
     async def __aenter__(self) -> PersistentCDPClient:
         """Async context manager entry."""
@@ -499,13 +588,16 @@ async def enable_domains(
     if domains is None:
         domains = ["Page", "Runtime", "Network", "DOM"]
 
-    for domain in domains:
+    async def enable(domain: str) -> None:
         try:
             await client.send(f"{domain}.enable")
             logger.debug("Enabled CDP domain: %s", domain)
         except CDPError as e:
             logger.warning("Failed to enable %s domain: %s", domain, e)
 
+    # Each enable is independent, so write them all before awaiting any reply
+    await asyncio.gather(*(enable(domain) for domain in domains))
+
 
 async def navigate(
     client: PersistentCDPClient,
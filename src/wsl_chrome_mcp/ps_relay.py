@@ -1,8 +1,10 @@
 """Persistent CDP relay via a long-running PowerShell WebSocket process.
 
 In WSL2, direct TCP from Linux to Windows Chrome is blocked (firewall + localhost
-binding). This module keeps ONE PowerShell process alive with ONE persistent
-WebSocket to Chrome, piping CDP JSON through stdin/stdout.
+binding). This module keeps ONE PowerShell process alive and multiplexes every
+session's WebSocket to Chrome through it, piping channel-tagged CDP JSON
+through stdin/stdout. Spawning powershell.exe and compiling the C# relay costs
+several seconds, so it is paid once per server rather than once per session.
 
 Interface mirrors PersistentCDPClient so it drops in as instance.cdp.
 """
@@ -14,115 +16,361 @@ import contextlib
 import json
 import logging
 import os
+import re
+import select
 import tempfile
-from collections.abc import Awaitable, Callable
+import time
 from typing import Any
 
-from .persistent_cdp import CDPError
+from .persistent_cdp import (
+    CDPError,
+    EventHandler,
+    EventHandlerMap,
+    await_response,
+    decode_message,
+    dispatch_event_handlers,
+)
 from .wsl import _find_windows_executable, convert_wsl_to_windows_path
 
 logger = logging.getLogger(__name__)
 
-EventHandler = Callable[[dict[str, Any]], Awaitable[None] | None]
+# Pre-encoded ',"method":"X"' fragments, shared by every relay.
+_METHOD_FRAME_TAILS: dict[str, bytes] = {}
+
+# Chrome serialises the routing key first -- {"id":N,...} for responses and
+# {"method":"...",...} for events -- optionally behind the mux channel tag.
+# Matching just the head lets frames nobody waits for skip JSON decoding.
+_FRAME_HEAD_RE = re.compile(rb'\{(?:"__mux_ch":(\d+),)?(?:"id":(\d+)|"method":"([^"]+)")')
 
 # C# compiled inside PowerShell — bidirectional stdin/stdout <-> WebSocket relay.
-# Background Task reads WebSocket and writes JSON lines to stdout.
-# Main thread reads JSON lines from stdin and writes to WebSocket.
+# Async reader loops write each WebSocket frame to stdout as a JSON line;
+# stdin lines are written to the WebSocket.  Targets .NET Framework / C# 5
+# because powershell.exe is Windows PowerShell 5.1.
 _RELAY_CSHARP = r"""
 using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
 using System.IO;
 using System.Net.WebSockets;
 using System.Text;
+using System.Text.RegularExpressions;
 using System.Threading;
 using System.Threading.Tasks;
 
+// Reusable receive state for one WebSocket.  The chunk buffer stays below
+// the large-object-heap threshold and is reused for every frame; the
+// stateful decoder keeps multi-byte UTF-8 sequences intact across chunks.
+public class FrameReader
+{
+    const int ChunkSize = 32 * 1024;
+
+    readonly ClientWebSocket ws;
+    readonly byte[] buf = new byte[ChunkSize];
+    readonly char[] chars = new char[Encoding.UTF8.GetMaxCharCount(ChunkSize)];
+    readonly ArraySegment<byte> seg;
+    readonly Decoder decoder = Encoding.UTF8.GetDecoder();
+    public readonly StringBuilder Message = new StringBuilder();
+
+    public FrameReader(ClientWebSocket ws)
+    {
+        this.ws = ws;
+        seg = new ArraySegment<byte>(buf);
+    }
+
+    // Reads one whole message into Message; false once the peer closes.
+    public async Task<bool> ReceiveAsync(CancellationToken token)
+    {
+        Message.Clear();
+        WebSocketReceiveResult recv;
+        do
+        {
+            recv = await ws.ReceiveAsync(seg, token);
+            if (recv.MessageType == WebSocketMessageType.Close) return false;
+            var n = decoder.GetChars(buf, 0, recv.Count, chars, 0, recv.EndOfMessage);
+            Message.Append(chars, 0, n);
+        } while (!recv.EndOfMessage);
+        return true;
+    }
+}
+
 public class CDPRelay
 {
     public static void Run(string wsUrl)
+    {
+        RunAsync(wsUrl).GetAwaiter().GetResult();
+    }
+
+    static async Task RunAsync(string wsUrl)
     {
         var ws = new ClientWebSocket();
         ws.Options.KeepAliveInterval = TimeSpan.FromSeconds(30);
         var cts = new CancellationTokenSource();
-        var token = cts.Token;
 
         try
         {
-            ws.ConnectAsync(new Uri(wsUrl), token).GetAwaiter().GetResult();
+            await ws.ConnectAsync(new Uri(wsUrl), cts.Token);
             Console.Error.WriteLine("CONNECTED");
             Console.Error.Flush();
 
-            // WebSocket -> stdout (background)
-            var reader = Task.Run(() =>
+            await Task.WhenAll(ReaderLoop(ws, cts.Token), WriterLoop(ws, cts));
+        }
+        catch (Exception ex)
+        {
+            Console.Error.WriteLine("FATAL:" + ex.Message);
+            Console.Error.Flush();
+        }
+        finally
+        {
+            if (ws.State == WebSocketState.Open)
             {
-                var buf = new byte[4 * 1024 * 1024];
                 try
                 {
-                    while (ws.State == WebSocketState.Open && !token.IsCancellationRequested)
-                    {
-                        var sb = new StringBuilder();
-                        WebSocketReceiveResult recv;
-                        do
-                        {
-                            var seg = new ArraySegment<byte>(buf);
-                            recv = ws.ReceiveAsync(seg, token).GetAwaiter().GetResult();
-                            if (recv.MessageType == WebSocketMessageType.Close) return;
-                            sb.Append(Encoding.UTF8.GetString(buf, 0, recv.Count));
-                        } while (!recv.EndOfMessage);
-
-                        Console.Out.WriteLine(sb.ToString());
-                        Console.Out.Flush();
-                    }
+                    ws.CloseAsync(
+                        WebSocketCloseStatus.NormalClosure, "",
+                        CancellationToken.None
+                    ).GetAwaiter().GetResult();
                 }
-                catch (OperationCanceledException) { }
-                catch (Exception ex)
+                catch { }
+            }
+            ws.Dispose();
+        }
+    }
+
+    // WebSocket -> stdout.  Awaits completions instead of parking a thread.
+    static async Task ReaderLoop(ClientWebSocket ws, CancellationToken token)
+    {
+        var frames = new FrameReader(ws);
+        try
+        {
+            while (ws.State == WebSocketState.Open && !token.IsCancellationRequested)
+            {
+                if (!await frames.ReceiveAsync(token)) return;
+                Console.Out.WriteLine(frames.Message.ToString());
+                Console.Out.Flush();
+            }
+        }
+        catch (OperationCanceledException) { }
+        catch (Exception ex)
+        {
+            Console.Error.WriteLine("READER_ERROR:" + ex.Message);
+            Console.Error.Flush();
+        }
+    }
+
+    // stdin -> WebSocket.  Cancels the reader once stdin reaches EOF.
+    static async Task WriterLoop(ClientWebSocket ws, CancellationTokenSource cts)
+    {
+        string line;
+        while ((line = await Console.In.ReadLineAsync()) != null)
+        {
+            if (ws.State != WebSocketState.Open) break;
+            var seg = new ArraySegment<byte>(Encoding.UTF8.GetBytes(line));
+            await ws.SendAsync(seg, WebSocketMessageType.Text, true, cts.Token);
+        }
+        cts.Cancel();
+    }
+}
+
+// Multiplexed relay: one process, many WebSockets keyed by channel id.
+//   stdin  {"__mux":"open","id":N,"url":"ws://..."}  -> connect channel N
+//   stdin  {"__mux":"close","id":N}                  -> close channel N
+//   stdin  {"__mux_ch":N,<cdp fields>}               -> send {<cdp fields>} on N
+//   stdout {"__mux":"opened"|"error"|"closed","id":N[,"message":"..."]}
+//   stdout {"__mux_ch":N,<cdp fields>}               -> frame received on N
+public class CDPMuxRelay
+{
+    static readonly ConcurrentDictionary<int, ClientWebSocket> Channels =
+        new ConcurrentDictionary<int, ClientWebSocket>();
+    static readonly object OutLock = new object();
+    static readonly Regex ChannelRe = new Regex("^\\{\"__mux_ch\":(\\d+),");
+    static readonly Regex ControlRe = new Regex(
+        "^\\{\"__mux\":\"(open|close)\",\"id\":(\\d+)(?:,\"url\":\"([^\"]*)\")?\\}$");
+
+    static void Emit(string line)
+    {
+        lock (OutLock)
+        {
+            Console.Out.WriteLine(line);
+            Console.Out.Flush();
+        }
+    }
+
+    static void EmitControl(string kind, int id, string message)
+    {
+        var line = "{\"__mux\":\"" + kind + "\",\"id\":" + id;
+        if (message != null)
+        {
+            var escaped = message.Replace("\\", "\\\\").Replace("\"", "\\\"")
+                .Replace("\r", " ").Replace("\n", " ");
+            line += ",\"message\":\"" + escaped + "\"";
+        }
+        Emit(line + "}");
+    }
+
+    public static void Run()
+    {
+        var cts = new CancellationTokenSource();
+
+        // Dedicated stdin thread: the dispatch loop drains everything that
+        // is already queued and sends it as one batch.
+        var queue = new BlockingCollection<string>();
+        var stdinThread = new Thread(() =>
+        {
+            string input;
+            while ((input = Console.In.ReadLine()) != null) queue.Add(input);
+            queue.CompleteAdding();
+        });
+        stdinThread.IsBackground = true;
+        stdinThread.Start();
+
+        Console.Error.WriteLine("READY");
+        Console.Error.Flush();
+
+        var pending = new Dictionary<int, List<byte[]>>();
+        string line;
+        while (queue.TryTake(out line, Timeout.Infinite))
+        {
+            do
+            {
+                var ch = ChannelRe.Match(line);
+                if (ch.Success)
                 {
-                    Console.Error.WriteLine("READER_ERROR:" + ex.Message);
-                    Console.Error.Flush();
+                    var id = int.Parse(ch.Groups[1].Value);
+                    List<byte[]> frames;
+                    if (!pending.TryGetValue(id, out frames))
+                    {
+                        frames = new List<byte[]>();
+                        pending[id] = frames;
+                    }
+                    frames.Add(Encoding.UTF8.GetBytes("{" + line.Substring(ch.Length)));
+                    continue;
                 }
-            }, token);
 
-            // stdin -> WebSocket (main thread)
-            string line;
-            while ((line = Console.In.ReadLine()) != null)
+                var ctl = ControlRe.Match(line);
+                if (!ctl.Success) continue;
+                // Keep control frames ordered with respect to queued sends.
+                Flush(pending, cts.Token);
+                var cid = int.Parse(ctl.Groups[2].Value);
+                if (ctl.Groups[1].Value == "open") OpenAsync(cid, ctl.Groups[3].Value, cts.Token);
+                else Close(cid);
+            } while (queue.TryTake(out line));
+
+            Flush(pending, cts.Token);
+        }
+
+        cts.Cancel();
+        foreach (var id in Channels.Keys) Close(id);
+    }
+
+    // One CDP command per WebSocket message: frames for a channel go out in
+    // order, while different channels send concurrently.
+    static void Flush(Dictionary<int, List<byte[]>> pending, CancellationToken token)
+    {
+        if (pending.Count == 0) return;
+        var sends = new List<Task>();
+        foreach (var entry in pending)
+        {
+            ClientWebSocket ws;
+            if (!Channels.TryGetValue(entry.Key, out ws)) continue;
+            if (ws.State != WebSocketState.Open) continue;
+            sends.Add(SendAll(entry.Key, ws, entry.Value, token));
+        }
+        pending.Clear();
+        Task.WaitAll(sends.ToArray());
+    }
+
+    static async Task SendAll(
+        int id, ClientWebSocket ws, List<byte[]> frames, CancellationToken token)
+    {
+        try
+        {
+            foreach (var bytes in frames)
             {
-                if (ws.State != WebSocketState.Open) break;
-                var bytes = Encoding.UTF8.GetBytes(line);
                 var seg = new ArraySegment<byte>(bytes);
-                ws.SendAsync(seg, WebSocketMessageType.Text, true, token)
-                    .GetAwaiter().GetResult();
+                await ws.SendAsync(seg, WebSocketMessageType.Text, true, token);
             }
+        }
+        catch (Exception ex)
+        {
+            Console.Error.WriteLine("SEND_ERROR:" + id + ":" + ex.Message);
+            Console.Error.Flush();
+        }
+    }
 
-            cts.Cancel();
-            reader.Wait(TimeSpan.FromSeconds(2));
+    // Runs for the lifetime of the channel without holding a pool thread:
+    // every receive is awaited, so idle sockets cost no threads.
+    static async Task OpenAsync(int id, string url, CancellationToken token)
+    {
+        var ws = new ClientWebSocket();
+        ws.Options.KeepAliveInterval = TimeSpan.FromSeconds(30);
+        try
+        {
+            await ws.ConnectAsync(new Uri(url), token);
         }
         catch (Exception ex)
         {
-            Console.Error.WriteLine("FATAL:" + ex.Message);
+            ws.Dispose();
+            EmitControl("error", id, ex.Message);
+            return;
+        }
+
+        Channels[id] = ws;
+        EmitControl("opened", id, null);
+
+        var prefix = "{\"__mux_ch\":" + id + ",";
+        var frames = new FrameReader(ws);
+        try
+        {
+            while (ws.State == WebSocketState.Open && !token.IsCancellationRequested)
+            {
+                if (!await frames.ReceiveAsync(token)) return;
+                // Every CDP frame is a JSON object: splice the channel tag in.
+                Emit(frames.Message.Remove(0, 1).Insert(0, prefix).ToString());
+            }
+        }
+        catch (OperationCanceledException) { }
+        catch (Exception ex)
+        {
+            Console.Error.WriteLine("READER_ERROR:" + id + ":" + ex.Message);
             Console.Error.Flush();
         }
         finally
+        {
+            ClientWebSocket removed;
+            if (Channels.TryRemove(id, out removed)) removed.Dispose();
+            EmitControl("closed", id, null);
+        }
+    }
+
+    static void Close(int id)
+    {
+        ClientWebSocket ws;
+        if (!Channels.TryRemove(id, out ws)) return;
+        try
         {
             if (ws.State == WebSocketState.Open)
             {
-                try
-                {
-                    ws.CloseAsync(
-                        WebSocketCloseStatus.NormalClosure, "",
-                        CancellationToken.None
-                    ).GetAwaiter().GetResult();
-                }
-                catch { }
+                ws.CloseAsync(WebSocketCloseStatus.NormalClosure, "", CancellationToken.None)
+                    .Wait(TimeSpan.FromSeconds(2));
             }
-            ws.Dispose();
         }
+        catch { }
+        ws.Dispose();
     }
 }
 """
 
 
+# On .NET Framework, ClientWebSocket's socket comes from a ServicePoint, which
+# keeps Nagle on by default: with delayed ACKs, every small CDP frame can sit
+# in the send buffer for tens of ms.  Must run before the first connect.
+_DISABLE_NAGLE_PS = "[System.Net.ServicePointManager]::UseNagleAlgorithm = $false"
+
+
 def _build_relay_script(ws_url: str) -> str:
     escaped_url = ws_url.replace("'", "''")
     return f"""$ErrorActionPreference = 'Stop'
+{_DISABLE_NAGLE_PS}
 Add-Type -TypeDefinition @'
 {_RELAY_CSHARP}
 '@
@@ -130,10 +378,347 @@ Add-Type -TypeDefinition @'
 """
 
 
+def _build_mux_script() -> str:
+    return f"""$ErrorActionPreference = 'Stop'
+{_DISABLE_NAGLE_PS}
+Add-Type -TypeDefinition @'
+{_RELAY_CSHARP}
+'@
+[CDPMuxRelay]::Run()
+"""
+
+
+# Use 16MB buffer limit to handle large CDP messages (accessibility trees,
+# full-page DOM snapshots, etc.).  The asyncio default is 64KB which causes
+# "Separator is not found, and chunk exceed the limit" errors on
+# content-heavy pages like google.com.
+_STREAM_LIMIT = 16 * 1024 * 1024  # 16 MB
+
+
+async def _spawn_relay_process(script_content: str) -> tuple[asyncio.subprocess.Process, str]:
+    """Write a relay script to a temp file and start powershell.exe on it.
+
+    Returns:
+        The running process and the WSL path of the script (caller unlinks).
+    """
+    powershell = _find_windows_executable("powershell.exe")
+    if not powershell:
+        raise RuntimeError("powershell.exe not found")
+
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        suffix=".ps1",
+        prefix="cdp_relay_",
+        dir="/tmp",
+        delete=False,
+    ) as tmp:
+        tmp.write(script_content)
+        script_path = tmp.name
+
+    win_script_path = convert_wsl_to_windows_path(script_path)
+    process = await asyncio.create_subprocess_exec(
+        powershell,
+        "-NoProfile",
+        "-NonInteractive",
+        "-ExecutionPolicy",
+        "Bypass",
+        "-File",
+        win_script_path,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        limit=_STREAM_LIMIT,
+    )
+    return process, script_path
+
+
+async def _wait_for_stderr_signal(process: asyncio.subprocess.Process, signal: str) -> bool:
+    """Read relay stderr until ``signal`` (True) or a FATAL/EOF (False)."""
+    assert process.stderr
+    while True:
+        line = await process.stderr.readline()
+        if not line:
+            return False
+        text = line.decode("utf-8", errors="replace").strip()
+        if text == signal:
+            return True
+        if text.startswith("FATAL:"):
+            logger.error("Relay fatal: %s", text)
+            return False
+
+
+# Pipe writes up to PIPE_BUF are atomic: all or nothing, never a torn frame.
+_PIPE_BUF = getattr(select, "PIPE_BUF", 0)
+
+
+def _stdin_fileno(process: asyncio.subprocess.Process) -> int | None:
+    """Return the raw fd behind a relay's stdin transport, if there is one."""
+    if not process.stdin:
+        return None
+    pipe = process.stdin.transport.get_extra_info("pipe")
+    try:
+        fd = pipe.fileno() if pipe is not None else None
+    except (AttributeError, OSError, ValueError):
+        return None
+    return fd if isinstance(fd, int) else None
+
+
+async def _write_stdin(stdin: asyncio.StreamWriter, fd: int | None, data: bytes) -> None:
+    """Write a frame to a relay's stdin.
+
+    Small frames go straight to the pipe with one ``os.write``, skipping the
+    transport buffer and drain() round-trip.  That path is only taken when
+    the transport has nothing queued, so frames are never reordered.
+    """
+    if fd is not None and len(data) <= _PIPE_BUF and not stdin.transport.get_write_buffer_size():
+        try:
+            os.write(fd, data)
+            return
+        except BlockingIOError:
+            pass  # pipe full: queue behind the transport instead
+    stdin.write(data)
+    await stdin.drain()
+
+
+async def _drain_stderr(process: asyncio.subprocess.Process) -> None:
+    """Consume relay stderr so the pipe never fills, logging it at DEBUG.
+
+    Decoding is skipped entirely unless DEBUG logging is enabled.
+    """
+    assert process.stderr
+    try:
+        while True:
+            line = await process.stderr.readline()
+            if not line:
+                break
+            if logger.isEnabledFor(logging.DEBUG):
+                text = line.decode("utf-8", errors="replace").strip()
+                if text:
+                    logger.debug("Relay stderr: %s", text)
+    except asyncio.CancelledError:
+        pass
+
+
+async def _terminate_process(process: asyncio.subprocess.Process) -> None:
+    try:
+        if process.stdin:
+            process.stdin.close()
+        process.terminate()
+        await asyncio.wait_for(process.wait(), timeout=5.0)
+    except (asyncio.TimeoutError, ProcessLookupError):
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+
+
+class _MuxClient:
+    """Shared PowerShell process carrying one WebSocket channel per relay.
+
+    Lines on stdout are routed to the owning PowerShellCDPRelay by the
+    ``__mux_ch`` tag; ``__mux`` control frames acknowledge channel opens
+    and report closes.
+    """
+
+    def __init__(self) -> None:
+        self._process: asyncio.subprocess.Process | None = None
+        self._script_path: str | None = None
+        self._channels: dict[int, PowerShellCDPRelay] = {}
+        self._opening: dict[int, asyncio.Future[None]] = {}
+        self._next_channel = 0
+        self._receive_task: asyncio.Task[None] | None = None
+        self._stderr_task: asyncio.Task[None] | None = None
+        self._stdin_fd: int | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def start(self) -> None:
+        self._process, self._script_path = await _spawn_relay_process(_build_mux_script())
+        logger.debug("Starting multiplexed PowerShell CDP relay")
+        try:
+            ready = await asyncio.wait_for(
+                _wait_for_stderr_signal(self._process, "READY"),
+                timeout=30.0,
+            )
+        except asyncio.TimeoutError:
+            ready = False
+        if not ready:
+            await self.close()
+            raise ConnectionError("Multiplexed PowerShell relay failed to start")
+
+        self._stdin_fd = _stdin_fileno(self._process)
+        self._receive_task = asyncio.create_task(self._receive_loop())
+        self._stderr_task = asyncio.create_task(_drain_stderr(self._process))
+        logger.info("Multiplexed PowerShell CDP relay started")
+
+    async def open_channel(self, relay: PowerShellCDPRelay, timeout: float = 30.0) -> int:
+        """Open a WebSocket to ``relay.ws_url`` inside the shared process.
+
+        Returns:
+            The channel id assigned to the relay.
+        """
+        self._next_channel += 1
+        channel = self._next_channel
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._opening[channel] = future
+        self._channels[channel] = relay
+        try:
+            await self.write(
+                json.dumps(
+                    {"__mux": "open", "id": channel, "url": relay.ws_url},
+                    separators=(",", ":"),
+                ).encode("utf-8")
+                + b"\n"
+            )
+            await asyncio.wait_for(future, timeout=timeout)
+        except BaseException:
+            self._channels.pop(channel, None)
+            self._opening.pop(channel, None)
+            raise
+        return channel
+
+    async def close_channel(self, channel: int) -> None:
+        self._channels.pop(channel, None)
+        if self.is_running:
+            with contextlib.suppress(Exception):
+                await self.write(b'{"__mux":"close","id":%d}\n' % channel)
+
+    async def write(self, data: bytes) -> None:
+        if not self.is_running or not self._process or not self._process.stdin:
+            raise ConnectionError("Multiplexed relay not running")
+        await _write_stdin(self._process.stdin, self._stdin_fd, data)
+
+    async def close(self) -> None:
+        for task in (self._receive_task, self._stderr_task):
+            if task and task is not asyncio.current_task():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._receive_task = None
+        self._stderr_task = None
+
+        self._fail_all_channels("Multiplexed relay stopped")
+
+        if self._process:
+            await _terminate_process(self._process)
+            self._process = None
+        self._stdin_fd = None
+        if self._script_path:
+            with contextlib.suppress(OSError):
+                os.unlink(self._script_path)
+            self._script_path = None
+
+    def _fail_all_channels(self, reason: str) -> None:
+        for future in self._opening.values():
+            if not future.done():
+                future.set_exception(ConnectionError(reason))
+        self._opening.clear()
+        for relay in self._channels.values():
+            relay._channel_closed(reason)
+        self._channels.clear()
+
+    async def _receive_loop(self) -> None:
+        global _mux_client
+        assert self._process and self._process.stdout
+        try:
+            while True:
+                line = await self._process.stdout.readline()
+                if not line:
+                    logger.warning("Multiplexed relay stdout closed")
+                    break
+                head = _FRAME_HEAD_RE.match(line)
+                if head and head.group(1) is not None:
+                    relay = self._channels.get(int(head.group(1)))
+                    if relay is None or not relay._wants_frame(head):
+                        continue
+                try:
+                    data = decode_message(line)
+                except json.JSONDecodeError as e:
+                    logger.warning("Invalid JSON from relay: %s", e)
+                    continue
+                channel = data.pop("__mux_ch", None)
+                if channel is not None:
+                    relay = self._channels.get(channel)
+                    if relay is not None:
+                        await relay._handle_message(data)
+                elif "__mux" in data:
+                    self._handle_control(data)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            logger.error("Multiplexed relay receive error: %s", e)
+
+        # Process is gone: let the next connect respawn, fail every channel and
+        # reap the process, its stderr reader and its script.
+        if _mux_client is self:
+            _mux_client = None
+        self._fail_all_channels("Multiplexed relay exited")
+        await self.close()
+
+    def _handle_control(self, data: dict[str, Any]) -> None:
+        kind = data["__mux"]
+        channel: int = data["id"]
+        if kind == "opened":
+            future = self._opening.pop(channel, None)
+            if future and not future.done():
+                future.set_result(None)
+        elif kind == "error":
+            message = data.get("message", "unknown error")
+            future = self._opening.pop(channel, None)
+            if future and not future.done():
+                future.set_exception(ConnectionError(f"Relay channel failed: {message}"))
+        elif kind == "closed":
+            relay = self._channels.pop(channel, None)
+            if relay is not None:
+                relay._channel_closed("Relay channel closed by browser")
+
+
+_mux_client: _MuxClient | None = None
+_mux_lock: asyncio.Lock | None = None
+# After a failed start, connects go straight to a dedicated relay until this
+# monotonic deadline instead of waiting out the startup timeout again.
+_mux_retry_at = 0.0
+_MUX_RETRY_BACKOFF = 60.0
+
+
+async def _get_mux_client() -> _MuxClient:
+    """Return the shared relay process, starting it on first use."""
+    global _mux_client, _mux_lock, _mux_retry_at
+    if _mux_client is not None and _mux_client.is_running:
+        return _mux_client
+    if _mux_lock is None:
+        _mux_lock = asyncio.Lock()
+    async with _mux_lock:
+        if _mux_client is None or not _mux_client.is_running:
+            if time.monotonic() < _mux_retry_at:
+                raise ConnectionError("Multiplexed relay failed to start recently")
+            client = _MuxClient()
+            try:
+                await client.start()
+            except Exception:
+                _mux_retry_at = time.monotonic() + _MUX_RETRY_BACKOFF
+                raise
+            _mux_client = client
+        return _mux_client
+
+
+async def shutdown_mux_relay() -> None:
+    """Stop the shared relay process, closing every channel it carries."""
+    global _mux_client, _mux_lock, _mux_retry_at
+    client, _mux_client = _mux_client, None
+    # The lock binds to the running loop; a later loop needs a fresh one.
+    _mux_lock = None
+    _mux_retry_at = 0.0
+    if client is not None:
+        await client.close()
+
+
 class PowerShellCDPRelay:
     """CDP client relaying commands through a persistent PowerShell WebSocket.
 
     Drop-in replacement for PersistentCDPClient when direct TCP is blocked.
+    Connections ride a channel of the shared multiplexed relay process; if
+    that process cannot be started, a dedicated relay process is used.
     """
 
     def __init__(self, ws_url: str, timeout: float = 30.0) -> None:
@@ -141,100 +726,91 @@ class PowerShellCDPRelay:
         self.timeout = timeout
 
         self._process: asyncio.subprocess.Process | None = None
+        self._mux: _MuxClient | None = None
+        self._channel: int | None = None
         self._message_id = 0
         self._pending: dict[int, asyncio.Future[Any]] = {}
-        self._event_handlers: dict[str, list[EventHandler]] = {}
+        self._event_handlers: EventHandlerMap = {}
         self._receive_task: asyncio.Task[None] | None = None
         self._stderr_task: asyncio.Task[None] | None = None
         self._connected = False
         self._script_path: str | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._frame_head = b'{"id":'
+        self._stdin_fd: int | None = None
 
     @property
     def is_connected(self) -> bool:
-        return self._connected and self._process is not None
+        return self._connected and (self._process is not None or self._mux is not None)
 
     async def connect(self) -> None:
         if self._connected:
             return
+        self._loop = asyncio.get_running_loop()
 
-        powershell = _find_windows_executable("powershell.exe")
-        if not powershell:
-            raise RuntimeError("powershell.exe not found")
-
-        script_content = _build_relay_script(self.ws_url)
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".ps1",
-            prefix="cdp_relay_",
-            dir="/tmp",
-            delete=False,
-        ) as tmp:
-            tmp.write(script_content)
-            self._script_path = tmp.name
+        try:
+            mux = await _get_mux_client()
+        except Exception as e:
+            logger.warning("Multiplexed relay unavailable (%s); using dedicated process", e)
+            await self._connect_dedicated()
+            return
 
-        win_script_path = convert_wsl_to_windows_path(self._script_path)
+        self._channel = await mux.open_channel(self)
+        self._mux = mux
+        self._frame_head = b'{"__mux_ch":%d,"id":' % self._channel
+        self._connected = True
+        logger.info("PowerShell CDP relay channel %d connected: %s", self._channel, self.ws_url)
 
+    async def _connect_dedicated(self) -> None:
         logger.debug("Starting PowerShell CDP relay for %s", self.ws_url)
-
-        # Use 16MB buffer limit to handle large CDP messages (accessibility
-        # trees, full-page DOM snapshots, etc.).  The asyncio default is 64KB
-        # which causes "Separator is not found, and chunk exceed the limit"
-        # errors on content-heavy pages like google.com.
-        buf_limit = 16 * 1024 * 1024  # 16 MB
-
-        self._process = await asyncio.create_subprocess_exec(
-            powershell,
-            "-NoProfile",
-            "-NonInteractive",
-            "-ExecutionPolicy",
-            "Bypass",
-            "-File",
-            win_script_path,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            limit=buf_limit,
+        self._process, self._script_path = await _spawn_relay_process(
+            _build_relay_script(self.ws_url)
         )
 
         try:
             connected = await asyncio.wait_for(
-                self._wait_for_connected(),
+                _wait_for_stderr_signal(self._process, "CONNECTED"),
                 timeout=30.0,
             )
             if not connected:
+                await self._kill_process()
                 raise ConnectionError("PowerShell relay failed to connect")
         except asyncio.TimeoutError as err:
             await self._kill_process()
             raise ConnectionError("PowerShell relay timed out connecting") from err
 
         self._connected = True
+        self._stdin_fd = _stdin_fileno(self._process)
         self._receive_task = asyncio.create_task(self._receive_loop())
-        self._stderr_task = asyncio.create_task(self._stderr_loop())
+        self._stderr_task = asyncio.create_task(_drain_stderr(self._process))
         logger.info("PowerShell CDP relay connected: %s", self.ws_url)
 
-    async def _wait_for_connected(self) -> bool:
-        assert self._process and self._process.stderr
-        while True:
-            line = await self._process.stderr.readline()
-            if not line:
-                return False
-            text = line.decode("utf-8", errors="replace").strip()
-            if text == "CONNECTED":
-                return True
-            if text.startswith("FATAL:"):
-                logger.error("Relay fatal: %s", text)
-                return False
+    def _channel_closed(self, reason: str) -> None:
+        """Called by the mux client when this relay's channel goes away."""
+        self._connected = False
+        self._mux = None
+        self._channel = None
+        self._fail_pending(reason)
+
+    def _fail_pending(self, reason: str) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError(reason))
+        self._pending.clear()
 
     async def disconnect(self) -> None:
         if not self._connected:
             return
 
         self._connected = False
+        self._fail_pending("Relay disconnected")
 
-        for future in self._pending.values():
-            if not future.done():
-                future.set_exception(ConnectionError("Relay disconnected"))
-        self._pending.clear()
+        if self._mux is not None and self._channel is not None:
+            await self._mux.close_channel(self._channel)
+            self._mux = None
+            self._channel = None
+            logger.info("PowerShell CDP relay channel disconnected")
+            return
 
         if self._receive_task:
             self._receive_task.cancel()
@@ -249,24 +825,18 @@ class PowerShellCDPRelay:
             self._stderr_task = None
 
         await self._kill_process()
-
-        if self._script_path:
-            with contextlib.suppress(OSError):
-                os.unlink(self._script_path)
-            self._script_path = None
-
         logger.info("PowerShell CDP relay disconnected")
 
     async def _kill_process(self) -> None:
         if self._process:
-            try:
-                if self._process.stdin:
-                    self._process.stdin.close()
-                self._process.terminate()
-                await asyncio.wait_for(self._process.wait(), timeout=5.0)
-            except (asyncio.TimeoutError, ProcessLookupError):
-                self._process.kill()
+            await _terminate_process(self._process)
             self._process = None
+        self._stdin_fd = None
+
+        if self._script_path:
+            with contextlib.suppress(OSError):
+                os.unlink(self._script_path)
+            self._script_path = None
 
     async def send(
         self,
@@ -274,24 +844,24 @@ class PowerShellCDPRelay:
         params: dict[str, Any] | None = None,
         timeout: float | None = None,
     ) -> dict[str, Any]:
-        if not self._connected or not self._process or not self._process.stdin:
+        if not self.is_connected or not self._loop:
             raise ConnectionError("Relay not connected")
 
         self._message_id += 1
         msg_id = self._message_id
 
-        message: dict[str, Any] = {"id": msg_id, "method": method}
-        if params:
-            message["params"] = params
-
-        future: asyncio.Future[Any] = asyncio.get_event_loop().create_future()
+        future: asyncio.Future[Any] = self._loop.create_future()
         self._pending[msg_id] = future
 
         try:
-            line = json.dumps(message, separators=(",", ":")) + "\n"
-            self._process.stdin.write(line.encode("utf-8"))
-            await self._process.stdin.drain()
-            return await asyncio.wait_for(future, timeout=timeout or self.timeout)
+            frame = self._encode_frame(msg_id, method, params)
+            if self._mux is not None:
+                await self._mux.write(frame)
+            else:
+                assert self._process and self._process.stdin
+                await _write_stdin(self._process.stdin, self._stdin_fd, frame)
+            result: dict[str, Any] = await await_response(future, timeout or self.timeout)
+            return result
         except asyncio.TimeoutError as err:
             self._pending.pop(msg_id, None)
             raise asyncio.TimeoutError(f"Timeout waiting for {method}") from err
@@ -299,18 +869,30 @@ class PowerShellCDPRelay:
             self._pending.pop(msg_id, None)
             raise
 
+    def _encode_frame(self, msg_id: int, method: str, params: dict[str, Any] | None) -> bytes:
+        """Serialise one command line for the relay's stdin.
+
+        The frame head (mux channel tag) and the per-method tail are
+        precomputed, so only the id and params are formatted per call.
+        """
+        tail = _METHOD_FRAME_TAILS.get(method)
+        if tail is None:
+            tail = _METHOD_FRAME_TAILS[method] = b',"method":' + json.dumps(method).encode()
+        head = self._frame_head
+        if not params:
+            return b"%s%d%s}\n" % (head, msg_id, tail)
+        # ASCII-only JSON: Console.In decodes stdin with the OEM code page.
+        body = json.dumps(params, separators=(",", ":")).encode()
+        return b'%s%d%s,"params":%s}\n' % (head, msg_id, tail, body)
+
     def on(self, event: str, handler: EventHandler) -> None:
-        if event not in self._event_handlers:
-            self._event_handlers[event] = []
-        self._event_handlers[event].append(handler)
+        self._event_handlers.setdefault(event, {})[handler] = None
 
     def off(self, event: str, handler: EventHandler | None = None) -> None:
-        if event not in self._event_handlers:
-            return
         if handler is None:
-            del self._event_handlers[event]
-        else:
-            self._event_handlers[event] = [h for h in self._event_handlers[event] if h != handler]
+            self._event_handlers.pop(event, None)
+        elif event in self._event_handlers:
+            self._event_handlers[event].pop(handler, None)
 
     async def _receive_loop(self) -> None:
         assert self._process and self._process.stdout
@@ -321,8 +903,11 @@ class PowerShellCDPRelay:
                     logger.warning("Relay stdout closed")
                     self._connected = False
                     break
+                head = _FRAME_HEAD_RE.match(line)
+                if head and not self._wants_frame(head):
+                    continue
                 try:
-                    data = json.loads(line)
+                    data = decode_message(line)
                     await self._handle_message(data)
                 except json.JSONDecodeError as e:
                     logger.warning("Invalid JSON from relay: %s", e)
@@ -332,18 +917,12 @@ class PowerShellCDPRelay:
             logger.error("Relay receive error: %s", e)
             self._connected = False
 
-    async def _stderr_loop(self) -> None:
-        assert self._process and self._process.stderr
-        try:
-            while self._connected:
-                line = await self._process.stderr.readline()
-                if not line:
-                    break
-                text = line.decode("utf-8", errors="replace").strip()
-                if text:
-                    logger.debug("Relay stderr: %s", text)
-        except asyncio.CancelledError:
-            pass
+    def _wants_frame(self, head: re.Match[bytes]) -> bool:
+        """Whether a frame is worth decoding: a pending reply or a handled event."""
+        msg_id = head.group(2)
+        if msg_id is not None:
+            return int(msg_id) in self._pending
+        return bool(self._event_handlers.get(head.group(3).decode("ascii")))
 
     async def _handle_message(self, data: dict[str, Any]) -> None:
         if "id" in data:
@@ -361,11 +940,4 @@ class PowerShellCDPRelay:
             await self._dispatch_event(data["method"], data.get("params", {}))
 
     async def _dispatch_event(self, event: str, params: dict[str, Any]) -> None:
-        handlers = self._event_handlers.get(event, [])
-        for handler in handlers:
-            try:
-                result = handler(params)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                logger.warning("Event handler error for %s: %s", event, e)
+        await dispatch_event_handlers(event, self._event_handlers.get(event), params)
@@ -10,9 +10,11 @@ with backwards-compatible aliases for old names (chrome_navigate, chrome_click,
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import logging
-from collections.abc import Sequence
-from typing import Any
+from collections.abc import Awaitable, Callable, Coroutine, Sequence
+from typing import Any, TypeVar
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -23,17 +25,22 @@ from mcp.types import (
     Tool,
 )
 
+from .cdp_proxy import CDPProxyClient
 from .chrome_pool import ChromeInstance, ChromePoolManager
 from .config import load_config
 from .logging_config import setup_logging
-from .tools import get_all_tools, get_tool
-from .tools.base import ContentResult
+from .persistent_cdp import CDPClientProtocol, CDPError
+from .stdio_writer import CoalescingStdout
+from .tools import get_all_tools
+from .tools.base import ContentResult, ToolHandler
 from .wsl import get_windows_host_ip, is_wsl
 
 # Configure logging
 setup_logging()
 logger = logging.getLogger("wsl-chrome-mcp")
 
+_T = TypeVar("_T")
+
 # session_id property shared across all tool schemas
 SESSION_ID_PROPERTY = {
     "session_id": {
@@ -67,6 +74,26 @@ TOOL_ALIASES = {
 # at server level, not inside tool handler)
 SESSION_DESTROY_TOOL = "chrome_session_end"
 
+# Tool whose "url" argument is opened directly when it creates the session
+SESSION_START_TOOL = "chrome_session_start"
+
+# MCP tool definitions, built once: the registry is complete after importing
+# .tools, so tools/list just copies this tuple.
+MCP_TOOLS: tuple[Tool, ...] = tuple(
+    tool_def.to_mcp_tool(SESSION_ID_PROPERTY) for tool_def in get_all_tools()
+)
+
+# Jump table from every accepted tool name (including aliases) to its handler,
+# so call_tool resolves a tool with one dict lookup.
+TOOL_HANDLERS: dict[str, ToolHandler] = {t.name: t.handler for t in get_all_tools()}
+TOOL_HANDLERS.update(
+    {
+        alias: TOOL_HANDLERS[target]
+        for alias, target in TOOL_ALIASES.items()
+        if target in TOOL_HANDLERS
+    }
+)
+
 
 class ToolContextImpl:
     """Implementation of ToolContext for tool handlers.
@@ -75,6 +102,9 @@ class ToolContextImpl:
     plus CDP and JS evaluation helpers.
     """
 
+    # Built for every tool call; slots keep it to two pointers
+    __slots__ = ("_instance", "_pool")
+
     def __init__(
         self,
         instance: ChromeInstance,
@@ -101,10 +131,90 @@ class ToolContextImpl:
             except Exception as e:
                 logger.warning("Persistent CDP send failed, falling back to proxy: %s", e)
 
-        if not self._instance.proxy:
+        proxy = self._instance.proxy
+        if not proxy:
+            raise RuntimeError("No CDP connection available (no proxy)")
+
+        return await self._with_page_ws_url(
+            proxy, lambda ws_url: proxy.send_cdp_command(ws_url, method, params)
+        )
+
+    async def send_cdp_batch(
+        self, commands: list[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Send several CDP commands back-to-back and return their results in order.
+
+        On the persistent connection every command is written before any reply
+        is awaited; the proxy fallback sends them all over one WebSocket. Only
+        commands that never reached the persistent socket go to the proxy: a
+        command already written may have run, so a failure after that is raised
+        rather than replayed.
+        """
+        done: list[dict[str, Any]] = []
+        pending = commands
+        cdp = self._instance.cdp
+        if cdp and self._instance.is_connected:
+            done = await self._pipeline_persistent(cdp, commands)
+            if len(done) == len(commands):
+                return done
+            pending = commands[len(done) :]
+            logger.warning(
+                "Persistent CDP dropped before %d of %d batched commands, sending them via proxy",
+                len(pending),
+                len(commands),
+            )
+
+        proxy = self._instance.proxy
+        if not proxy:
             raise RuntimeError("No CDP connection available (no proxy)")
 
-        all_targets = await self._instance.proxy.list_targets()
+        return done + await self._with_page_ws_url(
+            proxy, lambda ws_url: proxy.send_cdp_batch(ws_url, pending)
+        )
+
+    async def _pipeline_persistent(
+        self, cdp: CDPClientProtocol, commands: list[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Write commands on the persistent client, stopping once it disconnects.
+
+        Returns:
+            Results for the leading commands that were sent; the rest were not.
+        """
+        results: list[dict[str, Any]] = [{} for _ in commands]
+        sent = 0
+
+        async def send_one(index: int, method: str, params: dict[str, Any] | None) -> None:
+            nonlocal sent
+            # Sends start in batch order, so the written commands form a prefix
+            if index != sent or not cdp.is_connected:
+                return
+            sent += 1
+            results[index] = await cdp.send(method, params)
+
+        await asyncio.gather(
+            *(send_one(index, method, params) for index, (method, params) in enumerate(commands))
+        )
+        return results[:sent]
+
+    async def _with_page_ws_url(
+        self, proxy: CDPProxyClient, send: Callable[[str], Awaitable[_T]]
+    ) -> _T:
+        """Run a proxy send against the current page, re-resolving a stale URL once."""
+        target_id = self._instance.current_target_id
+        ws_url = self._instance.ws_url_cache.get(target_id) if target_id else None
+        if target_id and ws_url:
+            try:
+                return await send(ws_url)
+            except ConnectionError as e:
+                # Target went away: forget its URL and re-resolve below
+                self._instance.ws_url_cache.pop(target_id, None)
+                logger.debug("Cached WebSocket URL for %s failed: %s", target_id, e)
+
+        return await send(await self._resolve_page_ws_url(proxy))
+
+    async def _resolve_page_ws_url(self, proxy: CDPProxyClient) -> str:
+        """Find the current page target over HTTP and cache its WebSocket URL."""
+        all_targets = await proxy.list_targets()
         page_targets = [t for t in all_targets if t.get("type") == "page"]
 
         exact_match = next(
@@ -130,11 +240,12 @@ class ToolContextImpl:
                 f"No page targets available (found {len(all_targets)} non-page targets)"
             )
 
-        ws_url = target.get("webSocketDebuggerUrl", "")
+        ws_url: str = target.get("webSocketDebuggerUrl", "")
         if not ws_url:
             raise RuntimeError(f"Target {target.get('id')} has no webSocketDebuggerUrl")
 
-        return await self._instance.proxy.send_cdp_command(ws_url, method, params)
+        self._instance.ws_url_cache[str(target["id"])] = ws_url
+        return ws_url
 
     async def evaluate_js(self, expression: str) -> Any:
         """Evaluate JavaScript in the page context."""
@@ -150,6 +261,57 @@ class ToolContextImpl:
             raise RuntimeError(f"JS error: {result['exceptionDetails']}")
         return result.get("result", {}).get("value")
 
+    async def call_function(self, declaration: str, *args: Any) -> Any:
+        """Call a JavaScript function in the page, passing arguments as CDP values.
+
+        The declaration stays a constant string, so V8 reuses its compiled code
+        and values never need escaping into the source. On the persistent
+        connection this is Runtime.callFunctionOn against a cached handle to the
+        page's global object, re-resolved once if the page navigated. Remote
+        object handles don't outlive a proxy WebSocket, so the proxy fallback
+        (also taken when the persistent socket fails, as in send_cdp) evaluates
+        a call expression with JSON-encoded arguments instead.
+        """
+        cdp = self._instance.cdp
+        result: dict[str, Any] | None = None
+        if cdp and self._instance.is_connected:
+            try:
+                result = await self._call_on_global(cdp, declaration, args)
+            except CDPError:
+                raise
+            except Exception as e:
+                logger.warning("Persistent CDP call failed, falling back to proxy: %s", e)
+
+        if result is None:
+            call_args = ", ".join(json.dumps(arg) for arg in args)
+            return await self.evaluate_js(f"({declaration})({call_args})")
+
+        if "exceptionDetails" in result:
+            raise RuntimeError(f"JS error: {result['exceptionDetails']}")
+        return result.get("result", {}).get("value")
+
+    async def _call_on_global(
+        self, cdp: CDPClientProtocol, declaration: str, args: tuple[Any, ...]
+    ) -> dict[str, Any]:
+        """Run Runtime.callFunctionOn against the page's cached globalThis handle."""
+        params: dict[str, Any] = {
+            "functionDeclaration": declaration,
+            "arguments": [{"value": arg} for arg in args],
+            "returnByValue": True,
+            "awaitPromise": True,
+        }
+        object_id = self._instance.global_object_id
+        if object_id:
+            try:
+                return await cdp.send("Runtime.callFunctionOn", {**params, "objectId": object_id})
+            except CDPError as e:
+                logger.debug("Global object handle went stale: %s", e)
+
+        result = await cdp.send("Runtime.evaluate", {"expression": "globalThis"})
+        object_id = result["result"]["objectId"]
+        self._instance.global_object_id = object_id
+        return await cdp.send("Runtime.callFunctionOn", {**params, "objectId": object_id})
+
 
 class ChromeMCPServer:
     """MCP Server providing Chrome DevTools capabilities.
@@ -163,15 +325,52 @@ class ChromeMCPServer:
         """Initialize the Chrome MCP Server."""
         self.server = Server("wsl-chrome-mcp")
         self._pool: ChromePoolManager | None = None
+        self._pool_task: asyncio.Future[ChromePoolManager] | None = None
         self._register_handlers()
 
+    @staticmethod
+    def _create_pool() -> ChromePoolManager:
+        """Build the pool manager from the saved configuration.
+
+        Blocking: parses config and runs the orphaned temp dir cleanup.
+        """
+        cfg = load_config()
+        if cfg.chrome.profile_mode == "profile":
+            return ChromePoolManager(
+                port_min=cfg.chrome.debug_port,
+                headless=cfg.chrome.headless,
+                profile_mode=cfg.chrome.profile_mode,
+                profile_name=cfg.chrome.profile_name,
+            )
+        return ChromePoolManager(
+            port_min=cfg.chrome.debug_port,
+            headless=cfg.chrome.headless,
+        )
+
+    def _start_pool_init(self) -> asyncio.Future[ChromePoolManager]:
+        """Begin constructing the pool in a worker thread (idempotent)."""
+        if self._pool_task is None:
+            self._pool_task = asyncio.ensure_future(asyncio.to_thread(self._create_pool))
+        return self._pool_task
+
+    async def _ensure_pool(self) -> ChromePoolManager:
+        """Return the pool, waiting for background construction if needed."""
+        if self._pool is not None:
+            return self._pool
+        try:
+            self._pool = await self._start_pool_init()
+        except Exception:
+            self._pool_task = None  # let the next call retry
+            raise
+        return self._pool
+
     def _register_handlers(self) -> None:
         """Register all MCP handlers."""
 
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List available Chrome DevTools tools."""
-            return [tool_def.to_mcp_tool(SESSION_ID_PROPERTY) for tool_def in get_all_tools()]
+            return list(MCP_TOOLS)
 
         @self.server.call_tool()
         async def call_tool(
@@ -179,33 +378,27 @@ class ChromeMCPServer:
         ) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
             """Handle tool calls with session-aware routing."""
             try:
-                session_id = arguments.pop("session_id", "default")
+                # Read without popping: the arguments dict belongs to the caller
+                session_id = arguments.get("session_id", "default")
                 logger.info("call_tool: %s session_id=%s", name, session_id)
 
-                if self._pool is None:
-                    cfg = load_config()
-                    if cfg.chrome.profile_mode == "profile":
-                        self._pool = ChromePoolManager(
-                            port_min=cfg.chrome.debug_port,
-                            headless=cfg.chrome.headless,
-                            profile_mode=cfg.chrome.profile_mode,
-                            profile_name=cfg.chrome.profile_name,
-                        )
-                    else:
-                        self._pool = ChromePoolManager(
-                            port_min=cfg.chrome.debug_port,
-                            headless=cfg.chrome.headless,
-                        )
-
-                # Resolve tool name aliases
-                resolved_name = TOOL_ALIASES.get(name, name)
+                # The pool is built once; afterwards skip the coroutine round-trip
+                pool = self._pool if self._pool is not None else await self._ensure_pool()
 
                 # Session destroy is special: destroys the instance
-                if resolved_name == SESSION_DESTROY_TOOL:
-                    return await self._session_end(session_id)
+                if name == SESSION_DESTROY_TOOL:
+                    return await self._session_end(pool, session_id)
+
+                # Resolve the handler (aliases included) before touching Chrome
+                handler = TOOL_HANDLERS.get(name)
+                if handler is None:
+                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
                 # All other tools: get or create Chrome instance
-                instance = await self._pool.get_or_create(session_id)
+                if name == SESSION_START_TOOL:
+                    instance = await pool.get_or_create(session_id, arguments.get("url"))
+                else:
+                    instance = await pool.get_or_create(session_id)
 
                 if not instance.is_connected and not instance.proxy:
                     return [
@@ -215,23 +408,17 @@ class ChromeMCPServer:
                         )
                     ]
 
-                # Look up tool in registry and dispatch
-                tool_def = get_tool(resolved_name)
-                if tool_def:
-                    ctx = ToolContextImpl(instance, self._pool)
-                    return await tool_def.handler(arguments, ctx)
-
-                return [TextContent(type="text", text=f"Unknown tool: {name}")]
+                return await handler(arguments, ToolContextImpl(instance, pool))
 
             except Exception as e:
-                logger.exception(f"Error in tool {name}")
+                logger.exception("Error in tool %s", name)
                 return [TextContent(type="text", text=f"Error: {e!s}")]
 
-    async def _session_end(self, session_id: str) -> ContentResult:
+    @staticmethod
+    async def _session_end(pool: ChromePoolManager, session_id: str) -> ContentResult:
         """End a session, killing its Chrome process."""
-        assert self._pool is not None
         try:
-            await self._pool.destroy(session_id)
+            await pool.destroy(session_id)
             return [TextContent(type="text", text=f"Session ended: {session_id}")]
         except KeyError:
             return [TextContent(type="text", text=f"Session not found: {session_id}")]
@@ -244,11 +431,17 @@ class ChromeMCPServer:
 
         if is_wsl():
             host_ip = get_windows_host_ip()
-            logger.info(f"Running in WSL, Windows host IP: {host_ip}")
+            logger.info("Running in WSL, Windows host IP: %s", host_ip)
         else:
             logger.info("Running in native environment")
 
-        async with stdio_server() as (read_stream, write_stream):
+        # Config parsing and temp dir cleanup overlap with the MCP handshake
+        if self._pool is None:
+            self._start_pool_init()
+
+        # Responses queued while stdout is busy go out in a single write
+        stdout = CoalescingStdout()
+        async with stdio_server(stdout=stdout) as (read_stream, write_stream):  # type: ignore[arg-type]
             try:
                 await self.server.run(
                     read_stream,
@@ -256,22 +449,43 @@ class ChromeMCPServer:
                     self.server.create_initialization_options(),
                 )
             finally:
+                with contextlib.suppress(Exception):
+                    await stdout.drain()
                 await self._cleanup()
 
     async def _cleanup(self) -> None:
         """Clean up resources."""
+        if self._pool is None and self._pool_task is not None:
+            with contextlib.suppress(Exception):
+                self._pool = await self._pool_task
+        self._pool_task = None
         if self._pool:
             await self._pool.cleanup_all()
             self._pool = None
 
 
+def run_event_loop(main: Coroutine[Any, Any, None]) -> None:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    uvloop is an optional install that speeds up the stdio pipes and CDP
+    sockets every tool call goes through; without it the default loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+        return
+    logger.debug("Using uvloop event loop")
+    uvloop.run(main)
+
+
 def main() -> None:
     """Main entry point."""
     from dotenv import load_dotenv
 
     load_dotenv()
     server = ChromeMCPServer()
-    asyncio.run(server.run())
+    run_event_loop(server.run())
 
 
 if __name__ == "__main__":
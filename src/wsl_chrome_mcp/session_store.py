@@ -61,7 +61,7 @@ class SessionStore:
     def __init__(self) -> None:
         """Initialize store directory."""
         self.STORE_DIR.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"SessionStore initialized at {self.STORE_DIR}")
+        logger.debug("SessionStore initialized at %s", self.STORE_DIR)
 
     def _get_session_path(self, session_id: str) -> Path:
         """Get the file path for a session record."""
@@ -83,9 +83,9 @@ class SessionStore:
 
             # Atomic rename
             os.replace(tmp_path, session_path)
-            logger.debug(f"Saved session {record.session_id} to {session_path}")
+            logger.debug("Saved session %s to %s", record.session_id, session_path)
         except OSError as e:
-            logger.error(f"Failed to save session {record.session_id}: {e}")
+            logger.error("Failed to save session %s: %s", record.session_id, e)
             # Clean up temp file if it exists
             with contextlib.suppress(OSError):
                 tmp_path.unlink(missing_ok=True)
@@ -105,20 +105,20 @@ class SessionStore:
         session_path = self._get_session_path(session_id)
 
         if not session_path.exists():
-            logger.debug(f"Session file not found: {session_path}")
+            logger.debug("Session file not found: %s", session_path)
             return None
 
         try:
             with open(session_path, encoding="utf-8") as f:
                 data = json.load(f)
             record = SessionRecord.from_dict(data)
-            logger.debug(f"Loaded session {session_id}")
+            logger.debug("Loaded session %s", session_id)
             return record
         except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
-            logger.warning(f"Corrupt session file {session_path}: {e}")
+            logger.warning("Corrupt session file %s: %s", session_path, e)
             return None
         except OSError as e:
-            logger.error(f"Failed to read session {session_id}: {e}")
+            logger.error("Failed to read session %s: %s", session_id, e)
             return None
 
     def delete(self, session_id: str) -> None:
@@ -133,9 +133,9 @@ class SessionStore:
 
         try:
             session_path.unlink(missing_ok=True)
-            logger.debug(f"Deleted session {session_id}")
+            logger.debug("Deleted session %s", session_id)
         except OSError as e:
-            logger.error(f"Failed to delete session {session_id}: {e}")
+            logger.error("Failed to delete session %s: %s", session_id, e)
 
     def list_all(self) -> list[SessionRecord]:
         """List all stored session records.
@@ -155,7 +155,7 @@ class SessionStore:
                 if record is not None:
                     records.append(record)
         except OSError as e:
-            logger.error(f"Failed to list sessions: {e}")
+            logger.error("Failed to list sessions: %s", e)
 
         return records
 
@@ -176,10 +176,10 @@ class SessionStore:
                 continue
 
             if self._is_process_alive(record.pid):
-                logger.debug(f"Process {record.pid} (session {record.session_id}) is alive")
+                logger.debug("Process %s (session %s) is alive", record.pid, record.session_id)
             else:
                 logger.info(
-                    f"Process {record.pid} (session {record.session_id}) is dead, cleaning up"
+                    "Process %s (session %s) is dead, cleaning up", record.pid, record.session_id
                 )
                 self.delete(record.session_id)
 
@@ -211,11 +211,11 @@ class SessionStore:
             # If Get-Process succeeds (returncode 0) and has output, process is alive
             return result.returncode == 0 and bool(result.stdout.strip())
         except RuntimeError as e:
-            logger.warning(f"Failed to check process {pid} on Windows: {e}")
+            logger.warning("Failed to check process %s on Windows: %s", pid, e)
             # Assume alive if we can't check (safer than deleting)
             return True
         except Exception as e:
-            logger.error(f"Unexpected error checking process {pid}: {e}")
+            logger.error("Unexpected error checking process %s: %s", pid, e)
             return True
 
     def _is_process_alive_native(self, pid: int) -> bool:
@@ -233,6 +233,6 @@ class SessionStore:
         except ProcessLookupError:
             return False
         except (OSError, PermissionError) as e:
-            logger.warning(f"Failed to check process {pid}: {e}")
+            logger.warning("Failed to check process %s: %s", pid, e)
             # Assume alive if we can't check (safer than deleting)
             return True
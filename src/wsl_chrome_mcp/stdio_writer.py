@@ -0,0 +1,80 @@
+"""Coalescing stdout sink for the MCP stdio transport.
+
+The stdio transport writes and flushes every JSON-RPC frame through a worker
+thread, one frame at a time. CoalescingStdout takes its place: writes are
+buffered in memory and a background task hands everything that queued up
+meanwhile to the real stdout in a single write + flush. Frames are only ever
+joined whole, so the newline-delimited JSON-RPC framing is preserved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from typing import BinaryIO
+
+# Buffered bytes above which flush() waits for the pipe (backpressure)
+DEFAULT_MAX_BUFFER = 16 * 1024
+
+
+class CoalescingStdout:
+    """Async text sink that merges frames queued while a write is in flight.
+
+    Implements the ``write``/``flush`` subset of ``anyio.AsyncFile[str]``
+    used by ``mcp.server.stdio.stdio_server``.
+    """
+
+    def __init__(self, raw: BinaryIO | None = None, max_buffer: int = DEFAULT_MAX_BUFFER) -> None:
+        """Initialize the sink.
+
+        Args:
+            raw: Binary stream to write to (default: sys.stdout.buffer).
+            max_buffer: Buffered bytes above which flush() applies backpressure.
+        """
+        self._raw = raw if raw is not None else sys.stdout.buffer
+        self._max_buffer = max_buffer
+        self._chunks: list[bytes] = []
+        self._size = 0
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def write(self, data: str) -> None:
+        """Queue a frame; nothing reaches stdout until flush()."""
+        chunk = data.encode("utf-8")
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+
+    async def flush(self) -> None:
+        """Schedule queued frames to be written, without waiting for the pipe.
+
+        Waits only when more than ``max_buffer`` bytes are pending, so a slow
+        reader throttles the server instead of growing the buffer unbounded.
+        """
+        task = self._flush_task
+        if task is not None and task.done():
+            self._flush_task = None
+            task.result()  # surface a broken pipe to the caller
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        if self._size >= self._max_buffer:
+            await self.drain()
+
+    async def drain(self) -> None:
+        """Wait until every queued frame has been written to stdout."""
+        while self._flush_task is not None and not self._flush_task.done():
+            await asyncio.shield(self._flush_task)
+        if self._flush_task is not None:
+            task, self._flush_task = self._flush_task, None
+            task.result()  # surface a broken pipe to the caller
+
+    async def _flush_pending(self) -> None:
+        # Let frames produced in the same loop tick join this write
+        await asyncio.sleep(0)
+        while self._chunks:
+            data = b"".join(self._chunks)
+            self._chunks.clear()
+            self._size = 0
+            await asyncio.to_thread(self._write_raw, data)
+
+    def _write_raw(self, data: bytes) -> None:
+        self._raw.write(data)
+        self._raw.flush()
@@ -56,10 +56,20 @@ class ToolContext(Protocol):
         """Send a CDP command."""
         ...
 
+    async def send_cdp_batch(
+        self, commands: list[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Send several CDP commands in order without waiting between them."""
+        ...
+
     async def evaluate_js(self, expression: str) -> Any:
         """Evaluate JavaScript in the page context."""
         ...
 
+    async def call_function(self, declaration: str, *args: Any) -> Any:
+        """Call a JavaScript function declaration in the page with JSON arguments."""
+        ...
+
 
 # Type for tool handler functions
 ToolHandler = Callable[[dict[str, Any], ToolContext], Awaitable[ContentResult]]
@@ -122,6 +132,21 @@ def get_tools_by_category(category: ToolCategory) -> list[ToolDefinition]:
     return [t for t in _TOOL_REGISTRY.values() if t.category == category]
 
 
+# Errors Chrome reports when the page navigates while a call is in flight
+_CONTEXT_LOST_ERRORS = (
+    "Execution context was destroyed",
+    "Cannot find context with specified id",
+    "Inspected target navigated or closed",
+    "Promise was collected",
+)
+
+
+def is_context_lost(error: Exception) -> bool:
+    """Check whether an evaluation failed because the page navigated away."""
+    message = str(error)
+    return any(marker in message for marker in _CONTEXT_LOST_ERRORS)
+
+
 # Common schema fragments
 TIMEOUT_SCHEMA = {
     "timeout": {
@@ -138,6 +163,17 @@ INCLUDE_SNAPSHOT_SCHEMA = {
     }
 }
 
+WAIT_FOR_SCHEMA = {
+    "waitFor": {
+        "type": "string",
+        "description": (
+            "Text to wait for on the page after the action, saving a separate "
+            "wait_for call. Uses timeout (default 10s)."
+        ),
+    },
+    **TIMEOUT_SCHEMA,
+}
+
 UID_SCHEMA = {
     "uid": {
         "type": "string",
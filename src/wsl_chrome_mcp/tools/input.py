@@ -17,13 +17,14 @@ from mcp.types import TextContent
 from .base import (
     INCLUDE_SNAPSHOT_SCHEMA,
     UID_SCHEMA,
+    WAIT_FOR_SCHEMA,
     ContentResult,
     ToolCategory,
     ToolContext,
     ToolDefinition,
     register_tool,
 )
-from .snapshot import maybe_include_snapshot
+from .snapshot import maybe_include_snapshot, wait_for_text
 
 logger = logging.getLogger(__name__)
 
@@ -124,26 +125,21 @@ async def click_element(ctx: ToolContext, uid: str, double_click: bool = False)
 
         click_count = 2 if double_click else 1
 
-        # Perform click using CDP Input domain
-        await ctx.send_cdp(
-            "Input.dispatchMouseEvent",
-            {
-                "type": "mousePressed",
-                "x": x,
-                "y": y,
-                "button": "left",
-                "clickCount": click_count,
-            },
-        )
-        await ctx.send_cdp(
-            "Input.dispatchMouseEvent",
-            {
-                "type": "mouseReleased",
-                "x": x,
-                "y": y,
-                "button": "left",
-                "clickCount": click_count,
-            },
+        # Perform click using CDP Input domain (press + release in one batch)
+        await ctx.send_cdp_batch(
+            [
+                (
+                    "Input.dispatchMouseEvent",
+                    {
+                        "type": event_type,
+                        "x": x,
+                        "y": y,
+                        "button": "left",
+                        "clickCount": click_count,
+                    },
+                )
+                for event_type in ("mousePressed", "mouseReleased")
+            ]
         )
 
         action = "Double clicked" if double_click else "Clicked"
@@ -157,9 +153,9 @@ async def click_element(ctx: ToolContext, uid: str, double_click: bool = False)
         return False, f"Click failed: {e}"
 
 
-async def _clear_input_via_keyboard(ctx: ToolContext) -> None:
-    """Select all text and delete it using keyboard events (Ctrl+A, Backspace)."""
-    await ctx.send_cdp(
+# Select all text and delete it (Ctrl+A, Backspace)
+_CLEAR_INPUT_KEY_EVENTS: list[tuple[str, dict[str, Any] | None]] = [
+    (
         "Input.dispatchKeyEvent",
         {
             "type": "keyDown",
@@ -169,8 +165,8 @@ async def _clear_input_via_keyboard(ctx: ToolContext) -> None:
             "nativeVirtualKeyCode": 65,
             "modifiers": 2,
         },
-    )
-    await ctx.send_cdp(
+    ),
+    (
         "Input.dispatchKeyEvent",
         {
             "type": "keyUp",
@@ -178,8 +174,8 @@ async def _clear_input_via_keyboard(ctx: ToolContext) -> None:
             "code": "KeyA",
             "modifiers": 2,
         },
-    )
-    await ctx.send_cdp(
+    ),
+    (
         "Input.dispatchKeyEvent",
         {
             "type": "keyDown",
@@ -188,15 +184,16 @@ async def _clear_input_via_keyboard(ctx: ToolContext) -> None:
             "windowsVirtualKeyCode": 8,
             "nativeVirtualKeyCode": 8,
         },
-    )
-    await ctx.send_cdp(
+    ),
+    (
         "Input.dispatchKeyEvent",
         {
             "type": "keyUp",
             "key": "Backspace",
             "code": "Backspace",
         },
-    )
+    ),
+]
 
 
 async def _fill_select_element(
@@ -272,12 +269,15 @@ async def fill_element(
         return await _fill_select_element(ctx, backend_node_id, value)
 
     try:
+        # Focus must succeed first, or the keys would land in whatever has focus
         await ctx.send_cdp("DOM.focus", {"backendNodeId": backend_node_id})
 
+        # Clear and insert are pipelined: CDP runs them in order
+        commands: list[tuple[str, dict[str, Any] | None]] = []
         if clear_first:
-            await _clear_input_via_keyboard(ctx)
-
-        await ctx.send_cdp("Input.insertText", {"text": value})
+            commands.extend(_CLEAR_INPUT_KEY_EVENTS)
+        commands.append(("Input.insertText", {"text": value}))
+        await ctx.send_cdp_batch(commands)
 
         return True, f"Successfully filled element uid={uid}"
 
@@ -344,6 +344,8 @@ async def _click_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResul
     result: ContentResult = [
         TextContent(type="text", text=message if success else f"Error: {message}")
     ]
+    if success and (wait_text := args.get("waitFor")):
+        result = [*result, await wait_for_text(ctx, wait_text, args)]
     return await maybe_include_snapshot(args, ctx, result)
 
 
@@ -365,6 +367,7 @@ click = register_tool(
                 "description": "Set to true for double clicks. Default is false.",
                 "default": False,
             },
+            **WAIT_FOR_SCHEMA,
             **INCLUDE_SNAPSHOT_SCHEMA,
         },
         handler=_click_handler,
@@ -391,6 +394,8 @@ async def _fill_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult
     result: ContentResult = [
         TextContent(type="text", text=message if success else f"Error: {message}")
     ]
+    if success and (wait_text := args.get("waitFor")):
+        result = [*result, await wait_for_text(ctx, wait_text, args)]
     return await maybe_include_snapshot(args, ctx, result)
 
 
@@ -416,6 +421,7 @@ fill = register_tool(
                 "description": "Clear the input before filling. Default is true.",
                 "default": True,
             },
+            **WAIT_FOR_SCHEMA,
             **INCLUDE_SNAPSHOT_SCHEMA,
         },
         handler=_fill_handler,
@@ -6,45 +6,54 @@ Includes: get_console, get_network
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Collection
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 from mcp.types import TextContent
 
 from .base import ContentResult, ToolCategory, ToolContext, ToolDefinition, register_tool
 
+if TYPE_CHECKING:
+    from ..chrome_pool import ConsoleMessage, NetworkRequest
+
 logger = logging.getLogger(__name__)
 
+# Empty-result responses, built once and shared across calls
+_NO_CONSOLE_MESSAGES = TextContent(type="text", text="No console messages collected.")
+_NO_NETWORK_REQUESTS = TextContent(type="text", text="No network requests collected.")
+
+
+def _page_bounds(args: dict[str, Any]) -> tuple[int, int]:
+    """Read limit and offset, clamped to non-negative integers."""
+    return max(int(args.get("limit", 100)), 0), max(int(args.get("offset", 0)), 0)
+
 
 # --- get_console ---
 async def _get_console_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult:
     """Get console messages from the browser."""
     clear = args.get("clear", False)
     types = args.get("types")  # Optional filter: ["log", "warn", "error", etc.]
-    limit = args.get("limit", 100)
-    offset = args.get("offset", 0)
+    limit, offset = _page_bounds(args)
 
-    messages = list(ctx.instance.console_messages)
+    messages: Collection[ConsoleMessage] = (
+        ctx.instance.take_console_messages() if clear else ctx.instance.console_messages
+    )
 
     # Filter by type if specified
     if types:
         messages = [m for m in messages if m.type in types]
 
-    # Apply pagination
+    # Apply pagination; only the returned page is copied out of the buffer
     total = len(messages)
-    messages = messages[offset : offset + limit]
+    page = list(islice(messages, offset, offset + limit))
 
-    if clear:
-        ctx.instance.console_messages.clear()
+    if not page:
+        return [_NO_CONSOLE_MESSAGES]
 
-    if not messages:
-        return [TextContent(type="text", text="No console messages collected.")]
-
-    lines = [f"Console messages ({len(messages)} of {total}):"]
-    for i, msg in enumerate(messages):
-        idx = offset + i
-        lines.append(f"  [{idx}] [{msg.type.upper()}] {msg.text}")
-
-    return [TextContent(type="text", text="\n".join(lines))]
+    header = f"Console messages ({len(page)} of {total}):"
+    lines = (f"  [{idx}] [{msg.type.upper()}] {msg.text}" for idx, msg in enumerate(page, offset))
+    return [TextContent(type="text", text="\n".join((header, *lines)))]
 
 
 get_console = register_tool(
@@ -85,24 +94,23 @@ async def _get_network_handler(args: dict[str, Any], ctx: ToolContext) -> Conten
     """Get network requests made by the page."""
     clear = args.get("clear", False)
     resource_types = args.get("resourceTypes")  # Optional filter
-    limit = args.get("limit", 100)
-    offset = args.get("offset", 0)
+    limit, offset = _page_bounds(args)
 
-    requests = list(ctx.instance.network_requests.values())
+    requests: Collection[NetworkRequest] = ctx.instance.network_requests.values()
+    if clear:
+        # Hand the collected dict to this call and start a fresh one
+        ctx.instance.network_requests = {}
 
     # Filter by resource type if specified
     if resource_types:
         requests = [r for r in requests if r.type in resource_types]
 
-    # Apply pagination
+    # Apply pagination; only the returned page is copied out of the buffer
     total = len(requests)
-    requests = requests[offset : offset + limit]
-
-    if clear:
-        ctx.instance.network_requests.clear()
+    requests = list(islice(requests, offset, offset + limit))
 
     if not requests:
-        return [TextContent(type="text", text="No network requests collected.")]
+        return [_NO_NETWORK_REQUESTS]
 
     lines = [f"Network requests ({len(requests)} of {total}):"]
     for i, req in enumerate(requests):
@@ -12,33 +12,79 @@ from typing import Any
 
 from mcp.types import TextContent
 
+from ..persistent_cdp import PAGE_WAIT_SLICE_S
 from .base import (
     TIMEOUT_SCHEMA,
     ContentResult,
     ToolCategory,
     ToolContext,
     ToolDefinition,
+    is_context_lost,
     register_tool,
 )
 from .snapshot import capture_snapshot
 
 logger = logging.getLogger(__name__)
 
+# Empty-result responses, built once and shared across calls
+_NO_PAGES_OPEN = TextContent(type="text", text="No pages open.")
+
 
 # --- navigate_page ---
-async def _wait_for_load(ctx: ToolContext, timeout_s: float) -> None:
-    """Wait for page load event with timeout."""
-    with contextlib.suppress(asyncio.TimeoutError):
-        await asyncio.wait_for(_poll_load_complete(ctx), timeout=timeout_s)
+# Resolves in the page once it has loaded, so a single evaluate replaces
+# polling readyState. It also returns what the handler reports afterwards,
+# so the title/URL need no extra round-trip. A page still loading after one
+# wait slice resolves with its current state and the caller asks again.
+_PAGE_STATE_JS = """new Promise((resolve) => {
+    const state = () => resolve(
+        {readyState: document.readyState, title: document.title, url: location.href});
+    if (document.readyState === "complete") return state();
+    const timer = setTimeout(() => {
+        removeEventListener("load", onLoad);
+        state();
+    }, SLICE_MS);
+    const onLoad = () => {
+        clearTimeout(timer);
+        state();
+    };
+    addEventListener("load", onLoad, {once: true});
+})""".replace("SLICE_MS", str(int(PAGE_WAIT_SLICE_S * 1000)))
+
+
+async def _wait_for_load(ctx: ToolContext, timeout_s: float) -> dict[str, Any] | None:
+    """Wait for page load event with timeout.
+
+    Returns:
+        The loaded page's ``title`` and ``url``, or None on timeout.
+    """
+    try:
+        return await asyncio.wait_for(_poll_load_complete(ctx), timeout=timeout_s)
+    except asyncio.TimeoutError:
+        return None
+
 
+async def _poll_load_complete(ctx: ToolContext) -> dict[str, Any]:
+    """Wait until document.readyState is complete.
 
-async def _poll_load_complete(ctx: ToolContext) -> None:
-    """Poll until document.readyState is complete."""
+    Each evaluate resolves on the load event or after one wait slice, and is
+    re-issued until the page reports complete. It is retried if the document
+    is replaced while waiting (e.g. a redirect destroys the execution
+    context); any other error is raised.
+    """
     while True:
-        state = await ctx.evaluate_js("document.readyState")
-        if state == "complete":
-            return
-        await asyncio.sleep(0.3)
+        try:
+            state = await ctx.evaluate_js(_PAGE_STATE_JS)
+        except Exception as e:
+            if not is_context_lost(e):
+                raise
+            logger.debug("Load wait interrupted: %s", e)
+            await asyncio.sleep(0.3)
+            continue
+        if isinstance(state, dict):
+            if state.get("readyState") == "complete":
+                return state
+        else:
+            await asyncio.sleep(0.3)
 
 
 async def _navigate_page_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult:
@@ -78,8 +124,8 @@ async def _navigate_page_handler(args: dict[str, Any], ctx: ToolContext) -> Cont
                 return [TextContent(type="text", text="Error: URL required for type=url")]
             try:
                 result = await ctx.send_cdp("Page.navigate", {"url": url})
-                await _wait_for_load(ctx, timeout_s)
-                title = await ctx.evaluate_js("document.title")
+                page = await _wait_for_load(ctx, timeout_s)
+                title = page["title"] if page else await ctx.evaluate_js("document.title")
                 frame_id = result.get("frameId", "unknown")
                 nav_result = f"Navigated to {url}\nTitle: {title}\nFrame: {frame_id}"
             except Exception as e:
@@ -93,8 +139,8 @@ async def _navigate_page_handler(args: dict[str, Any], ctx: ToolContext) -> Cont
                 await ctx.send_cdp(
                     "Page.navigateToHistoryEntry", {"entryId": entries[index - 1]["id"]}
                 )
-                await _wait_for_load(ctx, timeout_s)
-                new_url = await ctx.evaluate_js("window.location.href")
+                page = await _wait_for_load(ctx, timeout_s)
+                new_url = page["url"] if page else await ctx.evaluate_js("window.location.href")
                 nav_result = f"Navigated back to {new_url}"
             else:
                 return [TextContent(type="text", text="Cannot go back: at start of history")]
@@ -107,8 +153,8 @@ async def _navigate_page_handler(args: dict[str, Any], ctx: ToolContext) -> Cont
                 await ctx.send_cdp(
                     "Page.navigateToHistoryEntry", {"entryId": entries[index + 1]["id"]}
                 )
-                await _wait_for_load(ctx, timeout_s)
-                new_url = await ctx.evaluate_js("window.location.href")
+                page = await _wait_for_load(ctx, timeout_s)
+                new_url = page["url"] if page else await ctx.evaluate_js("window.location.href")
                 nav_result = f"Navigated forward to {new_url}"
             else:
                 return [TextContent(type="text", text="Cannot go forward: at end of history")]
@@ -187,22 +233,29 @@ navigate_page = register_tool(
 
 
 # --- list_pages ---
+_SELECTED_SUFFIX = " (selected)"
+
+
 async def _list_pages_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult:
     """List all open pages."""
     tabs = await ctx.pool.list_tabs(ctx.instance.session_id)
 
     if not tabs:
-        return [TextContent(type="text", text="No pages open.")]
-
-    lines = [f"Open pages ({len(tabs)}):"]
-    for i, tab in enumerate(tabs):
-        current = " (selected)" if tab.get("is_current") else ""
-        lines.append(
-            f"  [{i}] {tab.get('title', 'Untitled')}: {tab.get('url', 'about:blank')}{current}"
+        return [_NO_PAGES_OPEN]
+
+    # One formatted entry (two lines) per tab, joined in a single pass
+    text = "\n".join(
+        (
+            f"Open pages ({len(tabs)}):",
+            *(
+                f"  [{i}] {tab.get('title', 'Untitled')}: {tab.get('url', 'about:blank')}"
+                f"{_SELECTED_SUFFIX if tab.get('is_current') else ''}\n"
+                f"      id: {tab.get('id')}"
+                for i, tab in enumerate(tabs)
+            ),
         )
-        lines.append(f"      id: {tab.get('id')}")
-
-    return [TextContent(type="text", text="\n".join(lines))]
+    )
+    return [TextContent(type="text", text=text)]
 
 
 list_pages = register_tool(
@@ -268,12 +321,8 @@ async def _new_page_handler(args: dict[str, Any], ctx: ToolContext) -> ContentRe
     url = args.get("url", "about:blank")
     background = args.get("background", False)
 
-    target_id = await ctx.pool.create_tab(ctx.instance.session_id, url)
-
-    # If not background, switch to the new tab
-    if not background:
-        with contextlib.suppress(ValueError, KeyError):
-            await ctx.pool.switch_tab(ctx.instance.session_id, target_id)
+    # create_tab already makes the new tab the session's current page
+    target_id = await ctx.pool.create_tab(ctx.instance.session_id, url, background=background)
 
     return [TextContent(type="text", text=f"Created new page: {target_id}\nURL: {url}")]
 
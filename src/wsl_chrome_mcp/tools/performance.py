@@ -22,6 +22,11 @@ from .base import (
     register_tool,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Trace categories matching ChromeDevTools/Lighthouse
@@ -122,8 +127,8 @@ async def _do_stop_trace(ctx: ToolContext, file_path: str | None = None) -> Cont
         if file_path:
             # Save raw trace data
             try:
-                trace_data = json.dumps({"traceEvents": events})
-                with open(file_path, "w") as f:
+                trace_data = _encode_trace(events)
+                with open(file_path, "wb") as f:
                     f.write(trace_data)
                 lines.append(f"\nRaw trace saved to {file_path}")
             except Exception as e:
@@ -136,31 +141,43 @@ async def _do_stop_trace(ctx: ToolContext, file_path: str | None = None) -> Cont
         return [TextContent(type="text", text=f"Error stopping trace: {e}")]
 
 
+def _encode_trace(events: list[dict[str, Any]]) -> bytes:
+    """Encode trace events in the Chrome trace file format.
+
+    Uses orjson when installed, falling back to json for values it rejects.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps({"traceEvents": events})
+        except TypeError:
+            pass
+    return json.dumps({"traceEvents": events}).encode()
+
+
+# Trace event name -> metric recorded from that event's timestamp
+_TIMESTAMP_METRICS = {
+    "largestContentfulPaint::Candidate": "LCP",
+    "firstContentfulPaint": "FCP",
+}
+
+
 def _analyze_trace(events: list[dict[str, Any]]) -> list[str]:
     """Basic trace event analysis."""
     lines = ["## Trace Summary"]
 
-    # Count event categories
+    # Count event categories and look for key metrics in one pass
     categories: dict[str, int] = {}
+    metrics: dict[str, Any] = {}
     for event in events:
         cat = event.get("cat", "unknown")
         categories[cat] = categories.get(cat, 0) + 1
 
-    # Look for key metrics
-    metrics: dict[str, Any] = {}
-    for event in events:
         name = event.get("name", "")
-        # LCP
-        if name == "largestContentfulPaint::Candidate":
-            ts = event.get("ts", 0)
-            if ts:
-                metrics["LCP"] = ts
-        # FCP
-        elif name == "firstContentfulPaint":
+        metric = _TIMESTAMP_METRICS.get(name)
+        if metric is not None:
             ts = event.get("ts", 0)
             if ts:
-                metrics["FCP"] = ts
-        # Layout shifts
+                metrics[metric] = ts
         elif name == "LayoutShift":
             metrics["CLS_events"] = metrics.get("CLS_events", 0) + 1
 
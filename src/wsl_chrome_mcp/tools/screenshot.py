@@ -5,8 +5,11 @@ Includes: take_screenshot, generate_pdf
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import binascii
 import logging
+import os
+import tempfile
 from typing import Any
 
 from mcp.types import BlobResourceContents, EmbeddedResource, ImageContent, TextContent
@@ -16,6 +19,30 @@ from .base import ContentResult, ToolCategory, ToolContext, ToolDefinition, regi
 
 logger = logging.getLogger(__name__)
 
+# Captures larger than this (decoded) are written to a temp file instead of
+# being sent inline as one multi-MB base64 JSON-RPC frame over stdio.
+INLINE_IMAGE_MAX_BYTES = 1024 * 1024
+
+
+def _save_base64(data: str, path: str) -> int:
+    """Decode CDP's base64 payload into a file; returns the byte count.
+
+    Blocking: run via asyncio.to_thread so multi-MB captures don't stall the loop.
+    """
+    raw_bytes = binascii.a2b_base64(data)
+    with open(path, "wb") as f:
+        f.write(raw_bytes)
+    return len(raw_bytes)
+
+
+def _save_base64_temp(data: str, directory: str, suffix: str) -> tuple[str, int]:
+    """Like _save_base64, into a new file in directory; returns (path, byte count)."""
+    raw_bytes = binascii.a2b_base64(data)
+    fd, path = tempfile.mkstemp(prefix="screenshot-", suffix=suffix, dir=directory)
+    with os.fdopen(fd, "wb") as f:
+        f.write(raw_bytes)
+    return path, len(raw_bytes)
+
 
 # --- take_screenshot ---
 async def _take_screenshot_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult:
@@ -72,13 +99,27 @@ async def _take_screenshot_handler(args: dict[str, Any], ctx: ToolContext) -> Co
     # Save to file if filePath provided
     if file_path:
         try:
-            raw_bytes = base64.b64decode(image_data)
-            with open(file_path, "wb") as f:
-                f.write(raw_bytes)
+            await asyncio.to_thread(_save_base64, image_data, file_path)
             return [TextContent(type="text", text=f"Screenshot saved to {file_path}")]
         except Exception as e:
             return [TextContent(type="text", text=f"Error saving screenshot: {e}")]
 
+    # base64 is 4 chars per 3 bytes; skip decoding unless the image is too big
+    if len(image_data) * 3 // 4 > INLINE_IMAGE_MAX_BYTES:
+        # Per-session directory: the pool deletes it when the session ends
+        instance = ctx.instance
+        if not instance.capture_dir:
+            instance.capture_dir = tempfile.mkdtemp(prefix="wsl-chrome-mcp-captures-")
+        path, size = await asyncio.to_thread(
+            _save_base64_temp, image_data, instance.capture_dir, f".{img_format}"
+        )
+        return [
+            TextContent(
+                type="text",
+                text=f"Screenshot is {size} bytes, too large to return inline. Saved to {path}",
+            )
+        ]
+
     return [
         ImageContent(
             type="image",
@@ -91,7 +132,10 @@ async def _take_screenshot_handler(args: dict[str, Any], ctx: ToolContext) -> Co
 take_screenshot = register_tool(
     ToolDefinition(
         name="take_screenshot",
-        description="Take a screenshot of the page or element. Returns the image.",
+        description=(
+            "Take a screenshot of the page or element. Returns the image, or the "
+            "path of a temp file for captures over 1 MB."
+        ),
         category=ToolCategory.SCREENSHOT,
         read_only=False,
         schema={
@@ -149,9 +193,7 @@ async def _generate_pdf_handler(args: dict[str, Any], ctx: ToolContext) -> Conte
     # Save to file if filePath provided
     if file_path:
         try:
-            raw_bytes = base64.b64decode(pdf_data)
-            with open(file_path, "wb") as f:
-                f.write(raw_bytes)
+            await asyncio.to_thread(_save_base64, pdf_data, file_path)
             return [TextContent(type="text", text=f"PDF saved to {file_path}")]
         except Exception as e:
             return [TextContent(type="text", text=f"Error saving PDF: {e}")]
@@ -13,9 +13,33 @@ from mcp.types import TextContent
 
 from .base import ContentResult, ToolCategory, ToolContext, ToolDefinition, register_tool
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+def _format_result(value: Any, pretty: bool = False) -> str:
+    """Serialise an evaluation result as JSON text.
+
+    Output is compact unless ``pretty`` is set: indentation makes the stdlib
+    encoder take its slow pure-Python path and inflates large results.
+    Uses orjson when installed, falling back to json for values it rejects
+    (e.g. integers wider than 64 bits).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(value, default=str, option=option).decode()
+        except TypeError:
+            pass
+    if pretty:
+        return json.dumps(value, indent=2, default=str)
+    return json.dumps(value, separators=(",", ":"), default=str)
+
+
 # --- evaluate ---
 async def _evaluate_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult:
     """Evaluate JavaScript in the page context.
@@ -27,6 +51,7 @@ async def _evaluate_handler(args: dict[str, Any], ctx: ToolContext) -> ContentRe
     expression = args.get("expression", "")
     function = args.get("function", "")
     fn_args = args.get("args", [])
+    pretty = bool(args.get("pretty", False))
 
     if not expression and not function:
         return [TextContent(type="text", text="Error: expression or function is required")]
@@ -74,19 +99,19 @@ async def _evaluate_handler(args: dict[str, Any], ctx: ToolContext) -> ContentRe
                     },
                 )
                 value = call_result.get("result", {}).get("value")
-                return [TextContent(type="text", text=json.dumps(value, indent=2, default=str))]
+                return [TextContent(type="text", text=_format_result(value, pretty))]
 
             return [TextContent(type="text", text="Error: could not create function handle")]
 
         elif function:
             # Function without args — just evaluate it
             result = await ctx.evaluate_js(f"({function})()")
-            return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+            return [TextContent(type="text", text=_format_result(result, pretty))]
 
         else:
             # Standard expression mode
             result = await ctx.evaluate_js(expression)
-            return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
+            return [TextContent(type="text", text=_format_result(result, pretty))]
 
     except Exception as e:
         return [TextContent(type="text", text=f"Error: {e}")]
@@ -120,6 +145,11 @@ evaluate = register_tool(
                 },
                 "description": "Element handles to pass as function arguments.",
             },
+            "pretty": {
+                "type": "boolean",
+                "description": "Indent the JSON result (default: false, compact)",
+                "default": False,
+            },
         },
         handler=_evaluate_handler,
     )
@@ -127,26 +157,28 @@ evaluate = register_tool(
 
 
 # --- get_html ---
+_ELEMENT_HTML_FN = """
+function(selector) {
+    const el = document.querySelector(selector);
+    if (!el) return { error: 'Element not found: ' + selector };
+    return { html: el.outerHTML };
+}
+"""
+
+
 async def _get_html_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult:
     """Get HTML content of the page or a specific element."""
     selector = args.get("selector")
 
     if selector:
-        js = f"""
-        (function() {{
-            const el = document.querySelector({json.dumps(selector)});
-            if (!el) return {{ error: 'Element not found: {selector}' }};
-            return {{ html: el.outerHTML }};
-        }})()
-        """
-        result = await ctx.evaluate_js(js)
+        result = await ctx.call_function(_ELEMENT_HTML_FN, selector)
 
         if isinstance(result, dict) and result.get("error"):
             return [TextContent(type="text", text=f"Error: {result['error']}")]
         html = result.get("html", "") if isinstance(result, dict) else ""
     else:
         await ctx.send_cdp("DOM.enable")
-        doc = await ctx.send_cdp("DOM.getDocument", {"depth": -1})
+        doc = await ctx.send_cdp("DOM.getDocument", {"depth": 0})
         root_id = doc["root"]["nodeId"]
         result = await ctx.send_cdp("DOM.getOuterHTML", {"nodeId": root_id})
         html = result["outerHTML"]
@@ -172,27 +204,57 @@ get_html = register_tool(
 
 
 # --- scroll ---
+_SCROLL_FN = """
+function(selector, method, x, y) {
+    const target = selector ? document.querySelector(selector) : window;
+    if (!target) return 'Element not found: ' + selector;
+    target[method](x, y);
+    return null;
+}
+"""
+
+# direction -> unit (x, y) step for scrollBy, scaled by the amount
+_SCROLL_STEPS: dict[str, tuple[int, int]] = {
+    "up": (0, -1),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "right": (1, 0),
+}
+
+# direction -> absolute scrollTo position; browsers clamp to the scroll range
+_SCROLL_POSITIONS: dict[str, tuple[int, int]] = {
+    "top": (0, 0),
+    "bottom": (0, 2**53 - 1),
+}
+
+# Success responses for the known directions, built once and shared across calls
+_SCROLLED: dict[str, TextContent] = {
+    direction: TextContent(type="text", text=f"Scrolled {direction}")
+    for direction in (*_SCROLL_STEPS, *_SCROLL_POSITIONS)
+}
+
+
 async def _scroll_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult:
     """Scroll the page or an element."""
     direction = args.get("direction", "down")
-    amount = args.get("amount", 500)
+    amount = float(args.get("amount", 500))
     selector = args.get("selector")
 
-    target = f"document.querySelector({json.dumps(selector)})" if selector else "window"
-
-    scroll_code = {
-        "up": f"{target}.scrollBy(0, -{amount})",
-        "down": f"{target}.scrollBy(0, {amount})",
-        "left": f"{target}.scrollBy(-{amount}, 0)",
-        "right": f"{target}.scrollBy({amount}, 0)",
-        "top": f"{target}.scrollTo(0, 0)",
-        "bottom": f"{target}.scrollTo(0, document.body.scrollHeight)",
-    }
+    x: float
+    y: float
+    position = _SCROLL_POSITIONS.get(direction)
+    if position is not None:
+        method, (x, y) = "scrollTo", position
+    else:
+        dx, dy = _SCROLL_STEPS.get(direction, _SCROLL_STEPS["down"])
+        method, x, y = "scrollBy", dx * amount, dy * amount
 
-    js = scroll_code.get(direction, f"{target}.scrollBy(0, {amount})")
-    await ctx.evaluate_js(js)
+    error = await ctx.call_function(_SCROLL_FN, selector, method, x, y)
+    if error:
+        return [TextContent(type="text", text=f"Error: {error}")]
 
-    return [TextContent(type="text", text=f"Scrolled {direction}")]
+    done = _SCROLLED.get(direction) or TextContent(type="text", text=f"Scrolled {direction}")
+    return [done]
 
 
 scroll = register_tool(
@@ -23,13 +23,19 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Empty-result response, built once and shared across calls
+_NO_ACTIVE_SESSIONS = TextContent(type="text", text="No active sessions.")
+
 
 async def _session_start_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult:
     """Start a Chrome session."""
     url = args.get("url", "about:blank")
 
+    # A session created by this call may already have its tab open at the URL
+    opened_url, ctx.instance.initial_url = ctx.instance.initial_url, None
+
     # Navigate if URL provided
-    if url != "about:blank":
+    if url not in ("about:blank", opened_url):
         await ctx.send_cdp("Page.enable")
         await ctx.send_cdp("Page.navigate", {"url": url})
 
@@ -69,7 +75,7 @@ async def _session_list_handler(args: dict[str, Any], ctx: ToolContext) -> Conte
     sessions = ctx.pool.list_sessions()
 
     if not sessions:
-        return [TextContent(type="text", text="No active sessions.")]
+        return [_NO_ACTIVE_SESSIONS]
 
     lines = ["Active sessions:"]
     for sid, info in sessions.items():
@@ -10,17 +10,20 @@ Format matches ChromeDevTools/chrome-devtools-mcp.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 from typing import Any
 
 from mcp.types import TextContent
 
+from ..persistent_cdp import PAGE_WAIT_SLICE_S
 from .base import (
     TIMEOUT_SCHEMA,
     ContentResult,
     ToolCategory,
     ToolContext,
     ToolDefinition,
+    is_context_lost,
     register_tool,
 )
 
@@ -286,37 +289,91 @@ take_snapshot = register_tool(
 
 
 # --- wait_for ---
+# Resolves as soon as the text shows up (checked on every DOM mutation) or
+# with false after the given number of milliseconds, so a single CDP call
+# replaces client-side polling. Each pending wait registers a stop function
+# so an abandoned wait can disconnect its observer early.
+_WAIT_FOR_TEXT_FN = """
+function(text, timeoutMs) {
+    return new Promise((resolve) => {
+        const found = () => !!document.body && document.body.innerText.includes(text);
+        if (found()) return resolve(true);
+        const waits = (globalThis.__mcpTextWaits ??= new Set());
+        const finish = (result) => {
+            observer.disconnect();
+            clearTimeout(timer);
+            waits.delete(stop);
+            resolve(result);
+        };
+        const stop = () => finish(false);
+        const observer = new MutationObserver(() => {
+            if (found()) finish(true);
+        });
+        const timer = setTimeout(stop, timeoutMs);
+        waits.add(stop);
+        observer.observe(document, {childList: true, subtree: true, characterData: true});
+    });
+}
+"""
+
+_STOP_TEXT_WAITS_FN = """
+function() {
+    for (const stop of globalThis.__mcpTextWaits ?? []) stop();
+}
+"""
+
+
+async def wait_for_text(ctx: ToolContext, text: str, args: dict[str, Any]) -> TextContent:
+    """Wait for text to appear on the page, honouring args' ``timeout``.
+
+    Shared by wait_for and the ``waitFor`` option of input tools. The wait
+    runs in page-side slices shorter than the CDP command timeout; a slice
+    cut short by a navigation is re-armed on the new page.
+
+    Returns:
+        A message saying whether the text was found before the timeout.
+
+    Raises:
+        Exception: Any evaluation error other than a lost execution context.
+    """
+    timeout = args.get("timeout", 10000)  # Default 10s in ms
+    timeout_s = timeout / 1000 if timeout > 100 else timeout  # Handle ms or s
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_s
+
+    while (remaining := deadline - loop.time()) > 0:
+        slice_ms = int(min(remaining, PAGE_WAIT_SLICE_S) * 1000)
+        try:
+            found = await ctx.call_function(_WAIT_FOR_TEXT_FN, text, slice_ms)
+        except Exception as e:
+            if not is_context_lost(e):
+                # Don't leave the abandoned slice's observer running
+                with contextlib.suppress(Exception):
+                    await ctx.call_function(_STOP_TEXT_WAITS_FN)
+                raise
+            logger.debug("wait_for evaluation interrupted: %s", e)
+            await asyncio.sleep(0.1)
+            continue
+        if found:
+            return TextContent(
+                type="text",
+                text=f'Element with text "{text}" found.',
+            )
+
+    return TextContent(
+        type="text",
+        text=f'Timeout: Text "{text}" not found after {timeout_s}s',
+    )
+
+
 async def _wait_for_handler(args: dict[str, Any], ctx: ToolContext) -> ContentResult:
     """Wait for specified text to appear on the page."""
     text = args.get("text", "")
-    timeout = args.get("timeout", 10000)  # Default 10s in ms
 
     if not text:
         return [TextContent(type="text", text="Error: text is required")]
 
-    timeout_s = timeout / 1000 if timeout > 100 else timeout  # Handle ms or s
-    poll_interval = 0.5
-    deadline = asyncio.get_event_loop().time() + timeout_s
-
-    while asyncio.get_event_loop().time() < deadline:
-        # Check if text exists in page
-        js = f"document.body.innerText.includes({repr(text)})"
-        found = await ctx.evaluate_js(js)
-        if found:
-            return [
-                TextContent(
-                    type="text",
-                    text=f'Element with text "{text}" found.',
-                )
-            ]
-        await asyncio.sleep(poll_interval)
-
-    return [
-        TextContent(
-            type="text",
-            text=f'Timeout: Text "{text}" not found after {timeout_s}s',
-        )
-    ]
+    return [await wait_for_text(ctx, text, args)]
 
 
 wait_for = register_tool(
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 import subprocess
-from functools import lru_cache
+from functools import cache, lru_cache
 from pathlib import Path
 
 
@@ -139,7 +139,7 @@ def get_windows_host_ip() -> str:
     return "127.0.0.1"
 
 
-@lru_cache(maxsize=1)
+@cache
 def _find_windows_executable(name: str) -> str | None:
     """Dynamically find a Windows executable from WSL.
 
@@ -255,6 +255,7 @@ def get_windows_chrome_paths() -> list[str]:
     ]
 
 
+@lru_cache(maxsize=1)
 def find_windows_chrome() -> str | None:
     """Find Chrome executable on Windows from WSL.
 
@@ -0,0 +1,133 @@
+"""Tests for CDPProxyClient relay reuse."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from wsl_chrome_mcp import cdp_proxy
+from wsl_chrome_mcp.cdp_proxy import CDPProxyClient
+from wsl_chrome_mcp.persistent_cdp import CDPError
+
+WS_URL = "ws://localhost:9222/devtools/page/T1"
+
+
+def _make_relay(ws_url: str) -> MagicMock:
+    relay = MagicMock()
+    relay.ws_url = ws_url
+    relay.is_connected = True
+    relay.connect = AsyncMock()
+    relay.disconnect = AsyncMock()
+    relay.send = AsyncMock(return_value={"ok": True})
+    return relay
+
+
+class TestRelayReuse:
+    """Tests for the per-URL persistent relay WebSockets."""
+
+    async def test_commands_share_one_relay(self) -> None:
+        """Should connect once per ws_url and reuse it for later commands."""
+        client = CDPProxyClient()
+        with patch.object(cdp_proxy, "PowerShellCDPRelay", side_effect=_make_relay) as factory:
+            await client.send_cdp_command(WS_URL, "Page.enable")
+            await client.send_cdp_command(WS_URL, "Page.reload", {"ignoreCache": True})
+
+        assert factory.call_count == 1
+        assert client._relays is not None
+        assert client._relays[WS_URL].send.await_count == 2
+
+    async def test_cdp_error_keeps_relay(self) -> None:
+        """Should report protocol errors like the one-shot path and keep the socket."""
+        client = CDPProxyClient()
+        relay = _make_relay(WS_URL)
+        relay.send.side_effect = CDPError("No node with given id", code=-32000)
+        with (
+            patch.object(cdp_proxy, "PowerShellCDPRelay", return_value=relay),
+            pytest.raises(RuntimeError, match="CDP error: No node"),
+        ):
+            await client.send_cdp_command(WS_URL, "DOM.focus")
+
+        assert client._relays == {WS_URL: relay}
+
+    async def test_connection_error_drops_relay(self) -> None:
+        """Should forget a dead relay so the next command reconnects."""
+        client = CDPProxyClient()
+        relay = _make_relay(WS_URL)
+        relay.send.side_effect = ConnectionError("Relay disconnected")
+        with (
+            patch.object(cdp_proxy, "PowerShellCDPRelay", return_value=relay),
+            pytest.raises(ConnectionError),
+        ):
+            await client.send_cdp_command(WS_URL, "Page.enable")
+
+        assert client._relays == {}
+        relay.disconnect.assert_awaited_once()
+
+    async def test_failed_connect_retries_after_backoff(self) -> None:
+        """Should use one-shot commands after a failed connect, then retry later."""
+        client = CDPProxyClient()
+        failing = _make_relay(WS_URL)
+        failing.connect.side_effect = ConnectionError("PowerShell relay failed to connect")
+        working = _make_relay(WS_URL)
+        one_shot = MagicMock(return_value=MagicMock(returncode=0, stdout='{"id":1,"result":{}}'))
+        with (
+            patch.object(cdp_proxy, "PowerShellCDPRelay", side_effect=[failing, working]),
+            patch.object(cdp_proxy, "run_windows_command", one_shot),
+            patch.object(cdp_proxy.time, "monotonic", return_value=100.0),
+        ):
+            await client.send_cdp_command(WS_URL, "Page.enable")
+            await client.send_cdp_command(WS_URL, "Page.enable")
+            assert one_shot.call_count == 2
+            assert failing.connect.await_count == 1
+
+            cdp_proxy.time.monotonic.return_value = 100.0 + cdp_proxy._RELAY_RETRY_BACKOFF
+            await client.send_cdp_command(WS_URL, "Page.enable")
+
+        assert one_shot.call_count == 2
+        assert client._relays == {WS_URL: working}
+        working.send.assert_awaited_once()
+
+    async def test_close_disconnects_relays(self) -> None:
+        """Should disconnect every open relay."""
+        client = CDPProxyClient()
+        with patch.object(cdp_proxy, "PowerShellCDPRelay", side_effect=_make_relay):
+            await client.send_cdp_command(WS_URL, "Page.enable")
+            await client.send_cdp_command(WS_URL.replace("T1", "T2"), "Page.enable")
+        assert client._relays is not None
+        relays = list(client._relays.values())
+
+        await client.close()
+
+        assert client._relays == {}
+        for relay in relays:
+            relay.disconnect.assert_awaited_once()
+
+
+class TestTargetListing:
+    """Tests for reusing a recent /json/list result."""
+
+    async def test_list_targets_reuses_recent_listing(self) -> None:
+        """Should skip the HTTP fetch only when the caller accepts a recent listing."""
+        client = CDPProxyClient()
+        targets = [{"id": "T1", "type": "page"}]
+        with patch.object(client, "_make_http_request", return_value=targets) as fetch:
+            await client.list_targets()
+            assert await client.list_targets(max_age=60.0) == targets
+            await client.list_targets()
+
+        assert fetch.call_count == 2
+
+    async def test_new_page_invalidates_listing(self) -> None:
+        """Should fetch again after a tab is opened through the proxy."""
+        client = CDPProxyClient()
+        with patch.object(client, "_make_http_request", return_value=[]) as fetch:
+            await client.list_targets()
+            await client.new_page()
+            await client.list_targets(max_age=60.0)
+
+        assert [c.args[0] for c in fetch.call_args_list] == [
+            "/json/list",
+            "/json/new?about:blank",
+            "/json/list",
+        ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import subprocess
 from collections.abc import Generator
 from datetime import datetime
@@ -10,7 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from wsl_chrome_mcp.chrome_pool import ChromeInstance, ChromePoolManager
+from wsl_chrome_mcp.chrome_pool import ChromeInstance, ChromePoolManager, _wait_for_chrome_version
 
 
 def _make_manager(**kwargs: object) -> ChromePoolManager:
@@ -115,6 +116,29 @@ class TestChromeInstance:
         assert len(instance.network_requests) == 0
         assert len(instance.snapshot_cache) == 0
 
+    def test_event_buffers_drop_oldest_when_full(self) -> None:
+        """Should cap collected console and network data, keeping the newest."""
+        instance = make_chrome_instance()
+        with patch("wsl_chrome_mcp.chrome_pool._MAX_NETWORK_REQUESTS", 2):
+            for request_id in ("r1", "r2", "r3"):
+                instance.add_network_request(request_id, MagicMock())
+            instance.add_network_request("r2", MagicMock())
+
+        assert list(instance.network_requests) == ["r2", "r3"]
+        assert instance.console_messages.maxlen == 10_000
+
+    def test_take_console_messages_swaps_buffer(self) -> None:
+        """Should hand back the collected messages and start an empty capped buffer."""
+        instance = make_chrome_instance()
+        message = MagicMock()
+        instance.console_messages.append(message)
+
+        taken = instance.take_console_messages()
+
+        assert list(taken) == [message]
+        assert len(instance.console_messages) == 0
+        assert instance.console_messages.maxlen == 10_000
+
     def test_browser_context_id_stored(self) -> None:
         """Should store browser_context_id."""
         instance = make_chrome_instance(browser_context_id="ctx_abc")
@@ -171,11 +195,36 @@ class TestChromePoolManagerSessions:
         ) as mock_create:
             result = await manager.get_or_create("ses_new")
 
-        mock_create.assert_called_once_with("ses_new")
+        mock_create.assert_called_once_with("ses_new", initial_url=None)
         assert result.session_id == "ses_new"
         assert result.owns_chrome is True
         assert result.browser_context_id is None
 
+    @pytest.mark.asyncio
+    async def test_concurrent_get_or_create_creates_once(self) -> None:
+        """Should create a session once while other sessions proceed in parallel."""
+        manager = _make_manager()
+        created: list[str] = []
+
+        async def create(session_id: str, initial_url: str | None = None) -> ChromeInstance:
+            created.append(session_id)
+            await asyncio.sleep(0.01)
+            instance = make_chrome_instance(session_id, port=9222)
+            instance.cdp = _make_mock_browser_cdp()
+            manager._instances[session_id] = instance
+            return instance
+
+        with patch.object(manager, "_create_isolated_session", side_effect=create):
+            first, second, other = await asyncio.gather(
+                manager.get_or_create("ses_a"),
+                manager.get_or_create("ses_a"),
+                manager.get_or_create("ses_b"),
+            )
+
+        assert first is second
+        assert other.session_id == "ses_b"
+        assert created == ["ses_a", "ses_b"]
+
     @pytest.mark.asyncio
     async def test_get_or_create_profile_mode(self) -> None:
         """Profile mode should create shared session with browser context."""
@@ -203,6 +252,26 @@ class TestChromePoolManagerSessions:
         assert result.window_id == 42
         assert "ses_new" in manager._instances
 
+    @pytest.mark.asyncio
+    async def test_get_or_create_opens_initial_url(self) -> None:
+        """Should create the shared session's tab directly at the initial URL."""
+        manager = _make_manager(profile_mode="profile")
+        mock_browser_cdp = _make_mock_browser_cdp()
+        mock_browser_cdp.send = AsyncMock(return_value={"targetId": "T_new"})
+        manager._browser_cdp = mock_browser_cdp
+        manager._shared_proxy = make_mock_proxy()
+        with (
+            patch.object(manager, "_ensure_shared_chrome", new_callable=AsyncMock),
+            patch.object(manager, "_close_default_tabs", new_callable=AsyncMock),
+            patch.object(manager, "_connect_cdp", new_callable=AsyncMock),
+        ):
+            result = await manager.get_or_create("ses_new", "https://example.com/")
+
+        mock_browser_cdp.send.assert_awaited_once_with(
+            "Target.createTarget", {"url": "https://example.com/"}
+        )
+        assert result.initial_url == "https://example.com/"
+
     @pytest.mark.asyncio
     async def test_destroy_removes_instance(self) -> None:
         """Should remove instance and dispose browser context."""
@@ -221,6 +290,27 @@ class TestChromePoolManagerSessions:
             {"browserContextId": "ctx_abc"},
         )
 
+    @pytest.mark.asyncio
+    async def test_destroy_and_cleanup_remove_capture_dirs(self, tmp_path) -> None:
+        """Should delete each session's capture directory when it ends."""
+        manager = _make_manager()
+        dirs = []
+        for session_id in ("ses_1", "ses_2"):
+            capture_dir = tmp_path / session_id
+            capture_dir.mkdir()
+            (capture_dir / "screenshot-1.png").write_bytes(b"png")
+            dirs.append(capture_dir)
+            instance = make_chrome_instance(session_id, port=9222)
+            instance.capture_dir = str(capture_dir)
+            manager._instances[session_id] = instance
+
+        await manager.destroy("ses_1")
+        assert not dirs[0].exists()
+        assert dirs[1].exists()
+
+        await manager.cleanup_all()
+        assert not dirs[1].exists()
+
     @pytest.mark.asyncio
     async def test_destroy_unknown_raises(self) -> None:
         """Should raise KeyError for unknown session."""
@@ -259,6 +349,61 @@ class TestChromePoolManagerSessions:
 
         assert len(manager._instances) == 0
 
+    @pytest.mark.asyncio
+    async def test_invalidate_all_sessions_disconnects_concurrently(self) -> None:
+        """Should close every page connection at once rather than one by one."""
+        manager = _make_manager()
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        def make_cdp(session_id: str) -> MagicMock:
+            async def disconnect() -> None:
+                started.append(session_id)
+                if len(started) == 2:
+                    both_started.set()
+                await both_started.wait()
+
+            cdp = MagicMock()
+            cdp.disconnect = AsyncMock(side_effect=disconnect)
+            return cdp
+
+        for session_id in ("ses_1", "ses_2"):
+            instance = make_chrome_instance(session_id, port=9222)
+            instance.cdp = make_cdp(session_id)
+            manager._instances[session_id] = instance
+
+        await asyncio.wait_for(manager._invalidate_all_sessions(), timeout=1.0)
+
+        assert sorted(started) == ["ses_1", "ses_2"]
+        assert manager._instances == {}
+
+    @pytest.mark.asyncio
+    async def test_cleanup_all_detaches_concurrently(self) -> None:
+        """Should tear down every session's connections at once on shutdown."""
+        manager = _make_manager()
+        started: list[str] = []
+        both_started = asyncio.Event()
+
+        for session_id in ("ses_1", "ses_2"):
+
+            async def disconnect(session_id: str = session_id) -> None:
+                started.append(session_id)
+                if len(started) == 2:
+                    both_started.set()
+                await both_started.wait()
+
+            instance = make_chrome_instance(session_id, port=9222)
+            instance.cdp = MagicMock()
+            instance.cdp.disconnect = AsyncMock(side_effect=disconnect)
+            manager._instances[session_id] = instance
+            manager._session_locks[session_id] = asyncio.Lock()
+
+        await asyncio.wait_for(manager.cleanup_all(), timeout=1.0)
+
+        assert sorted(started) == ["ses_1", "ses_2"]
+        assert manager._instances == {}
+        assert manager._session_locks == {}
+
     @pytest.mark.asyncio
     async def test_get_or_create_profile_mode_cleans_up_on_failure(self) -> None:
         """Profile mode should clean up on failure and retry."""
@@ -323,6 +468,41 @@ class TestChromePoolManagerTabs:
         assert target_id == "T2"
         assert "T2" in instance.targets
 
+    @pytest.mark.asyncio
+    async def test_create_tab_skips_activate(self) -> None:
+        """Should not re-activate a tab that createTarget opened in front."""
+        manager = _make_manager()
+        instance = make_chrome_instance("ses_abc", browser_context_id="ctx_abc")
+        manager._instances["ses_abc"] = instance
+        mock_browser_cdp = _make_mock_browser_cdp()
+        mock_browser_cdp.send = AsyncMock(return_value={"targetId": "T2"})
+        manager._browser_cdp = mock_browser_cdp
+
+        with patch.object(manager, "_connect_cdp", new_callable=AsyncMock):
+            await manager.create_tab("ses_abc", "https://example.com")
+
+        assert [c.args[0] for c in mock_browser_cdp.send.await_args_list] == ["Target.createTarget"]
+        assert instance.current_target_id == "T2"
+
+    @pytest.mark.asyncio
+    async def test_create_tab_background(self) -> None:
+        """Should ask Chrome to open the tab without bringing it to front."""
+        manager = _make_manager()
+        instance = make_chrome_instance("ses_abc", browser_context_id="ctx_abc")
+        manager._instances["ses_abc"] = instance
+        mock_browser_cdp = _make_mock_browser_cdp()
+        mock_browser_cdp.send = AsyncMock(return_value={"targetId": "T2"})
+        manager._browser_cdp = mock_browser_cdp
+
+        with patch.object(manager, "_connect_cdp", new_callable=AsyncMock):
+            await manager.create_tab("ses_abc", "https://example.com", background=True)
+
+        mock_browser_cdp.send.assert_awaited_once_with(
+            "Target.createTarget",
+            {"url": "https://example.com", "background": True, "browserContextId": "ctx_abc"},
+        )
+        assert instance.current_target_id == "T2"
+
     @pytest.mark.asyncio
     async def test_create_tab_profile_mode_tier1_window_open(self) -> None:
         """Profile-mode create_tab uses window.open with userGesture: true."""
@@ -371,6 +551,77 @@ class TestChromePoolManagerTabs:
         assert params["userGesture"] is True
         assert "window.open(" in params["expression"]
 
+    @pytest.mark.asyncio
+    async def test_wait_for_new_target_resolves_on_event(self) -> None:
+        """Should return the tab announced by Target.targetCreated without polling."""
+        manager = _make_manager()
+        handlers: list = []
+        mock_browser_cdp = _make_mock_browser_cdp()
+        mock_browser_cdp.on = MagicMock(side_effect=lambda event, handler: handlers.append(handler))
+        mock_browser_cdp.send = AsyncMock(
+            return_value={"targetInfos": [{"targetId": "T1", "type": "page"}]}
+        )
+        manager._browser_cdp = mock_browser_cdp
+
+        async def announce() -> None:
+            while not handlers:
+                await asyncio.sleep(0)
+            handlers[0]({"targetInfo": {"targetId": "W1", "type": "service_worker"}})
+            handlers[0]({"targetInfo": {"targetId": "T_NEW", "type": "page"}})
+
+        announcer = asyncio.create_task(announce())
+        target_id = await manager._wait_for_new_target({"T1"}, timeout=1.0)
+        await announcer
+
+        assert target_id == "T_NEW"
+        methods = [c.args[0] for c in mock_browser_cdp.send.await_args_list]
+        assert methods == [
+            "Target.setDiscoverTargets",
+            "Target.getTargets",
+            "Target.setDiscoverTargets",
+        ]
+        assert mock_browser_cdp.send.await_args_list[-1].args[1] == {"discover": False}
+        mock_browser_cdp.off.assert_called_once_with("Target.targetCreated", handlers[0])
+
+    @pytest.mark.asyncio
+    async def test_overlapping_waits_keep_discovery_on(self) -> None:
+        """Should switch discovery off only after the last pending wait ends."""
+        manager = _make_manager()
+        handlers: list = []
+        mock_browser_cdp = _make_mock_browser_cdp()
+        mock_browser_cdp.on = MagicMock(side_effect=lambda event, handler: handlers.append(handler))
+        mock_browser_cdp.off = MagicMock(
+            side_effect=lambda event, handler: handlers.remove(handler)
+        )
+        mock_browser_cdp.send = AsyncMock(return_value={"targetInfos": []})
+        manager._browser_cdp = mock_browser_cdp
+
+        def announce(target_id: str) -> None:
+            for handler in list(handlers):
+                handler({"targetInfo": {"targetId": target_id, "type": "page"}})
+
+        def discovery_offs() -> int:
+            return sum(
+                1
+                for c in mock_browser_cdp.send.await_args_list
+                if c.args[1:] == ({"discover": False},)
+            )
+
+        first = asyncio.create_task(manager._wait_for_new_target(set(), timeout=1.0))
+        second = asyncio.create_task(manager._wait_for_new_target({"T_A"}, timeout=1.0))
+        while len(handlers) < 2:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        announce("T_A")
+        assert await first == "T_A"
+        assert discovery_offs() == 0
+
+        announce("T_B")
+        assert await second == "T_B"
+        assert discovery_offs() == 1
+        assert manager._target_waiters == 0
+
     @pytest.mark.asyncio
     async def test_create_tab_profile_mode_tier2_fallback(self) -> None:
         """Profile-mode falls back to Target.createTarget when window.open fails."""
@@ -472,6 +723,33 @@ class TestChromePoolManagerTabs:
         assert tabs[0]["id"] == "T1"
         assert tabs[0]["is_current"] is True
 
+    @pytest.mark.asyncio
+    async def test_list_tabs_uses_browser_cdp(self) -> None:
+        """Should list tabs over the browser WebSocket instead of HTTP."""
+        manager = _make_manager()
+        instance = make_chrome_instance("ses_abc")
+        instance.targets = ["T1", "T2"]
+        browser_cdp = MagicMock()
+        browser_cdp.is_connected = True
+        browser_cdp.send = AsyncMock(
+            return_value={
+                "targetInfos": [
+                    {"targetId": "T2", "type": "page", "title": "Two", "url": "https://two"},
+                    {"targetId": "T9", "type": "page", "title": "Other", "url": "https://x"},
+                    {"targetId": "T1", "type": "page", "title": "One", "url": "https://one"},
+                ]
+            }
+        )
+        manager._browser_cdp = browser_cdp
+        manager._instances["ses_abc"] = instance
+
+        tabs = await manager.list_tabs("ses_abc")
+
+        assert [t["id"] for t in tabs] == ["T2", "T1"]
+        assert tabs[1] == {"id": "T1", "title": "One", "url": "https://one", "is_current": True}
+        assert instance.proxy is not None
+        instance.proxy.list_targets.assert_not_awaited()
+
 
 # --- Integration-style Tests ---
 
@@ -552,6 +830,42 @@ class TestChromePoolManagerCleanup:
             assert manager is not None
 
 
+class TestLaunchChrome:
+    """Tests for the single-call Chrome launch."""
+
+    def test_launch_uses_one_powershell_call(self) -> None:
+        """Should find Chrome, create the profile dir and launch in one call."""
+        manager = _make_manager()
+        result = MagicMock(spec=subprocess.CompletedProcess)
+        result.returncode = 0
+        result.stdout = '{"chrome":"C:\\\\chrome.exe","userDataDir":"C:\\\\Temp\\\\mcp","pid":42}'
+        with patch("wsl_chrome_mcp.chrome_pool.run_windows_command", return_value=result) as run:
+            user_data_dir, pid = manager._launch_chrome(
+                ["--remote-debugging-port=9222", "--profile-directory=Profile 1"],
+                "$ud = 'C:\\Temp\\mcp'",
+            )
+
+        run.assert_called_once()
+        script = run.call_args[0][0]
+        assert "Start-Process" in script
+        assert '"--profile-directory=Profile 1"' in script
+        assert (user_data_dir, pid) == ("C:\\Temp\\mcp", 42)
+        assert manager._chrome_path == "C:\\chrome.exe"
+
+    def test_launch_failure_reports_powershell_error(self) -> None:
+        """Should raise with PowerShell's stderr when the script fails."""
+        manager = _make_manager()
+        result = MagicMock(spec=subprocess.CompletedProcess)
+        result.returncode = 1
+        result.stdout = ""
+        result.stderr = "Chrome not found on Windows"
+        with (
+            patch("wsl_chrome_mcp.chrome_pool.run_windows_command", return_value=result),
+            pytest.raises(RuntimeError, match="Chrome not found on Windows"),
+        ):
+            manager._launch_chrome([], "$ud = 'C:\\Temp\\mcp'")
+
+
 # --- Chrome Adoption & Default Tab Tests ---
 
 
@@ -720,3 +1034,50 @@ class TestCloseDefaultTabs:
 
         await manager._close_default_tabs("some-target")
         assert manager._default_tabs_closed is True
+
+
+class TestWsCandidates:
+    """Tests for WebSocket candidate ordering under WSL NAT."""
+
+    def test_last_working_host_is_tried_first(self) -> None:
+        """Should put the host that connected last at the front."""
+        manager = _make_manager()
+        url = "ws://localhost:9222/devtools/page/T1"
+        with (
+            patch("wsl_chrome_mcp.chrome_pool.is_wsl", return_value=True),
+            patch("wsl_chrome_mcp.chrome_pool.is_mirrored_networking", return_value=False),
+            patch("wsl_chrome_mcp.chrome_pool.get_windows_host_ip", return_value="172.20.0.1"),
+        ):
+            assert manager._ws_candidates(url) == [
+                url,
+                "ws://172.20.0.1:9222/devtools/page/T1",
+            ]
+            manager._ws_host = "172.20.0.1"
+            assert manager._ws_candidates(url) == [
+                "ws://172.20.0.1:9222/devtools/page/T1",
+                url,
+            ]
+
+
+class TestWaitForChromeVersion:
+    """Tests for the Chrome startup readiness poll."""
+
+    @pytest.mark.asyncio
+    async def test_returns_once_chrome_answers(self) -> None:
+        """Should keep probing until /json/version responds."""
+        proxy = make_mock_proxy()
+        proxy.get_version = AsyncMock(side_effect=[None, None, {"Browser": "Chrome/120.0"}])
+
+        version = await _wait_for_chrome_version(proxy, timeout=5.0)
+
+        assert version == {"Browser": "Chrome/120.0"}
+        assert proxy.get_version.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_timeout(self) -> None:
+        """Should return None when Chrome never answers."""
+        proxy = make_mock_proxy()
+        proxy.get_version = AsyncMock(return_value=None)
+
+        assert await _wait_for_chrome_version(proxy, timeout=0.0) is None
+        proxy.get_version.assert_awaited_once()
@@ -0,0 +1,83 @@
+"""Tests for the persistent CDP WebSocket client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from websockets.asyncio.server import ServerConnection, serve
+
+from wsl_chrome_mcp.persistent_cdp import CDPError, PersistentCDPClient, enable_domains
+
+
+async def _echo_cdp(ws: ServerConnection) -> None:
+    """Answer each command and emit a console event, like a page target."""
+    async for raw in ws:
+        command = json.loads(raw)
+        await ws.send(
+            json.dumps({"method": "Runtime.consoleAPICalled", "params": {"text": "héllo"}})
+        )
+        await ws.send(json.dumps({"id": command["id"], "result": {"method": command["method"]}}))
+
+
+class TestPersistentCDPClient:
+    """Tests against a local WebSocket server."""
+
+    async def test_round_trip_and_events(self) -> None:
+        """Should route replies by id and deliver non-ASCII event payloads."""
+        async with serve(_echo_cdp, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = PersistentCDPClient(f"ws://127.0.0.1:{port}/devtools/page/T1")
+            events: list[dict] = []
+            client.on("Runtime.consoleAPICalled", events.append)
+            await client.connect()
+            try:
+                result = await client.send("Runtime.enable")
+            finally:
+                await client.disconnect()
+
+        assert result == {"method": "Runtime.enable"}
+        assert events == [{"text": "héllo"}]
+
+    async def test_server_close_ends_receive_loop(self) -> None:
+        """Should stop receiving quietly when the peer closes normally."""
+
+        async def close_at_once(ws: ServerConnection) -> None:
+            await ws.close()
+
+        async with serve(close_at_once, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            client = PersistentCDPClient(f"ws://127.0.0.1:{port}/devtools/page/T1")
+            await client.connect()
+            assert client._receive_task is not None
+            await asyncio.wait_for(client._receive_task, timeout=1.0)
+            await client.disconnect()
+
+
+class _PendingClient:
+    """Client whose replies arrive only after every command has been sent."""
+
+    def __init__(self, expected: int) -> None:
+        self.sent: list[str] = []
+        self._expected = expected
+        self._all_sent = asyncio.Event()
+
+    async def send(
+        self, method: str, params: dict | None = None, timeout: float | None = None
+    ) -> dict:
+        self.sent.append(method)
+        if len(self.sent) == self._expected:
+            self._all_sent.set()
+        await self._all_sent.wait()
+        if method == "DOM.enable":
+            raise CDPError("DOM unavailable")
+        return {}
+
+
+async def test_enable_domains_pipelines_commands() -> None:
+    """Should send every enable before awaiting replies and tolerate failures."""
+    client = _PendingClient(expected=3)
+
+    await asyncio.wait_for(enable_domains(client, ["Page", "DOM", "Network"]), timeout=1.0)  # type: ignore[arg-type]
+
+    assert client.sent == ["Page.enable", "DOM.enable", "Network.enable"]
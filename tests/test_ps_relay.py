@@ -0,0 +1,340 @@
+"""Tests for the PowerShell CDP relay and its multiplexed process client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from wsl_chrome_mcp import ps_relay
+from wsl_chrome_mcp.persistent_cdp import CDPError, _encode_message
+from wsl_chrome_mcp.ps_relay import (
+    PowerShellCDPRelay,
+    _build_mux_script,
+    _build_relay_script,
+    _MuxClient,
+    _stdin_fileno,
+    _write_stdin,
+)
+
+
+def _make_fake_process() -> MagicMock:
+    """Create a fake relay process with a feedable stdout and recorded stdin."""
+    process = MagicMock()
+    process.returncode = None
+    process.stdout = asyncio.StreamReader()
+    process.stderr = asyncio.StreamReader()
+    process.stdin = MagicMock()
+    process.stdin.drain = AsyncMock()
+    process.wait = AsyncMock(return_value=0)
+    return process
+
+
+def _written_lines(process: MagicMock) -> list[dict]:
+    return [json.loads(call.args[0]) for call in process.stdin.write.call_args_list]
+
+
+async def _make_running_mux() -> tuple[_MuxClient, MagicMock]:
+    mux = _MuxClient()
+    process = _make_fake_process()
+    mux._process = process
+    mux._receive_task = asyncio.create_task(mux._receive_loop())
+    return mux, process
+
+
+async def _open(mux: _MuxClient, process: MagicMock, relay: PowerShellCDPRelay) -> int:
+    task = asyncio.create_task(mux.open_channel(relay))
+    await asyncio.sleep(0)
+    channel = _written_lines(process)[-1]["id"]
+    process.stdout.feed_data(b'{"__mux":"opened","id":%d}\n' % channel)
+    assert await task == channel
+    relay._mux = mux
+    relay._channel = channel
+    relay._connected = True
+    relay._loop = asyncio.get_running_loop()
+    relay._frame_head = b'{"__mux_ch":%d,"id":' % channel
+    return channel
+
+
+class TestFrameEncoding:
+    """Tests for relay command serialisation."""
+
+    def test_frame_matches_json_dumps(self) -> None:
+        """Should produce the same JSON object as serialising the full message."""
+        relay = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+        frame = relay._encode_frame(7, "Runtime.evaluate", {"expression": "'\u00e9'"})
+
+        assert frame.endswith(b"\n")
+        assert frame.isascii()
+        assert json.loads(frame) == {
+            "id": 7,
+            "method": "Runtime.evaluate",
+            "params": {"expression": "'\u00e9'"},
+        }
+
+    def test_frame_without_params(self) -> None:
+        """Should omit params when none are given."""
+        relay = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+        relay._frame_head = b'{"__mux_ch":3,"id":'
+
+        assert relay._encode_frame(1, "Page.enable", None) == (
+            b'{"__mux_ch":3,"id":1,"method":"Page.enable"}\n'
+        )
+
+    def test_direct_message_encoding_handles_wide_ints(self) -> None:
+        """Should fall back to json for values the fast encoder rejects."""
+        message = {"id": 1, "method": "Runtime.evaluate", "params": {"n": 2**70}}
+
+        assert json.loads(_encode_message(message)) == message
+        assert json.loads(_encode_message({"id": 2, "method": "Page.enable"})) == {
+            "id": 2,
+            "method": "Page.enable",
+        }
+
+
+class TestRelayScripts:
+    """Tests for the PowerShell scripts that host the relay."""
+
+    def test_nagle_disabled_before_connecting(self) -> None:
+        """Should turn off Nagle before any WebSocket is opened."""
+        for script in (_build_relay_script("ws://localhost:9222/x"), _build_mux_script()):
+            nagle = script.index("UseNagleAlgorithm = $false")
+            assert nagle < script.index("]::Run(")
+
+
+class TestStdinWrites:
+    """Tests for writing frames to a relay process's stdin."""
+
+    async def test_small_and_large_frames_keep_order(self) -> None:
+        """Should deliver direct and transport-buffered writes in order."""
+        process = await asyncio.create_subprocess_exec(
+            "cat",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=1024 * 1024,
+        )
+        assert process.stdin and process.stdout
+        fd = _stdin_fileno(process)
+        assert fd is not None
+        frames = [b"small-1\n", b"x" * 100_000 + b"\n", b"small-2\n"]
+
+        for frame in frames:
+            await _write_stdin(process.stdin, fd, frame)
+        received = [await process.stdout.readline() for _ in frames]
+
+        process.stdin.close()
+        await process.wait()
+        assert received == frames
+
+
+class TestMuxClient:
+    """Tests for channel routing inside the shared relay process."""
+
+    async def test_open_channel_sends_control_frame(self) -> None:
+        """Should request a WebSocket for the relay URL and wait for the ack."""
+        mux, process = await _make_running_mux()
+        relay = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+
+        channel = await _open(mux, process, relay)
+
+        assert _written_lines(process)[0] == {
+            "__mux": "open",
+            "id": channel,
+            "url": "ws://localhost:9222/devtools/page/T1",
+        }
+        await mux.close()
+
+    async def test_open_channel_error_raises(self) -> None:
+        """Should surface a channel error as ConnectionError."""
+        mux, process = await _make_running_mux()
+        relay = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+
+        task = asyncio.create_task(mux.open_channel(relay))
+        await asyncio.sleep(0)
+        process.stdout.feed_data(b'{"__mux":"error","id":1,"message":"refused"}\n')
+
+        with pytest.raises(ConnectionError, match="refused"):
+            await task
+        assert mux._channels == {}
+        await mux.close()
+
+    async def test_responses_are_routed_by_channel(self) -> None:
+        """Should deliver each tagged frame only to the relay owning the channel."""
+        mux, process = await _make_running_mux()
+        first = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+        second = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T2")
+        ch1 = await _open(mux, process, first)
+        ch2 = await _open(mux, process, second)
+
+        send1 = asyncio.create_task(first.send("Runtime.evaluate", {"expression": "1"}))
+        send2 = asyncio.create_task(second.send("Page.reload"))
+        await asyncio.sleep(0)
+
+        frames = _written_lines(process)[-2:]
+        assert frames[0] == {
+            "__mux_ch": ch1,
+            "id": 1,
+            "method": "Runtime.evaluate",
+            "params": {"expression": "1"},
+        }
+        assert frames[1] == {"__mux_ch": ch2, "id": 1, "method": "Page.reload"}
+
+        process.stdout.feed_data(b'{"__mux_ch":%d,"id":1,"result":{"value":2}}\n' % ch2)
+        process.stdout.feed_data(
+            b'{"__mux_ch":%d,"id":1,"error":{"message":"boom","code":-1}}\n' % ch1
+        )
+
+        assert await send2 == {"value": 2}
+        with pytest.raises(CDPError, match="boom"):
+            await send1
+        await mux.close()
+
+    async def test_closed_channel_fails_pending(self) -> None:
+        """Should disconnect a relay when its channel is closed by the browser."""
+        mux, process = await _make_running_mux()
+        relay = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+        channel = await _open(mux, process, relay)
+
+        pending = asyncio.create_task(relay.send("Page.enable"))
+        await asyncio.sleep(0)
+        process.stdout.feed_data(b'{"__mux":"closed","id":%d}\n' % channel)
+
+        with pytest.raises(ConnectionError):
+            await pending
+        assert relay.is_connected is False
+        await mux.close()
+
+    async def test_process_exit_disconnects_all_channels(self) -> None:
+        """Should disconnect every relay when the shared process exits."""
+        mux, process = await _make_running_mux()
+        first = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+        second = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T2")
+        await _open(mux, process, first)
+        await _open(mux, process, second)
+
+        process.stdout.feed_eof()
+        await mux._receive_task
+
+        assert first.is_connected is False
+        assert second.is_connected is False
+
+    async def test_process_exit_reaps_process(self, tmp_path) -> None:
+        """Should terminate the process, stop stderr and delete the script on EOF."""
+        mux, process = await _make_running_mux()
+        script = tmp_path / "mux.ps1"
+        script.write_text("")
+        mux._script_path = str(script)
+        stderr_task = asyncio.create_task(asyncio.sleep(3600))
+        mux._stderr_task = stderr_task
+
+        process.stdout.feed_eof()
+        await mux._receive_task
+
+        process.terminate.assert_called_once()
+        assert stderr_task.cancelled()
+        assert not script.exists()
+        assert mux.is_running is False
+
+    async def test_unwanted_frames_skip_decoding(self) -> None:
+        """Should drop unhandled events and stale replies without decoding them."""
+        mux, process = await _make_running_mux()
+        relay = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+        channel = await _open(mux, process, relay)
+        received: list[dict] = []
+        relay.on("Page.loadEventFired", received.append)
+
+        with patch.object(ps_relay, "decode_message", wraps=json.loads) as loads:
+            process.stdout.feed_data(
+                b'{"__mux_ch":%d,"method":"Network.dataReceived","params":{}}\n' % channel
+            )
+            process.stdout.feed_data(b'{"__mux_ch":%d,"id":99,"result":{}}\n' % channel)
+            process.stdout.feed_data(
+                b'{"__mux_ch":%d,"method":"Page.loadEventFired","params":{"t":1}}\n' % channel
+            )
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        assert loads.call_count == 1
+        assert received == [{"t": 1}]
+        await mux.close()
+
+    async def test_send_timeout_clears_pending(self) -> None:
+        """Should raise TimeoutError naming the method and forget the request."""
+        mux, process = await _make_running_mux()
+        relay = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+        await _open(mux, process, relay)
+
+        with pytest.raises(asyncio.TimeoutError, match="Page.enable"):
+            await relay.send("Page.enable", timeout=0.01)
+        assert relay._pending == {}
+        await mux.close()
+
+
+class TestMuxFallback:
+    """Tests for falling back to a dedicated relay process."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_mux(self, monkeypatch) -> None:
+        monkeypatch.setattr(ps_relay, "_mux_client", None)
+        monkeypatch.setattr(ps_relay, "_mux_lock", None)
+        monkeypatch.setattr(ps_relay, "_mux_retry_at", 0.0)
+
+    async def test_failed_start_uses_dedicated_and_backs_off(self) -> None:
+        """Should use a dedicated relay and skip the mux until the backoff ends."""
+        start = AsyncMock(side_effect=ConnectionError("no READY"))
+        dedicated = AsyncMock()
+        with (
+            patch.object(_MuxClient, "start", start),
+            patch.object(PowerShellCDPRelay, "_connect_dedicated", dedicated),
+        ):
+            await PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1").connect()
+            await PowerShellCDPRelay("ws://localhost:9222/devtools/page/T2").connect()
+
+            assert start.await_count == 1
+            assert dedicated.await_count == 2
+
+            ps_relay._mux_retry_at = 0.0
+            await PowerShellCDPRelay("ws://localhost:9222/devtools/page/T3").connect()
+            assert start.await_count == 2
+
+    async def test_shutdown_resets_lock_and_backoff(self) -> None:
+        """Should drop the loop-bound lock and the failure backoff on shutdown."""
+        ps_relay._mux_lock = asyncio.Lock()
+        ps_relay._mux_retry_at = float("inf")
+
+        await ps_relay.shutdown_mux_relay()
+
+        assert ps_relay._mux_lock is None
+        assert ps_relay._mux_retry_at == 0.0
+
+
+class TestEventHandlers:
+    """Tests for relay event subscription."""
+
+    def test_off_removes_bound_method(self) -> None:
+        """Should unsubscribe a bound method passed as a fresh attribute lookup."""
+
+        class Listener:
+            def handle(self, params: dict) -> None:
+                pass
+
+        listener = Listener()
+        relay = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+        relay.on("Page.loadEventFired", listener.handle)
+        relay.on("Page.loadEventFired", print)
+
+        relay.off("Page.loadEventFired", listener.handle)
+
+        assert list(relay._event_handlers["Page.loadEventFired"]) == [print]
+
+    def test_off_without_handler_removes_event(self) -> None:
+        """Should drop every handler for the event."""
+        relay = PowerShellCDPRelay("ws://localhost:9222/devtools/page/T1")
+        relay.on("Page.loadEventFired", print)
+
+        relay.off("Page.loadEventFired")
+        relay.off("Never.subscribed")
+
+        assert "Page.loadEventFired" not in relay._event_handlers
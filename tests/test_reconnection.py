@@ -124,7 +124,7 @@ async def test_get_or_create_creates_new_when_no_disk_record() -> None:
             new_instance = make_chrome_instance(session_id=session_id)
 
             # _create_isolated_session stores the instance itself
-            async def create_and_store(sid: str) -> ChromeInstance:
+            async def create_and_store(sid: str, initial_url: str | None = None) -> ChromeInstance:
                 manager._instances[sid] = new_instance
                 return new_instance
 
@@ -133,7 +133,7 @@ async def test_get_or_create_creates_new_when_no_disk_record() -> None:
             result = await manager.get_or_create(session_id)
 
             # Verify creation was called
-            mock_create.assert_called_once_with(session_id)
+            mock_create.assert_called_once_with(session_id, initial_url=None)
             assert result.session_id == session_id
             assert manager._instances[session_id] == result
 
@@ -167,7 +167,7 @@ async def test_get_or_create_deletes_stale_on_dead_chrome() -> None:
                     # Verify stale record was deleted
                     mock_delete.assert_called_once_with(session_id)
                     # Verify new Chrome was created
-                    mock_create.assert_called_once_with(session_id)
+                    mock_create.assert_called_once_with(session_id, initial_url=None)
                     assert result.session_id == session_id
 
 
@@ -183,12 +183,14 @@ async def test_session_creation_persists_to_disk(tmp_path: Path) -> None:
 
         # Mock Chrome launch
         with patch("wsl_chrome_mcp.chrome_pool.run_windows_command") as mock_run:
-            # Mock temp dir creation
-            mock_run.side_effect = [
-                MagicMock(returncode=0, stdout="C:\\Temp\\chrome-mcp-abc123\n"),
-                # Chrome launch
-                MagicMock(returncode=0, stdout="5678\n"),
-            ]
+            # Mock the combined find + temp dir + launch call
+            mock_run.return_value = MagicMock(
+                returncode=0,
+                stdout=(
+                    '{"chrome":"C:\\\\Chrome","userDataDir":'
+                    '"C:\\\\Temp\\\\chrome-mcp-abc123","pid":5678}\n'
+                ),
+            )
 
             with patch.object(manager, "_find_chrome_path", return_value="C:\\Chrome"):
                 with patch("wsl_chrome_mcp.chrome_pool.CDPProxyClient") as mock_proxy_class:
@@ -0,0 +1,342 @@
+"""Tests for the MCP server layer: ToolContextImpl and call_tool routing."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams, ListToolsRequest
+
+from wsl_chrome_mcp.chrome_pool import ChromeInstance
+from wsl_chrome_mcp.persistent_cdp import CDPError
+from wsl_chrome_mcp.server import (
+    MCP_TOOLS,
+    TOOL_ALIASES,
+    TOOL_HANDLERS,
+    ChromeMCPServer,
+    ToolContextImpl,
+)
+from wsl_chrome_mcp.tools import get_all_tools, get_tool
+
+
+def _make_proxy_instance() -> ChromeInstance:
+    """Create an instance with no persistent CDP, only the HTTP proxy."""
+    proxy = MagicMock()
+    proxy.list_targets = AsyncMock(
+        return_value=[
+            {
+                "id": "T1",
+                "type": "page",
+                "url": "about:blank",
+                "webSocketDebuggerUrl": "ws://localhost:9222/devtools/page/T1",
+            }
+        ]
+    )
+    proxy.send_cdp_command = AsyncMock(return_value={"ok": True})
+    return ChromeInstance(
+        session_id="s1",
+        port=9222,
+        pid=None,
+        user_data_dir="",
+        proxy=proxy,
+        current_target_id="T1",
+        targets=["T1"],
+    )
+
+
+class TestToolList:
+    """Tests for the precomputed MCP tool list."""
+
+    def test_covers_registry_with_session_id(self) -> None:
+        """Should expose every registered tool with the session_id property."""
+        assert [tool.name for tool in MCP_TOOLS] == [t.name for t in get_all_tools()]
+        for tool in MCP_TOOLS:
+            assert "session_id" in tool.inputSchema["properties"]
+
+    async def test_list_tools_returns_prebuilt_tools(self) -> None:
+        """Should hand out the precomputed Tool objects without rebuilding them."""
+        server = ChromeMCPServer()
+        handler = server.server.request_handlers[ListToolsRequest]
+
+        first = await handler(ListToolsRequest(method="tools/list"))
+        second = await handler(ListToolsRequest(method="tools/list"))
+
+        tools = first.root.tools  # type: ignore[union-attr]
+        assert all(a is b for a, b in zip(tools, MCP_TOOLS, strict=True))
+        assert second.root.tools == tools  # type: ignore[union-attr]
+
+
+async def _call_tool(server: ChromeMCPServer, name: str, arguments: dict) -> str:
+    """Invoke the registered call_tool handler and return its first text."""
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    result = await handler(request)
+    return result.root.content[0].text  # type: ignore[no-any-return,union-attr]
+
+
+class TestCallToolDispatch:
+    """Tests for call_tool routing through the handler table."""
+
+    def test_aliases_share_handlers(self) -> None:
+        """Should map every alias to its target tool's handler."""
+        for alias, target in TOOL_ALIASES.items():
+            tool_def = get_tool(target)
+            assert tool_def is not None
+            assert TOOL_HANDLERS[alias] is tool_def.handler
+
+    async def test_unknown_tool_does_not_start_chrome(self) -> None:
+        """Should reject unknown tools before creating a session."""
+        server = ChromeMCPServer()
+        pool = MagicMock()
+        pool.get_or_create = AsyncMock()
+        server._pool = pool
+
+        text = await _call_tool(server, "no_such_tool", {"session_id": "s1"})
+
+        assert text == "Unknown tool: no_such_tool"
+        pool.get_or_create.assert_not_awaited()
+
+    async def test_arguments_are_not_mutated(self) -> None:
+        """Should read session_id without removing it from the caller's dict."""
+        server = ChromeMCPServer()
+        pool = MagicMock()
+        pool.get_or_create = AsyncMock(return_value=_make_proxy_instance())
+        server._pool = pool
+        handler = AsyncMock(return_value=[])
+        arguments = {"session_id": "s1", "url": "https://example.com"}
+
+        with patch.dict(TOOL_HANDLERS, {"probe": handler}):
+            await server.server.request_handlers[CallToolRequest](
+                CallToolRequest(
+                    method="tools/call",
+                    params=CallToolRequestParams(name="probe", arguments=arguments),
+                )
+            )
+
+        pool.get_or_create.assert_awaited_once_with("s1")
+        assert handler.await_args.args[0] == {"session_id": "s1", "url": "https://example.com"}
+
+
+class TestSendCdpProxyFallback:
+    """Tests for the proxy fallback path of ToolContextImpl.send_cdp."""
+
+    async def test_ws_url_resolved_once(self) -> None:
+        """Should list targets once and reuse the cached WebSocket URL."""
+        instance = _make_proxy_instance()
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        await ctx.send_cdp("Page.reload")
+        await ctx.send_cdp("Page.reload")
+
+        assert instance.proxy is not None
+        assert instance.proxy.list_targets.await_count == 1
+        instance.proxy.send_cdp_command.assert_awaited_with(
+            "ws://localhost:9222/devtools/page/T1", "Page.reload", None
+        )
+
+    async def test_connection_error_refreshes_cache(self) -> None:
+        """Should re-list targets when the cached URL stops working."""
+        instance = _make_proxy_instance()
+        instance.ws_url_cache["T1"] = "ws://localhost:9222/devtools/page/stale"
+        assert instance.proxy is not None
+        instance.proxy.send_cdp_command.side_effect = [ConnectionError("gone"), {"ok": True}]
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        assert await ctx.send_cdp("Page.reload") == {"ok": True}
+        assert instance.proxy.list_targets.await_count == 1
+        assert instance.ws_url_cache["T1"] == "ws://localhost:9222/devtools/page/T1"
+
+    async def test_cdp_error_is_not_retried(self) -> None:
+        """Should propagate protocol errors without re-resolving the target."""
+        instance = _make_proxy_instance()
+        instance.ws_url_cache["T1"] = "ws://localhost:9222/devtools/page/T1"
+        assert instance.proxy is not None
+        instance.proxy.send_cdp_command.side_effect = RuntimeError("CDP error: bad params")
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        with pytest.raises(RuntimeError, match="bad params"):
+            await ctx.send_cdp("Page.reload")
+        instance.proxy.list_targets.assert_not_awaited()
+
+
+class TestSendCdpBatch:
+    """Tests for ToolContextImpl.send_cdp_batch."""
+
+    async def test_persistent_commands_are_pipelined(self) -> None:
+        """Should write every command before the first reply arrives."""
+        instance = _make_proxy_instance()
+        release = asyncio.Event()
+        sent: list[str] = []
+
+        async def send(method: str, params: dict | None = None) -> dict:
+            sent.append(method)
+            await release.wait()
+            return {"method": method}
+
+        instance.cdp = MagicMock()
+        instance.cdp.is_connected = True
+        instance.cdp.send = send
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        task = asyncio.create_task(ctx.send_cdp_batch([("A.one", None), ("B.two", {"x": 1})]))
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert sent == ["A.one", "B.two"]
+        release.set()
+
+        assert await task == [{"method": "A.one"}, {"method": "B.two"}]
+
+    async def test_drop_mid_batch_sends_only_unsent_via_proxy(self) -> None:
+        """Should hand the proxy only the commands the socket never received."""
+        instance = _make_proxy_instance()
+        assert instance.proxy is not None
+        instance.proxy.send_cdp_batch = AsyncMock(return_value=[{"n": 2}])
+        cdp = MagicMock()
+        cdp.is_connected = True
+
+        async def send(method: str, params: dict | None = None) -> dict:
+            cdp.is_connected = False
+            return {"n": 1}
+
+        cdp.send = send
+        instance.cdp = cdp
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        result = await ctx.send_cdp_batch([("A.one", None), ("B.two", None)])
+
+        assert result == [{"n": 1}, {"n": 2}]
+        instance.proxy.send_cdp_batch.assert_awaited_once_with(
+            "ws://localhost:9222/devtools/page/T1", [("B.two", None)]
+        )
+
+    async def test_failure_after_send_is_not_replayed(self) -> None:
+        """Should raise rather than replay commands already on the socket."""
+        instance = _make_proxy_instance()
+        assert instance.proxy is not None
+        instance.proxy.send_cdp_batch = AsyncMock(return_value=[{}, {}])
+        instance.cdp = MagicMock()
+        instance.cdp.is_connected = True
+        instance.cdp.send = AsyncMock(side_effect=ConnectionError("Connection closed"))
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        with pytest.raises(ConnectionError):
+            await ctx.send_cdp_batch([("A.one", None), ("B.two", None)])
+        instance.proxy.send_cdp_batch.assert_not_awaited()
+
+    async def test_proxy_fallback_uses_one_batch(self) -> None:
+        """Should hand the whole batch to the proxy in a single call."""
+        instance = _make_proxy_instance()
+        assert instance.proxy is not None
+        instance.proxy.send_cdp_batch = AsyncMock(return_value=[{}, {}])
+        ctx = ToolContextImpl(instance, MagicMock())
+        commands: list[tuple[str, dict | None]] = [("Page.enable", None), ("Page.reload", None)]
+
+        assert await ctx.send_cdp_batch(commands) == [{}, {}]
+        instance.proxy.send_cdp_batch.assert_awaited_once_with(
+            "ws://localhost:9222/devtools/page/T1", commands
+        )
+
+
+class TestCallFunction:
+    """Tests for ToolContextImpl.call_function."""
+
+    async def test_persistent_reuses_global_handle(self) -> None:
+        """Should resolve globalThis once and pass arguments as CDP values."""
+        instance = _make_proxy_instance()
+        instance.cdp = MagicMock()
+        instance.cdp.is_connected = True
+        instance.cdp.send = AsyncMock(
+            side_effect=[
+                {"result": {"objectId": "G1"}},
+                {"result": {"value": 1}},
+                {"result": {"value": 2}},
+            ]
+        )
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        assert await ctx.call_function("function(a) { return a; }", "x'y") == 1
+        assert await ctx.call_function("function(a) { return a; }", "z") == 2
+
+        calls = instance.cdp.send.await_args_list
+        assert [c.args[0] for c in calls] == [
+            "Runtime.evaluate",
+            "Runtime.callFunctionOn",
+            "Runtime.callFunctionOn",
+        ]
+        assert calls[1].args[1]["objectId"] == "G1"
+        assert calls[1].args[1]["arguments"] == [{"value": "x'y"}]
+
+    async def test_stale_handle_is_resolved_again(self) -> None:
+        """Should re-fetch globalThis when the cached handle is rejected."""
+        instance = _make_proxy_instance()
+        instance.global_object_id = "OLD"
+        instance.cdp = MagicMock()
+        instance.cdp.is_connected = True
+        instance.cdp.send = AsyncMock(
+            side_effect=[
+                CDPError("Could not find object with given id"),
+                {"result": {"objectId": "NEW"}},
+                {"result": {"value": True}},
+            ]
+        )
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        assert await ctx.call_function("function() { return true; }") is True
+        assert instance.global_object_id == "NEW"
+
+    async def test_persistent_transport_error_falls_back_to_proxy(self) -> None:
+        """Should retry through the proxy when the persistent socket fails."""
+        instance = _make_proxy_instance()
+        assert instance.proxy is not None
+        instance.global_object_id = "G1"
+        instance.cdp = MagicMock()
+        instance.cdp.is_connected = True
+        instance.cdp.send = AsyncMock(side_effect=ConnectionError("Connection closed"))
+        instance.proxy.send_cdp_command.return_value = {"result": {"value": 3}}
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        assert await ctx.call_function("function(a) { return a; }", 3) == 3
+        params = instance.proxy.send_cdp_command.await_args.args[2]
+        assert params["expression"] == "(function(a) { return a; })(3)"
+
+    async def test_proxy_fallback_inlines_json_arguments(self) -> None:
+        """Should evaluate a call expression when only the proxy is available."""
+        instance = _make_proxy_instance()
+        assert instance.proxy is not None
+        instance.proxy.send_cdp_command.return_value = {"result": {"value": "ok"}}
+        ctx = ToolContextImpl(instance, MagicMock())
+
+        assert await ctx.call_function("function(s) { return s; }", 'a"b') == "ok"
+        params = instance.proxy.send_cdp_command.await_args.args[2]
+        assert params["expression"] == '(function(s) { return s; })("a\\"b")'
+
+
+class TestPoolInit:
+    """Tests for background ChromePoolManager construction."""
+
+    async def test_concurrent_callers_share_one_pool(self) -> None:
+        """Should construct the pool once even when awaited concurrently."""
+        server = ChromeMCPServer()
+        pool = MagicMock()
+        with patch.object(ChromeMCPServer, "_create_pool", return_value=pool) as create:
+            results = await asyncio.gather(server._ensure_pool(), server._ensure_pool())
+
+        assert results == [pool, pool]
+        create.assert_called_once()
+
+    async def test_failed_init_is_retried(self) -> None:
+        """Should retry construction on the next call after a failure."""
+        server = ChromeMCPServer()
+        pool = MagicMock()
+        with patch.object(
+            ChromeMCPServer, "_create_pool", side_effect=[OSError("boom"), pool]
+        ) as create:
+            with pytest.raises(OSError):
+                await server._ensure_pool()
+            assert await server._ensure_pool() is pool
+
+        assert create.call_count == 2
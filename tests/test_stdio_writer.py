@@ -0,0 +1,59 @@
+"""Tests for the coalescing stdio writer."""
+
+from __future__ import annotations
+
+import io
+import json
+
+from wsl_chrome_mcp.stdio_writer import CoalescingStdout
+
+
+class _RecordingStream(io.BytesIO):
+    """BytesIO that records each write call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes: list[bytes] = []
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.writes.append(bytes(data))
+        return super().write(data)
+
+
+class TestCoalescingStdout:
+    """Tests for frame coalescing and ordering."""
+
+    async def test_frames_in_same_tick_share_one_write(self) -> None:
+        """Should merge frames flushed back-to-back into a single write."""
+        raw = _RecordingStream()
+        stdout = CoalescingStdout(raw)
+
+        for i in range(3):
+            await stdout.write(json.dumps({"id": i}) + "\n")
+            await stdout.flush()
+        await stdout.drain()
+
+        assert len(raw.writes) == 1
+        lines = raw.getvalue().decode().splitlines()
+        assert [json.loads(line)["id"] for line in lines] == [0, 1, 2]
+
+    async def test_large_buffer_applies_backpressure(self) -> None:
+        """Should write everything before returning once the buffer is full."""
+        raw = _RecordingStream()
+        stdout = CoalescingStdout(raw, max_buffer=8)
+
+        await stdout.write('{"id":1}\n')
+        await stdout.flush()
+
+        assert raw.getvalue() == b'{"id":1}\n'
+
+    async def test_unicode_frames_are_utf8(self) -> None:
+        """Should encode frames as UTF-8 like the default transport."""
+        raw = _RecordingStream()
+        stdout = CoalescingStdout(raw)
+
+        await stdout.write('{"text":"café"}\n')
+        await stdout.flush()
+        await stdout.drain()
+
+        assert raw.getvalue() == '{"text":"café"}\n'.encode()
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from wsl_chrome_mcp.chrome_pool import ConsoleMessage, NetworkRequest
+from wsl_chrome_mcp.persistent_cdp import CDP_COMMAND_TIMEOUT, CDPError
 from wsl_chrome_mcp.tools.base import (
     ToolCategory,
     ToolDefinition,
@@ -30,6 +31,7 @@ class MockToolContext:
         self._cdp_responses: dict[str, Any] = {}
         self._js_responses: dict[str, Any] = {}
         self._cdp_calls: list[tuple[str, Any]] = []
+        self._function_calls: list[tuple[str, tuple[Any, ...]]] = []
 
     @property
     def instance(self) -> MockChromeInstance:
@@ -56,6 +58,15 @@ class MockToolContext:
             return resp
         return {}
 
+    async def send_cdp_batch(
+        self, commands: list[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        return [await self.send_cdp(method, params) for method, params in commands]
+
+    async def call_function(self, declaration: str, *args: Any) -> Any:
+        self._function_calls.append((declaration, args))
+        return await self.evaluate_js(declaration)
+
     async def evaluate_js(self, expression: str) -> Any:
         for key, val in self._js_responses.items():
             if key in expression:
@@ -79,6 +90,12 @@ class MockChromeInstance:
     pending_dialog: Any = None
     trace_active: bool = False
     trace_events: list[dict[str, Any]] = field(default_factory=list)
+    initial_url: str | None = None
+    capture_dir: str | None = None
+
+    def take_console_messages(self) -> list[ConsoleMessage]:
+        messages, self.console_messages = self.console_messages, []
+        return messages
 
 
 # --- Tool Registry Tests ---
@@ -294,6 +311,55 @@ class TestNavigationTools:
         assert len(result) == 1
         assert "example.com" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_navigate_page_title_from_load_poll(self) -> None:
+        """Should take the title from the load poll without a separate evaluate."""
+        from wsl_chrome_mcp.tools.navigation import navigate_page
+
+        ctx = MockToolContext()
+        ctx.set_cdp_response("Page.navigate", {"frameId": "F1"})
+        ctx.set_js_response(
+            "readyState",
+            {"readyState": "complete", "title": "Fused", "url": "https://example.com/"},
+        )
+
+        result = await navigate_page.handler({"type": "url", "url": "https://example.com"}, ctx)
+
+        assert "Title: Fused" in result[0].text
+
+    @pytest.mark.asyncio
+    async def test_navigate_page_load_wait_survives_context_swap(self) -> None:
+        """Should retry the load wait when a redirect destroys the context."""
+        from wsl_chrome_mcp.tools.navigation import navigate_page
+
+        ctx = MockToolContext()
+        ctx.set_cdp_response("Page.navigate", {"frameId": "F1"})
+        ctx.evaluate_js = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[
+                RuntimeError("Execution context was destroyed."),
+                {"readyState": "complete", "title": "Landed", "url": "https://example.com/"},
+            ]
+        )
+
+        result = await navigate_page.handler({"type": "url", "url": "https://example.com"}, ctx)
+
+        assert "Title: Landed" in result[0].text
+        assert ctx.evaluate_js.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_navigate_page_load_wait_surfaces_other_errors(self) -> None:
+        """Should report a failed load wait instead of retrying until timeout."""
+        from wsl_chrome_mcp.tools.navigation import navigate_page
+
+        ctx = MockToolContext()
+        ctx.set_cdp_response("Page.navigate", {"frameId": "F1"})
+        ctx.evaluate_js = AsyncMock(side_effect=ConnectionError("Connection closed"))  # type: ignore[method-assign]
+
+        result = await navigate_page.handler({"type": "url", "url": "https://example.com"}, ctx)
+
+        assert result[0].text == "Navigation error: Connection closed"
+        assert ctx.evaluate_js.await_count == 1
+
     @pytest.mark.asyncio
     async def test_navigate_page_requires_url(self) -> None:
         """Should error when type=url but no URL provided."""
@@ -320,6 +386,29 @@ class TestNavigationTools:
         result = await list_pages.handler({}, ctx)
         assert "Tab 1" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_list_pages_format(self) -> None:
+        """Should render each tab as an entry line plus an id line."""
+        from wsl_chrome_mcp.tools.navigation import list_pages
+
+        ctx = MockToolContext()
+        ctx.pool.list_tabs = AsyncMock(
+            return_value=[
+                {"id": "T1", "title": "One", "url": "https://a.test/", "is_current": False},
+                {"id": "T2", "title": "Two", "url": "https://b.test/", "is_current": True},
+            ]
+        )
+
+        result = await list_pages.handler({}, ctx)
+
+        assert result[0].text == (
+            "Open pages (2):\n"
+            "  [0] One: https://a.test/\n"
+            "      id: T1\n"
+            "  [1] Two: https://b.test/ (selected)\n"
+            "      id: T2"
+        )
+
     @pytest.mark.asyncio
     async def test_resize_page(self) -> None:
         """Should send resize CDP command."""
@@ -331,6 +420,63 @@ class TestNavigationTools:
         result = await resize_page.handler({"width": 800, "height": 600}, ctx)
         assert "800x600" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_wait_for_uses_single_observer_evaluation(self) -> None:
+        """Should detect text with one in-page MutationObserver wait."""
+        from wsl_chrome_mcp.tools.snapshot import wait_for
+
+        ctx = MockToolContext()
+        ctx.set_js_response("MutationObserver", True)
+
+        result = await wait_for.handler({"text": 'Say "hi"', "timeout": 5000}, ctx)
+
+        assert "found" in result[0].text
+        assert len(ctx._function_calls) == 1
+        text, timeout_ms = ctx._function_calls[0][1]
+        assert text == 'Say "hi"'
+        assert 0 < timeout_ms <= 5000
+        assert timeout_ms < CDP_COMMAND_TIMEOUT * 1000
+
+    @pytest.mark.asyncio
+    async def test_wait_for_retries_after_navigation(self) -> None:
+        """Should re-arm the wait when the page context is destroyed."""
+        from wsl_chrome_mcp.tools.snapshot import wait_for
+
+        ctx = MockToolContext()
+        outcomes: list[Any] = [RuntimeError("Execution context was destroyed"), True]
+
+        async def call_function(declaration: str, *args: Any) -> Any:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        ctx.call_function = call_function  # type: ignore[method-assign]
+
+        result = await wait_for.handler({"text": "Done", "timeout": 5000}, ctx)
+        assert "found" in result[0].text
+        assert outcomes == []
+
+    @pytest.mark.asyncio
+    async def test_wait_for_raises_other_errors_and_stops_observer(self) -> None:
+        """Should stop the page-side wait and re-raise errors other than navigation."""
+        from wsl_chrome_mcp.tools.snapshot import _STOP_TEXT_WAITS_FN, wait_for
+
+        ctx = MockToolContext()
+        calls: list[str] = []
+
+        async def call_function(declaration: str, *args: Any) -> Any:
+            calls.append(declaration)
+            if len(calls) == 1:
+                raise TimeoutError("Timeout waiting for Runtime.callFunctionOn")
+            return None
+
+        ctx.call_function = call_function  # type: ignore[method-assign]
+
+        with pytest.raises(TimeoutError):
+            await wait_for.handler({"text": "Done", "timeout": 5000}, ctx)
+        assert calls[1] == _STOP_TEXT_WAITS_FN
+
 
 class TestInputTools:
     """Tests for input tool handlers."""
@@ -369,6 +515,91 @@ class TestInputTools:
         result = await click.handler({"uid": "1_0"}, ctx)
         assert "Successfully" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_click_wait_for_in_same_call(self) -> None:
+        """Should wait for the given text after clicking, in the same tool call."""
+        from wsl_chrome_mcp.tools.input import click
+
+        ctx = MockToolContext()
+        ctx.instance.snapshot_cache = {
+            "1_0": {"role": "button", "name": "Submit", "backendNodeId": 42, "node": {}}
+        }
+        ctx.set_cdp_response("DOM.resolveNode", {"object": {"objectId": "obj1"}})
+        ctx.set_cdp_response("Runtime.callFunctionOn", {"result": {"value": None}})
+        ctx.set_cdp_response(
+            "DOM.getBoxModel",
+            {"model": {"content": [10, 10, 50, 10, 50, 30, 10, 30]}},
+        )
+        ctx.set_cdp_response("Input.dispatchMouseEvent", {})
+        ctx.set_js_response("MutationObserver", True)
+
+        result = await click.handler({"uid": "1_0", "waitFor": "Saved", "timeout": 2000}, ctx)
+
+        assert "Successfully" in result[0].text
+        assert result[1].text == 'Element with text "Saved" found.'
+        assert len(ctx._function_calls) == 1
+        text, timeout_ms = ctx._function_calls[0][1]
+        assert text == "Saved"
+        assert 0 < timeout_ms <= 2000
+
+    @pytest.mark.asyncio
+    async def test_click_failure_skips_wait_for(self) -> None:
+        """Should not wait when the click itself failed."""
+        from wsl_chrome_mcp.tools.input import click
+
+        ctx = MockToolContext()
+
+        result = await click.handler({"uid": "9_9", "waitFor": "Saved"}, ctx)
+
+        assert len(result) == 1
+        assert ctx._function_calls == []
+
+    @pytest.mark.asyncio
+    async def test_fill_focuses_then_batches_clear_insert(self) -> None:
+        """Should focus first, then pipeline keyboard clear and insertText."""
+        from wsl_chrome_mcp.tools.input import fill_element
+
+        ctx = MockToolContext()
+        ctx.instance.snapshot_cache = {
+            "1_0": {"role": "textbox", "name": "Email", "backendNodeId": 7, "node": {}}
+        }
+        batches: list[list[str]] = []
+        send_batch = ctx.send_cdp_batch
+
+        async def record_batch(commands: list[tuple[str, Any]]) -> list[dict[str, Any]]:
+            batches.append([method for method, _ in commands])
+            return await send_batch(commands)
+
+        ctx.send_cdp_batch = record_batch  # type: ignore[method-assign]
+
+        success, _ = await fill_element(ctx, "1_0", "a@b.c")
+
+        assert success
+        assert ctx._cdp_calls[0] == ("DOM.focus", {"backendNodeId": 7})
+        assert batches == [["Input.dispatchKeyEvent"] * 4 + ["Input.insertText"]]
+        assert ctx._cdp_calls[-1] == ("Input.insertText", {"text": "a@b.c"})
+
+    @pytest.mark.asyncio
+    async def test_fill_stops_when_focus_fails(self) -> None:
+        """Should send no input events when the element cannot be focused."""
+        from wsl_chrome_mcp.tools.input import fill_element
+
+        ctx = MockToolContext()
+        ctx.instance.snapshot_cache = {
+            "1_0": {"role": "textbox", "name": "Email", "backendNodeId": 7, "node": {}}
+        }
+
+        def refuse_focus(params: dict[str, Any] | None) -> dict[str, Any]:
+            raise CDPError("Element is not focusable")
+
+        ctx.set_cdp_response("DOM.focus", refuse_focus)
+
+        success, message = await fill_element(ctx, "1_0", "a@b.c")
+
+        assert not success
+        assert "not focusable" in message
+        assert not [m for m, _ in ctx._cdp_calls if m.startswith("Input.")]
+
     @pytest.mark.asyncio
     async def test_click_uid_not_in_snapshot(self) -> None:
         """Should error when UID not found in snapshot."""
@@ -443,9 +674,24 @@ class TestMonitoringTools:
             ConsoleMessage(type="log", text="msg", timestamp=1.0),
         ]
 
-        await get_console.handler({"clear": True}, ctx)
+        result = await get_console.handler({"clear": True}, ctx)
+        assert "msg" in result[0].text
         assert len(ctx.instance.console_messages) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_console_clamps_negative_paging(self) -> None:
+        """Should treat negative offset and limit as zero instead of raising."""
+        from wsl_chrome_mcp.tools.monitoring import get_console, get_network
+
+        ctx = MockToolContext()
+        ctx.instance.console_messages = [ConsoleMessage(type="log", text="msg", timestamp=1.0)]
+
+        result = await get_console.handler({"offset": -5, "limit": 10}, ctx)
+        assert "[0] [LOG] msg" in result[0].text
+
+        result = await get_network.handler({"limit": -1}, ctx)
+        assert "No network requests" in result[0].text
+
     @pytest.mark.asyncio
     async def test_get_console_filter_types(self) -> None:
         """Should filter by message type."""
@@ -525,6 +771,93 @@ class TestScriptTools:
         # function mode calls evaluate_js("(() => document.title)()")
         assert result[0].text is not None
 
+    @pytest.mark.asyncio
+    async def test_evaluate_compact_by_default(self) -> None:
+        """Should return compact JSON unless pretty output is requested."""
+        from wsl_chrome_mcp.tools.script import evaluate
+
+        ctx = MockToolContext()
+        ctx.set_js_response("data", {"a": [1, 2]})
+
+        compact = await evaluate.handler({"expression": "data"}, ctx)
+        pretty = await evaluate.handler({"expression": "data", "pretty": True}, ctx)
+
+        assert compact[0].text == '{"a":[1,2]}'
+        assert pretty[0].text == '{\n  "a": [\n    1,\n    2\n  ]\n}'
+
+    @pytest.mark.asyncio
+    async def test_evaluate_formats_without_orjson(self) -> None:
+        """Should produce the same text with the stdlib encoder."""
+        from wsl_chrome_mcp.tools.script import evaluate
+
+        ctx = MockToolContext()
+        ctx.set_js_response("data", {"a": [1, 2]})
+
+        with patch("wsl_chrome_mcp.tools.script.orjson", None):
+            compact = await evaluate.handler({"expression": "data"}, ctx)
+            pretty = await evaluate.handler({"expression": "data", "pretty": True}, ctx)
+
+        assert compact[0].text == '{"a":[1,2]}'
+        assert pretty[0].text == '{\n  "a": [\n    1,\n    2\n  ]\n}'
+
+    @pytest.mark.asyncio
+    async def test_get_html_passes_selector_as_argument(self) -> None:
+        """Should hand the selector to a constant function, not splice it into JS."""
+        from wsl_chrome_mcp.tools.script import get_html
+
+        ctx = MockToolContext()
+        ctx.set_js_response("outerHTML", {"html": "<a>x</a>"})
+
+        result = await get_html.handler({"selector": "a[title='it''s']"}, ctx)
+
+        assert result[0].text == "<a>x</a>"
+        declaration, args = ctx._function_calls[0]
+        assert args == ("a[title='it''s']",)
+        assert "it''s" not in declaration
+
+    @pytest.mark.asyncio
+    async def test_get_html_page_fetches_root_only(self) -> None:
+        """Should ask for the document root alone, not the whole node tree."""
+        from wsl_chrome_mcp.tools.script import get_html
+
+        ctx = MockToolContext()
+        ctx.set_cdp_response("DOM.getDocument", {"root": {"nodeId": 1}})
+        ctx.set_cdp_response("DOM.getOuterHTML", {"outerHTML": "<html></html>"})
+
+        result = await get_html.handler({}, ctx)
+
+        assert result[0].text == "<html></html>"
+        assert ("DOM.getDocument", {"depth": 0}) in ctx._cdp_calls
+        assert ("DOM.getOuterHTML", {"nodeId": 1}) in ctx._cdp_calls
+
+    @pytest.mark.asyncio
+    async def test_scroll_reports_missing_element(self) -> None:
+        """Should surface a missing scroll container as an error."""
+        from wsl_chrome_mcp.tools.script import scroll
+
+        ctx = MockToolContext()
+        ctx.set_js_response("querySelector", "Element not found: #nope")
+
+        result = await scroll.handler({"direction": "up", "selector": "#nope"}, ctx)
+
+        assert result[0].text == "Error: Element not found: #nope"
+        assert ctx._function_calls[0][1] == ("#nope", "scrollBy", 0, -500)
+
+    @pytest.mark.asyncio
+    async def test_scroll_directions_map_to_window_calls(self) -> None:
+        """Should resolve each direction to a scrollBy step or scrollTo position."""
+        from wsl_chrome_mcp.tools.script import scroll
+
+        ctx = MockToolContext()
+        for direction in ("left", "bottom", "top"):
+            await scroll.handler({"direction": direction, "amount": 120}, ctx)
+
+        assert [call[1] for call in ctx._function_calls] == [
+            (None, "scrollBy", -120, 0),
+            (None, "scrollTo", 0, 2**53 - 1),
+            (None, "scrollTo", 0, 0),
+        ]
+
 
 class TestEmulationTools:
     """Tests for emulation tool handlers."""
@@ -621,6 +954,114 @@ class TestPerformanceTools:
         assert "CLS" in result[0].text
         assert "0.0700" in result[0].text
 
+    def test_analyze_trace_summary(self) -> None:
+        """Should collect key metrics and category counts from trace events."""
+        from wsl_chrome_mcp.tools.performance import _analyze_trace
+
+        lines = _analyze_trace(
+            [
+                {"name": "firstContentfulPaint", "cat": "loading", "ts": 100},
+                {"name": "largestContentfulPaint::Candidate", "cat": "loading", "ts": 150},
+                {"name": "largestContentfulPaint::Candidate", "cat": "loading", "ts": 200},
+                {"name": "LayoutShift", "cat": "layout"},
+                {"name": "LayoutShift", "cat": "layout"},
+                {"name": "Paint"},
+            ]
+        )
+
+        assert "  - FCP: 100" in lines
+        assert "  - LCP: 200" in lines
+        assert "  - CLS_events: 2" in lines
+        assert lines[-3:] == [
+            "  - loading: 3 events",
+            "  - layout: 2 events",
+            "  - unknown: 1 events",
+        ]
+
+
+class TestSessionTools:
+    """Tests for session tool handlers."""
+
+    @pytest.mark.asyncio
+    async def test_session_start_skips_navigation_to_opened_url(self) -> None:
+        """Should not navigate again when the new tab was opened at the URL."""
+        from wsl_chrome_mcp.tools.session import chrome_session_start
+
+        ctx = MockToolContext()
+        ctx.instance.initial_url = "https://example.com/"
+
+        await chrome_session_start.handler({"url": "https://example.com/"}, ctx)
+
+        assert ctx._cdp_calls == []
+        assert ctx.instance.initial_url is None
+
+    @pytest.mark.asyncio
+    async def test_session_start_navigates_existing_session(self) -> None:
+        """Should navigate when the session's tab was not opened at the URL."""
+        from wsl_chrome_mcp.tools.session import chrome_session_start
+
+        ctx = MockToolContext()
+
+        await chrome_session_start.handler({"url": "https://example.com/"}, ctx)
+
+        assert ("Page.navigate", {"url": "https://example.com/"}) in ctx._cdp_calls
+
+
+class TestScreenshotTools:
+    """Tests for screenshot and PDF tool handlers."""
+
+    @pytest.mark.asyncio
+    async def test_screenshot_forwards_cdp_base64(self) -> None:
+        """Should pass CDP's base64 payload through without re-encoding."""
+        from wsl_chrome_mcp.tools.screenshot import take_screenshot
+
+        ctx = MockToolContext()
+        ctx.set_cdp_response("Page.captureScreenshot", {"data": "iVBORw0KGgo="})
+
+        result = await take_screenshot.handler({}, ctx)
+        assert result[0].data == "iVBORw0KGgo="
+        assert result[0].mimeType == "image/png"
+
+    @pytest.mark.asyncio
+    async def test_large_screenshot_goes_to_temp_file(self) -> None:
+        """Should write oversized captures to disk instead of inlining them."""
+        import base64
+        import os
+        import shutil
+
+        from wsl_chrome_mcp.tools import screenshot
+
+        payload = b"\x89PNG" + b"\x00" * 64
+        ctx = MockToolContext()
+        ctx.set_cdp_response("Page.captureScreenshot", {"data": base64.b64encode(payload).decode()})
+
+        with patch.object(screenshot, "INLINE_IMAGE_MAX_BYTES", 32):
+            result = await screenshot.take_screenshot.handler({"fullPage": False}, ctx)
+
+        text = result[0].text
+        assert "too large to return inline" in text
+        path = text.rsplit("Saved to ", 1)[1]
+        capture_dir = ctx.instance.capture_dir
+        try:
+            assert capture_dir and os.path.dirname(path) == capture_dir
+            with open(path, "rb") as f:
+                assert f.read() == payload
+        finally:
+            shutil.rmtree(capture_dir or os.path.dirname(path), ignore_errors=True)
+
+    @pytest.mark.asyncio
+    async def test_pdf_saved_as_decoded_bytes(self, tmp_path: Any) -> None:
+        """Should decode the PDF payload when writing it to disk."""
+        from wsl_chrome_mcp.tools.screenshot import generate_pdf
+
+        ctx = MockToolContext()
+        ctx.set_cdp_response("Page.printToPDF", {"data": "JVBERi0xLjQ="})
+        out = tmp_path / "page.pdf"
+
+        result = await generate_pdf.handler({"filePath": str(out)}, ctx)
+        assert "PDF saved" in result[0].text
+        assert out.read_bytes() == b"%PDF-1.4"
+
 
 class TestNewInputTools:
     """Tests for the new input tools (drag, fill_form, upload_file, click_at)."""
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import os
-from unittest.mock import mock_open, patch
+from unittest.mock import MagicMock, mock_open, patch
 
 from wsl_chrome_mcp.wsl import (
+    _find_windows_executable,
     convert_windows_to_wsl_path,
     convert_wsl_to_windows_path,
+    find_windows_chrome,
     get_windows_chrome_paths,
     get_windows_host_ip,
     is_wsl,
@@ -89,6 +91,42 @@ nameserver 172.25.160.1
         get_windows_host_ip.cache_clear()
 
 
+class TestFindWindowsExecutable:
+    """Tests for _find_windows_executable() caching."""
+
+    def test_lookups_for_different_names_stay_cached(self) -> None:
+        """Should not evict one executable's path when another is looked up."""
+        _find_windows_executable.cache_clear()
+        which = MagicMock(
+            side_effect=lambda args, **_: MagicMock(returncode=0, stdout=f"/mnt/c/{args[1]}\n")
+        )
+        with patch("wsl_chrome_mcp.wsl.subprocess.run", which):
+            for _ in range(2):
+                assert _find_windows_executable("powershell.exe") == "/mnt/c/powershell.exe"
+                assert _find_windows_executable("cmd.exe") == "/mnt/c/cmd.exe"
+
+        assert which.call_count == 2
+        _find_windows_executable.cache_clear()
+
+
+class TestFindWindowsChrome:
+    """Tests for find_windows_chrome() caching."""
+
+    def test_lookup_runs_powershell_once(self) -> None:
+        """Should reuse the located chrome.exe path on later calls."""
+        find_windows_chrome.cache_clear()
+        result = MagicMock(returncode=0, stdout="C:\\Chrome\\chrome.exe\n")
+        with (
+            patch("wsl_chrome_mcp.wsl.is_wsl", return_value=True),
+            patch("wsl_chrome_mcp.wsl.run_windows_command", return_value=result) as run,
+        ):
+            assert find_windows_chrome() == "C:\\Chrome\\chrome.exe"
+            assert find_windows_chrome() == "C:\\Chrome\\chrome.exe"
+
+        run.assert_called_once()
+        find_windows_chrome.cache_clear()
+
+
 class TestPathConversion:
     """Tests for path conversion functions."""
 